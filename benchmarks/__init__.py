@@ -0,0 +1,5 @@
+"""
+Benchmarks of pyi18n: synthetic catalog generator and suite measuring
+lookup throughput, load time, memory and normalize task runtime.
+Run with python -m benchmarks from repository root.
+"""
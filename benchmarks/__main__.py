@@ -0,0 +1,56 @@
+"""
+Benchmarks command-line interface
+
+Examples:
+$ python -m benchmarks --locales 10 --keys 5000 --depth 4 -o results.json
+Generates 10 YAML locales with 5000 keys each, runs benchmarks
+and writes results as JSON.
+
+$ python -m benchmarks --format json --namespaced
+Runs benchmarks on namespaced JSON catalog, prints results.
+"""
+from argparse import ArgumentParser
+import json
+import sys
+
+from benchmarks.generator import FORMATS
+from benchmarks.suite import run_suite
+
+
+def cli() -> None:
+    """ A command-line interface function """
+    parser = ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("--locales", help="Number of locales",
+                        default=5, type=int)
+    parser.add_argument("--keys", help="Number of keys per locale",
+                        default=1000, type=int)
+    parser.add_argument("--depth", help="Nesting depth of keys",
+                        default=3, type=int)
+    parser.add_argument("-f", "--format", help="Locale files format",
+                        choices=tuple(FORMATS), default="yaml")
+    parser.add_argument("--namespaced", help="Namespaced locales",
+                        action="store_true")
+    parser.add_argument("-n", "--number", help="gettext calls per "
+                        "measurement", default=10000, type=int)
+    parser.add_argument("--no-isolate", help="Measure loaders in this "
+                        "process, peak RSS is not meaningful then",
+                        action="store_true")
+    parser.add_argument("-o", "--output", help="Output JSON file, "
+                        "defaults to stdout", default=None, type=str)
+
+    args = parser.parse_args()
+    results: dict = run_suite(args.locales, args.keys, args.depth,
+                              args.format, args.namespaced, args.number,
+                              not args.no_isolate)
+
+    if args.output is None:
+        json.dump(results, sys.stdout, indent=2, sort_keys=True)
+        sys.stdout.write("\n")
+        return
+
+    with open(args.output, "w", encoding="utf-8") as _f:
+        json.dump(results, _f, indent=2, sort_keys=True)
+
+
+if __name__ == "__main__":
+    cli()
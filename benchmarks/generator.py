@@ -0,0 +1,126 @@
+"""
+This module generates synthetic locale catalogs used by benchmarks:
+N locales x M keys nested D levels deep, flat or namespaced,
+written as YAML or JSON files.
+"""
+from math import ceil
+from os import makedirs
+from os.path import join
+from typing import Tuple
+import json
+import yaml
+
+FORMATS: dict = {"yaml": "yml", "json": "json"}
+
+
+def key_paths(keys: int, depth: int) -> Tuple[str, ...]:
+    """Build dot-separated paths of leaf keys spread evenly
+        over depth - 1 levels of groups
+
+    Args:
+        keys (int): number of leaf keys
+        depth (int): nesting depth, 1 means no groups
+
+    Return:
+        Tuple[str, ...]: leaf paths
+    """
+    levels: int = max(depth, 1) - 1
+    branches: int = max(2, ceil(keys ** (1 / (levels + 1)))) if levels else 1
+
+    paths: list = []
+    for index in range(keys):
+        groups: list = [
+            f"group_{(index // branches ** (levels - level)) % branches}"
+            for level in range(levels)
+        ]
+        paths.append(".".join((*groups, f"key_{index}")))
+
+    return tuple(paths)
+
+
+def build_content(paths: Tuple[str, ...], locale: str) -> dict:
+    """Build nested translations for paths, every fifth
+        translation has interpolation placeholders
+
+    Args:
+        paths (Tuple[str, ...]): leaf paths
+        locale (str): locale used in translation text
+
+    Return:
+        dict: nested translations
+    """
+    content: dict = {}
+    for index, path in enumerate(paths):
+        *parents, leaf = path.split(".")
+        node: dict = content
+        for parent in parents:
+            node = node.setdefault(parent, {})
+
+        node[leaf] = f"{locale} hello {{name}}, you have {{total}} messages" \
+            if not index % 5 else f"{locale} translation number {index}"
+
+    return content
+
+
+def generate_catalog(
+    path: str,
+    locales: int = 5,
+    keys: int = 1000,
+    depth: int = 3,
+    fmt: str = "yaml",
+    namespaced: bool = False
+) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Write synthetic locales directory
+
+    Namespaced catalogs use top level groups as namespace files,
+    so depth has to be at least 2 for them.
+
+    Args:
+        path (str): directory to write locales to, created if missing
+        locales (int): number of locales
+        keys (int): number of leaf keys per locale
+        depth (int): nesting depth of keys
+        fmt (str): "yaml" or "json"
+        namespaced (bool): write directory per locale with file
+                            per namespace instead of file per locale
+
+    Return:
+        Tuple[Tuple[str, ...], Tuple[str, ...]]: locale names and leaf
+                                                    paths of every locale
+
+    Raises:
+        ValueError: if format is unknown or namespaced depth is below 2
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"unknown format {fmt}, use yaml or json")
+
+    if namespaced and depth < 2:
+        raise ValueError("namespaced catalogs need depth of at least 2")
+
+    names: Tuple[str, ...] = tuple(f"l{index:03d}" for index in range(locales))
+    paths: Tuple[str, ...] = key_paths(keys, depth)
+    makedirs(path, exist_ok=True)
+
+    for locale in names:
+        content: dict = build_content(paths, locale)
+        if not namespaced:
+            _dump({locale: content}, join(path, f"{locale}.{FORMATS[fmt]}"),
+                  fmt)
+            continue
+
+        makedirs(join(path, locale), exist_ok=True)
+        for namespace, body in content.items():
+            _dump(body, join(path, locale, f"{namespace}.{FORMATS[fmt]}"),
+                  fmt)
+
+    return names, paths
+
+
+def _dump(content: dict, file_path: str, fmt: str) -> None:
+    """write single file, should not be called directly"""
+    with open(file_path, "w", encoding="utf-8") as _f:
+        if fmt == "json":
+            json.dump(content, _f, ensure_ascii=False)
+        else:
+            yaml.dump(content, _f, allow_unicode=True, sort_keys=False,
+                      Dumper=getattr(yaml, "CDumper", yaml.Dumper))
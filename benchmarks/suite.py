@@ -0,0 +1,272 @@
+"""
+This module runs benchmarks on generated catalog: gettext throughput
+(hit, miss, interpolation) per lookup mode, cold and warm load time and
+peak memory per loader and normalize task runtime.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from multiprocessing import get_context
+from os.path import join, relpath
+from shutil import copytree
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Callable, Optional
+import platform
+import tracemalloc
+
+from pyi18n import PyI18n
+from pyi18n.compiled import write_catalog
+from pyi18n.loaders import (
+    PyI18nCompiledLoader, PyI18nJsonLoader, PyI18nMmapLoader,
+    PyI18nYamlLoader, available_parsers)
+from pyi18n.mmapped import write_mmap_catalog
+from pyi18n.tasks.normalize import normalize_locales
+
+from benchmarks.generator import generate_catalog
+
+try:
+    from resource import RUSAGE_SELF, getrusage
+except ImportError:  # pragma: no cover
+    getrusage = None
+
+# gettext lookup modes: PyI18n options
+MODES: dict = {
+    "nested": {},
+    "flat_index": {"flat_index": True},
+    "frozen": {"frozen": True},
+}
+
+
+def create_loader(name: str, path: str, fmt: str, namespaced: bool,
+                  cache_dir: Optional[str] = None):
+    """Create loader benchmarked under given name
+
+    Args:
+        name (str): "default", "threads", "cache", "compiled" or "mmap"
+        path (str): locales directory, or catalog file for
+                    "compiled" and "mmap"
+        fmt (str): "yaml" or "json"
+        namespaced (bool): namespaced locales directory
+        cache_dir (Optional[str]): parse cache directory for "cache"
+
+    Return:
+        PyI18nBaseLoader: loader
+    """
+    if name == "compiled":
+        return PyI18nCompiledLoader(path, on_stale="ignore")
+    if name == "mmap":
+        return PyI18nMmapLoader(path, on_stale="ignore")
+
+    loader_class: type = PyI18nYamlLoader if fmt == "yaml" \
+        else PyI18nJsonLoader
+    options: dict = {
+        "threads": {"max_workers": 4},
+        "cache": {"cache_dir": cache_dir},
+    }.get(name, {})
+
+    return loader_class(f"{path}/", namespaced=namespaced, **options)
+
+
+def throughput(func: Callable, number: int) -> float:
+    """Measure calls per second, best of three runs
+
+    Args:
+        func (Callable): function without arguments
+        number (int): calls per run
+
+    Return:
+        float: calls per second
+    """
+    best: float = float("inf")
+    for _ in range(3):
+        start: float = perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, perf_counter() - start)
+
+    return number / best if best else float("inf")
+
+
+def bench_gettext(i18n: PyI18n, locale: str, paths: tuple,
+                  number: int) -> dict:
+    """Measure gettext throughput for hit, miss, interpolated hit
+        and the same interpolated hit with plural count
+
+    Args:
+        i18n (PyI18n): initialized instance
+        locale (str): locale to look up
+        paths (tuple): existing leaf paths
+        number (int): lookups per run
+
+    Return:
+        dict: lookups per second for "hit", "miss", "kwargs"
+                and "plural"
+    """
+    gettext: Callable = i18n.gettext
+    plain: str = paths[1 % len(paths)]
+    interpolated: str = paths[0]
+    missing: str = f"{plain}_missing"
+
+    return {
+        "hit": throughput(lambda: gettext(locale, plain), number),
+        "miss": throughput(lambda: gettext(locale, missing), number),
+        "kwargs": throughput(
+            lambda: gettext(locale, interpolated, name="Ann", total=3),
+            number),
+        # count selects plural category and probes its subkeys
+        "plural": throughput(
+            lambda: gettext(locale, interpolated, name="Ann", total=3,
+                            count=3),
+            number),
+    }
+
+
+def measure_load(name: str, path: str, fmt: str, namespaced: bool,
+                 locales: tuple, cache_dir: Optional[str] = None,
+                 options: Optional[dict] = None) -> dict:
+    """Load catalog three times and measure it, runs in fresh process
+        when called through ProcessPoolExecutor, so cold load
+        includes first import of parser backends
+
+    Args:
+        name (str): loader name, see create_loader
+        path (str): locales directory or catalog file
+        fmt (str): "yaml" or "json"
+        namespaced (bool): namespaced locales directory
+        locales (tuple): locales to load
+        cache_dir (Optional[str]): parse cache directory
+        options (Optional[dict]): PyI18n options
+
+    Return:
+        dict: "cold" and "warm" load seconds, "tracemalloc_peak" bytes
+                allocated by single load and "peak_rss_kb" of process
+    """
+    options = options or {}
+
+    def load() -> float:
+        start: float = perf_counter()
+        PyI18n(locales, loader=create_loader(name, path, fmt, namespaced,
+                                             cache_dir), **options)
+        return perf_counter() - start
+
+    cold: float = load()
+    warm: float = load()
+
+    # tracing slows allocations down, measured on separate load
+    tracemalloc.start()
+    load()
+    peak: int = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {
+        "cold": cold,
+        "warm": warm,
+        "tracemalloc_peak": peak,
+        # kilobytes on linux, bytes on macOS
+        "peak_rss_kb": getrusage(RUSAGE_SELF).ru_maxrss
+        if getrusage is not None else None,
+    }
+
+
+def run_suite(
+    locales: int = 5,
+    keys: int = 1000,
+    depth: int = 3,
+    fmt: str = "yaml",
+    namespaced: bool = False,
+    number: int = 10000,
+    isolate: bool = True
+) -> dict:
+    """Generate catalog in temporary directory and run all benchmarks
+
+    Args:
+        locales (int): number of locales
+        keys (int): number of leaf keys per locale
+        depth (int): nesting depth of keys
+        fmt (str): "yaml" or "json"
+        namespaced (bool): namespaced locales directory
+        number (int): gettext calls per measurement
+        isolate (bool): measure every loader in fresh process, peak RSS
+                        is meaningful only then
+
+    Return:
+        dict: benchmark results, JSON serializable
+    """
+    with TemporaryDirectory(prefix="pyi18n-bench-") as workdir:
+        source: str = join(workdir, "locales")
+        names, paths = generate_catalog(source, locales, keys, depth, fmt,
+                                        namespaced)
+
+        catalogs: dict = {
+            "compiled": join(workdir, "locales.i18nc"),
+            "mmap": join(workdir, "locales.i18nm"),
+        }
+        write_catalog(catalogs["compiled"], source)
+        write_mmap_catalog(catalogs["mmap"], source)
+
+        load: dict = {}
+        for name in ("default", "threads", "cache", "compiled", "mmap"):
+            args: tuple = (name, catalogs.get(name, source), fmt, namespaced,
+                           names, join(workdir, "cache"))
+            load[name] = _isolated(measure_load, args) if isolate \
+                else measure_load(*args)
+
+        memory: dict = {}
+        for mode, options in MODES.items():
+            args: tuple = (
+                "default", source, fmt, namespaced, names, None, options)
+            memory[mode] = _isolated(measure_load, args) if isolate \
+                else measure_load(*args)
+
+        gettext: dict = {}
+        for mode, options in MODES.items():
+            i18n: PyI18n = PyI18n(
+                names, loader=create_loader("default", source, fmt,
+                                            namespaced), **options)
+            gettext[mode] = bench_gettext(i18n, names[0], paths, number)
+
+        i18n: PyI18n = PyI18n(names, loader=create_loader(
+            "mmap", catalogs["mmap"], fmt, namespaced))
+        gettext["mmap"] = bench_gettext(i18n, names[0], paths, number)
+
+        normalized: str = join(workdir, "normalized")
+        copytree(source, normalized)
+        start: float = perf_counter()
+        normalize_locales(f"{relpath(normalized)}/")
+        normalize: dict = {"seconds": perf_counter() - start}
+
+        # files are normalized one at a time, peak is bounded by largest
+        tracemalloc.start()
+        normalize_locales(f"{relpath(normalized)}/", check=True,
+                          max_workers=1)
+        normalize["tracemalloc_peak"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "parsers": {
+                "yaml": available_parsers("yaml"),
+                "json": available_parsers("json"),
+            },
+            "options": {
+                "locales": locales, "keys": keys, "depth": depth,
+                "format": fmt, "namespaced": namespaced, "number": number,
+            },
+        },
+        "gettext": gettext,
+        "load": load,
+        "memory": memory,
+        "normalize": normalize,
+    }
+
+
+def _isolated(func: Callable, args: tuple) -> dict:
+    """run function in fresh spawned process, should not be called
+        directly"""
+    with ProcessPoolExecutor(max_workers=1,
+                             mp_context=get_context("spawn")) as executor:
+        return executor.submit(func, *args).result()
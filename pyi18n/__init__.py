@@ -1,3 +1,3 @@
 # flake8: noqa
-from .pyi18n import PyI18n
+from .pyi18n import PyI18n, PyI18nKeySet, PyI18nTranslator
 from . import loaders
@@ -0,0 +1,170 @@
+"""
+This module implements persistent parse cache, a __pycache__ for locale
+files. Parsed content of every source file is stored in cache directory
+with size, mtime and hash of the source, so unchanged files are not
+parsed again on next startup. Entries are written atomically and can be
+shared by processes using the same cache directory, only marshal is used
+to read them, so entries can't run code when loaded.
+"""
+from hashlib import sha256
+from logging import warning
+from os import getpid, makedirs, remove, replace, stat
+from os.path import abspath, join
+from threading import get_ident
+from typing import Any, BinaryIO, Callable, Optional, Tuple
+import marshal
+
+from pyi18n.parsers import get_parser
+
+CACHE_MAGIC: bytes = b"PYI18NP\x02"
+
+# errors raised by truncated or foreign cache entries
+ENTRY_ERRORS: tuple = (EOFError, ValueError, TypeError)
+
+
+def cache_path(cache_dir: str, file_path: str) -> str:
+    """Return path of cache entry for source file
+
+    Args:
+        cache_dir (str): cache directory
+        file_path (str): path to source file
+
+    Return:
+        str: path to cache entry
+    """
+    key: str = sha256(abspath(file_path).encode()).hexdigest()[:32]
+    return join(cache_dir, f"{key}.cache")
+
+
+def read_entry(entry_path: str) -> Optional[Tuple[tuple, Any]]:
+    """Read cache entry
+
+    Args:
+        entry_path (str): path to cache entry
+
+    Return:
+        Optional[Tuple[tuple, Any]]: header (source path, size, mtime_ns,
+                                    sha256 digest) and parsed content,
+                                    None if entry can't be read or is
+                                    corrupted
+    """
+    try:
+        with open(entry_path, "rb") as _f:
+            if _f.read(len(CACHE_MAGIC)) != CACHE_MAGIC:
+                return None
+
+            header: tuple = tuple(marshal.load(_f))
+            content: Any = marshal.load(_f)
+    except (OSError, *ENTRY_ERRORS):
+        return None
+
+    return header, content
+
+
+def write_entry(entry_path: str, header: tuple, content: Any) -> None:
+    """Write cache entry atomically through temporary file,
+        content is stored with marshal
+
+    Args:
+        entry_path (str): path to cache entry
+        header (tuple): source path, size, mtime_ns and sha256 digest
+        content (Any): parsed content
+
+    Return:
+        None
+
+    Raises:
+        ValueError: if content has values marshal can't store
+                    (e.g. yaml timestamps), nothing is written then
+    """
+    payload: bytes = marshal.dumps(content)
+
+    def write(_f: BinaryIO) -> None:
+        _f.write(CACHE_MAGIC)
+        marshal.dump(header, _f)
+        _f.write(payload)
+
+    write_atomic(entry_path, write)
+
+
+def write_atomic(file_path: str, write: Callable[[BinaryIO], Any]) -> None:
+    """Write file through temporary file next to it, which replaces
+        the file when it's complete. Temporary file is unique per
+        writer, so processes and threads may write the same file
+        at once, and it's removed when writing fails.
+
+    Args:
+        file_path (str): path to the file
+        write (Callable[[BinaryIO], Any]): writes content to file
+                                            opened in binary mode
+
+    Return:
+        None
+    """
+    tmp_path: str = f"{file_path}.{getpid()}.{get_ident()}.tmp"
+    try:
+        with open(tmp_path, "wb") as _f:
+            write(_f)
+        replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def parse_cached(
+    file_path: str,
+    fmt: str,
+    cache_dir: str,
+    parser: Optional[str] = None
+) -> Any:
+    """Parse file with parser backend, through cache directory
+
+    Size and mtime are checked first, hash is computed only
+    when they differ, so touched but unchanged files are still
+    served from cache. Cache write errors are logged, parsed
+    content is returned anyway. Content marshal can't store
+    (e.g. yaml timestamps) isn't cached.
+
+    Args:
+        file_path (str): path to source file
+        fmt (str): serialization format ("yaml", "json")
+        cache_dir (str): cache directory, created if missing
+        parser (Optional[str]): backend name to pin
+
+    Return:
+        Any: parsed content
+    """
+    source: str = abspath(file_path)
+    stats = stat(file_path)
+    entry_path: str = cache_path(cache_dir, file_path)
+    entry: Optional[tuple] = read_entry(entry_path)
+
+    if entry is not None and entry[0][:3] == \
+            (source, stats.st_size, stats.st_mtime_ns):
+        return entry[1]
+
+    with open(file_path, "rb") as _f:
+        data: bytes = _f.read()
+
+    digest: str = sha256(data).hexdigest()
+    header: tuple = (source, stats.st_size, stats.st_mtime_ns, digest)
+
+    if entry is not None and entry[0][0] == source \
+            and entry[0][3] == digest:
+        content: Any = entry[1]
+    else:
+        content: Any = get_parser(fmt, parser).loads(data)
+
+    try:
+        makedirs(cache_dir, exist_ok=True)
+        write_entry(entry_path, header, content)
+    except ValueError:
+        # not cached, such files are parsed on every startup
+        pass
+    except OSError as err:
+        warning(f"can't write parse cache entry for {file_path}: {err}")
+
+    return content
@@ -0,0 +1,86 @@
+"""
+This module implements compaction of loaded catalogs. Keys are interned
+and equal string values are replaced with a single shared object, so
+fallback copies and common labels repeated across locales and
+namespaces are stored once.
+"""
+from sys import getsizeof, intern
+from typing import Any, Optional
+
+
+def compact_catalog(content: dict, pool: Optional[dict] = None) -> int:
+    """Intern keys and deduplicate string values in place
+
+    Args:
+        content (dict): translations, nested dicts and lists are walked
+        pool (Optional[dict]): canonical string values, pass the same
+                                pool to deduplicate across calls
+
+    Return:
+        int: bytes of duplicate strings released
+    """
+    pool = {} if pool is None else pool
+    released: set = set()
+    visited: set = set()
+    saved: int = 0
+
+    stack: list = [content]
+    while stack:
+        node: Any = stack.pop()
+        if id(node) in visited:
+            continue
+        visited.add(id(node))
+
+        if isinstance(node, dict):
+            saved += _compact_dict(node, pool, released, stack)
+        else:
+            saved += _compact_list(node, pool, released, stack)
+
+    return saved
+
+
+def _compact_dict(node: dict, pool: dict, released: set, stack: list) -> int:
+    """compact keys and values of single dict, nested containers are
+        pushed to stack, should not be called directly"""
+    saved: int = 0
+    items: list = list(node.items())
+    node.clear()
+    for key, value in items:
+        if isinstance(key, str):
+            shared: str = intern(key)
+            saved += _released(key, shared, released)
+            key = shared
+        if isinstance(value, str):
+            shared: str = pool.setdefault(value, value)
+            saved += _released(value, shared, released)
+            value = shared
+        elif isinstance(value, (dict, list)):
+            stack.append(value)
+        node[key] = value
+
+    return saved
+
+
+def _compact_list(node: list, pool: dict, released: set, stack: list) -> int:
+    """compact values of single list, nested containers are
+        pushed to stack, should not be called directly"""
+    saved: int = 0
+    for index, value in enumerate(node):
+        if isinstance(value, str):
+            shared: str = pool.setdefault(value, value)
+            saved += _released(value, shared, released)
+            node[index] = shared
+        elif isinstance(value, (dict, list)):
+            stack.append(value)
+
+    return saved
+
+
+def _released(value: str, shared: str, released: set) -> int:
+    """size of value replaced with shared one, each object is
+        counted once, should not be called directly"""
+    if shared is value or id(value) in released:
+        return 0
+
+    released.add(id(value))
+    return getsizeof(value)
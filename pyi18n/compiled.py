@@ -0,0 +1,247 @@
+"""
+This module implements compiled catalogs, a whole locales directory
+(flat or namespaced) stored as a single marshal file. The header records
+size, mtime and hash of every source file, so stale catalogs can be
+detected without parsing the sources.
+"""
+from hashlib import sha256
+from importlib import import_module
+from os import listdir, stat
+from os.path import abspath, exists, isdir, join, splitext
+from typing import BinaryIO, Dict, List, Optional, Tuple
+import marshal
+import json
+import yaml
+
+from pyi18n.cache import write_atomic
+from pyi18n.helpers import load_locale
+from pyi18n.parsers import parse_file
+
+CATALOG_MAGIC: bytes = b"PYI18NC\x01"
+CATALOG_VERSION: int = 1
+
+EXTENSIONS: Dict[str, str] = {
+    "yml": "yaml",
+    "yaml": "yaml",
+    "json": "json",
+}
+
+
+def file_fingerprint(file_path: str) -> Tuple[int, int, str]:
+    """Return fingerprint of source file
+
+    Args:
+        file_path (str): path to the file
+
+    Return:
+        Tuple[int, int, str]: size, mtime in ns and sha256 hex digest
+    """
+    stats = stat(file_path)
+    with open(file_path, "rb") as _f:
+        digest: str = sha256(_f.read()).hexdigest()
+
+    return stats.st_size, stats.st_mtime_ns, digest
+
+
+def scan_sources(
+    source_path: str,
+    fmt: Optional[str] = None
+) -> Tuple[Optional[str], bool, List[str]]:
+    """Find translation files in locales directory, files of other
+        formats and unknown files (e.g. README, .gitkeep) are ignored.
+        Directory is namespaced when it has subdirectories
+        and no locale files of its own.
+
+    Args:
+        source_path (str): path to locales directory
+        fmt (Optional[str]): format of locale files ("yaml", "json"),
+                                detected when directory has files
+                                of single format only
+
+    Return:
+        Tuple[Optional[str], bool, List[str]]: format (None if no known
+            files found), namespaced flag and sorted paths of source
+            files relative to source_path
+
+    Raises:
+        ValueError: if format is unknown or isn't given
+                    and directory has files of several formats
+    """
+    if fmt is not None and fmt not in EXTENSIONS.values():
+        raise ValueError(f"unknown locale format {fmt}, use "
+                         f"{', '.join(sorted(set(EXTENSIONS.values())))}")
+
+    entries: List[str] = sorted(listdir(source_path))
+    files: List[str] = [
+        name for name in entries
+        if splitext(name)[1][1:] in EXTENSIONS
+        and not isdir(join(source_path, name))
+    ]
+    locales: List[str] = [
+        entry for entry in entries if isdir(join(source_path, entry))
+    ]
+    namespaced: bool = not files and bool(locales)
+
+    if namespaced:
+        files = [
+            f"{locale}/{name}" for locale in locales
+            for name in sorted(listdir(join(source_path, locale)))
+            if splitext(name)[1][1:] in EXTENSIONS
+        ]
+
+    if fmt is None:
+        formats: set = {EXTENSIONS[splitext(name)[1][1:]] for name in files}
+        if len(formats) > 1:
+            raise ValueError(f"{source_path} has {' and '.join(sorted(formats))}"
+                             " locale files, pass format to compile")
+        fmt = formats.pop() if formats else None
+
+    return fmt, namespaced, [name for name in files
+                             if EXTENSIONS[splitext(name)[1][1:]] == fmt]
+
+
+def build_catalog(
+    source_path: str,
+    fmt: Optional[str] = None
+) -> Tuple[dict, dict]:
+    """Load every locale in directory into catalog
+
+    Corrupted locale files are skipped, same as in built-in loaders.
+
+    Args:
+        source_path (str): path to locales directory
+        fmt (Optional[str]): format of locale files, see scan_sources
+
+    Return:
+        Tuple[dict, dict]: catalog header and translations
+
+    Raises:
+        ValueError: if directory has no locale files of the format
+                    or format isn't given and can't be detected
+    """
+    fmt, namespaced, files = scan_sources(source_path, fmt)
+
+    if fmt is None or not files:
+        raise ValueError(f"no locale files found in {source_path}")
+
+    translations: dict = {}
+    if namespaced:
+        ser_mod = import_module(fmt)
+        for locale in sorted({name.split("/")[0] for name in files}):
+            loaded: dict = load_locale(join(source_path, locale), ser_mod, fmt)
+            if loaded:
+                translations[locale] = loaded
+    else:
+        for name in files:
+            locale: str = splitext(name)[0]
+            try:
+                translations[locale] = parse_file(
+                    join(source_path, name), fmt)[locale]
+            except (json.decoder.JSONDecodeError, yaml.YAMLError):
+                continue
+
+    header: dict = {
+        "version": CATALOG_VERSION,
+        "format": fmt,
+        "namespaced": namespaced,
+        "source_path": abspath(source_path),
+        "sources": {
+            name: file_fingerprint(join(source_path, name)) for name in files
+        },
+    }
+    return header, translations
+
+
+def write_catalog(
+    catalog_path: str,
+    source_path: str,
+    fmt: Optional[str] = None
+) -> dict:
+    """Compile locales directory into catalog file,
+        written atomically through temporary file
+
+    Args:
+        catalog_path (str): path to output catalog file
+        source_path (str): path to locales directory
+        fmt (Optional[str]): format of locale files, see scan_sources
+
+    Return:
+        dict: catalog header
+    """
+    header, translations = build_catalog(source_path, fmt)
+
+    def write(_f: BinaryIO) -> None:
+        _f.write(CATALOG_MAGIC)
+        marshal.dump(header, _f)
+        marshal.dump(translations, _f)
+
+    # workers may recompile the same catalog at once
+    write_atomic(catalog_path, write)
+
+    return header
+
+
+def read_catalog(catalog_path: str, header_only: bool = False) -> tuple:
+    """Read catalog file
+
+    Args:
+        catalog_path (str): path to catalog file
+        header_only (bool): skip reading translations
+
+    Return:
+        tuple: header and translations (None when header_only)
+
+    Raises:
+        ValueError: if file isn't compatible compiled catalog
+    """
+    with open(catalog_path, "rb") as _f:
+        if _f.read(len(CATALOG_MAGIC)) != CATALOG_MAGIC:
+            raise ValueError(f"{catalog_path} is not a compiled catalog")
+
+        header: dict = marshal.load(_f)
+        if header.get("version") != CATALOG_VERSION:
+            raise ValueError(f"{catalog_path} catalog version "
+                             f"{header.get('version')} is not supported")
+
+        if header_only:
+            return header, None
+
+        return header, marshal.load(_f)
+
+
+def stale_sources(header: dict, source_path: Optional[str] = None) -> List[str]:
+    """Compare catalog header with source files
+
+    Size and mtime are checked first, hash is computed only
+    when they differ, so touched but unchanged files are fresh.
+
+    Args:
+        header (dict): catalog header
+        source_path (Optional[str]): locales directory,
+                                    defaults to one recorded in header
+
+    Return:
+        List[str]: changed, added or removed source files,
+                    empty if catalog is fresh or sources don't exist
+    """
+    source_path = source_path or header["source_path"]
+    if not exists(source_path):
+        return []
+
+    recorded: dict = header["sources"]
+    current: List[str] = scan_sources(source_path, header["format"])[2]
+
+    stale: List[str] = sorted(set(recorded).symmetric_difference(current))
+    for name in current:
+        if name not in recorded:
+            continue
+
+        size, mtime_ns, digest = recorded[name]
+        stats = stat(join(source_path, name))
+        if (stats.st_size, stats.st_mtime_ns) == (size, mtime_ns):
+            continue
+
+        if file_fingerprint(join(source_path, name))[2] != digest:
+            stale.append(name)
+
+    return stale
@@ -0,0 +1,124 @@
+"""
+This module implements frozen catalogs, an immutable compact form of
+loaded translations. Every nested dict is replaced with a node holding
+sorted tuple of interned keys and parallel tuple of values, searched
+with bisect, which takes a fraction of dict memory.
+"""
+from bisect import bisect_left
+from collections.abc import Mapping
+from sys import intern
+from typing import Any, Iterator, Tuple
+
+
+class FrozenCatalog(Mapping):
+    """Read-only node of frozen translations, keys of the node
+        are the same as keys of dict it was frozen from.
+
+    Items are looked up by dot-separated path as well, nodes
+    found on the way are returned as (newly built) nested dicts,
+    so results are the same as from nested translations.
+    """
+
+    __slots__ = ('_keys', '_values')
+
+    def __init__(self, keys: Tuple[str, ...], values: tuple) -> None:
+        """Initialize node, use freeze_catalog instead
+
+        Args:
+            keys (Tuple[str, ...]): sorted keys
+            values (tuple): values of keys, FrozenCatalog for subtrees
+
+        Return:
+            None
+        """
+        self._keys: Tuple[str, ...] = keys
+        self._values: tuple = values
+
+    def __getitem__(self, path: str) -> Any:
+        value: Any = self._find(path)
+        return value.to_dict() if isinstance(value, FrozenCatalog) else value
+
+    def __contains__(self, path: object) -> bool:
+        if not isinstance(path, str):
+            return False
+
+        try:
+            self._find(path)
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _find(self, path: str) -> Any:
+        """walk nodes along path, should not be called directly
+
+        Raises:
+            KeyError: if path doesn't exist
+        """
+        node: Any = self
+        for segment in path.split("."):
+            if not isinstance(node, FrozenCatalog):
+                raise KeyError(path)
+
+            keys: tuple = node._keys
+            index: int = bisect_left(keys, segment)
+            if index == len(keys) or keys[index] != segment:
+                raise KeyError(path)
+            node = node._values[index]
+
+        return node
+
+    def children(self) -> Iterator[Tuple[str, Any]]:
+        """Iterate over keys and values of the node without
+            building dicts, subtrees are FrozenCatalog nodes
+
+        Return:
+            Iterator[Tuple[str, Any]]: key and value pairs
+        """
+        return zip(self._keys, self._values)
+
+    def to_dict(self) -> dict:
+        """Build nested dict with content of the node
+
+        Return:
+            dict: nested translations
+        """
+        return {
+            key: value.to_dict() if isinstance(value, FrozenCatalog)
+            else value
+            for key, value in zip(self._keys, self._values)
+        }
+
+
+def freeze_catalog(content: dict) -> FrozenCatalog:
+    """Convert nested translations into frozen catalog, keys are
+        interned, so nodes share them across locales. Frozen
+        catalogs are returned as they are.
+
+    Args:
+        content (dict): nested translations
+
+    Return:
+        FrozenCatalog: frozen catalog
+    """
+    if isinstance(content, FrozenCatalog):
+        return content
+
+    # non-str keys are unreachable in nested lookups as well
+    items: list = sorted(
+        (intern(key), value) for key, value in content.items()
+        if isinstance(key, str)
+    )
+
+    return FrozenCatalog(
+        tuple(key for key, _ in items),
+        tuple(
+            freeze_catalog(value) if isinstance(value, dict) else value
+            for _, value in items
+        ),
+    )
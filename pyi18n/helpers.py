@@ -3,24 +3,134 @@ This module contains various helper functions and
 utilities that can be used throughout the application.
 """
 from ast import Dict
+from collections.abc import Mapping
+from concurrent.futures import Executor
+from functools import partial
+from importlib import import_module
+from itertools import repeat
 from os.path import exists, join, splitext
 from os import listdir, stat
 from logging import warning
-from typing import Any, List, Type
+from threading import Lock
+from typing import Any, Callable, Iterator, List, Optional, Type, Union
 from pathlib import Path
 from yaml import FullLoader
 
+from pyi18n.cache import parse_cached
+from pyi18n.metrics import PyI18nMetrics, timed_call
+from pyi18n.parsers import has_parser, parse_file
 
-def load_locale(path: str, ser_mod: Type, l_type: str) -> dict:
+
+class LazyLocale(Mapping):
+    """Read-only mapping of namespaces for a single locale directory,
+        each namespace file is parsed on first access and cached.
+
+    Attributes:
+        path (str): path to the locale directory
+        files (dict): namespace name to file path
+        ser_mod (object): module for serialization
+        l_type (str): loader type
+        parser (Optional[str]): pinned parser backend name
+        cache_dir (Optional[str]): persistent parse cache directory
+        metrics (Optional[PyI18nMetrics]): records namespace load times
+    """
+
+    def __init__(
+        self,
+        path: str,
+        files: dict,
+        ser_mod: Type,
+        l_type: str,
+        parser: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        metrics: Optional[PyI18nMetrics] = None
+    ) -> None:
+        """Initialize lazy locale, nothing is parsed here.
+
+        Args:
+            path (str): path to the locale directory
+            files (dict): namespace name to file path
+            ser_mod (object): module for serialization
+            l_type (str): loader type
+            parser (Optional[str]): pinned parser backend name
+            cache_dir (Optional[str]): persistent parse cache directory
+            metrics (Optional[PyI18nMetrics]): records load times
+
+        Return:
+            None
+        """
+        self.path: str = path
+        self.files: dict = files
+        self.ser_mod: Type = ser_mod
+        self.l_type: str = l_type
+        self.parser: Optional[str] = parser
+        self.cache_dir: Optional[str] = cache_dir
+        self.metrics: Optional[PyI18nMetrics] = metrics
+        self._loaded: dict = {}
+        self._lock: Lock = Lock()
+
+    def __getitem__(self, namespace: str) -> Any:
+        try:
+            return self._loaded[namespace]
+        except KeyError:
+            file_path: str = self.files[namespace]
+
+        with self._lock:
+            if namespace not in self._loaded:
+                seconds, self._loaded[namespace] = timed_call(
+                    load_file_by_name, file_path, self.ser_mod.__name__,
+                    self.l_type, self.parser, self.cache_dir)
+
+                if self.metrics is not None:
+                    self.metrics.record_load(file_path, seconds)
+
+        return self._loaded[namespace]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.files)
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+    @property
+    def loaded_namespaces(self) -> tuple:
+        """Return namespaces already parsed
+
+        Return:
+            tuple: names of parsed namespaces
+        """
+        return tuple(self._loaded)
+
+
+def load_locale(
+    path: str,
+    ser_mod: Type,
+    l_type: str,
+    lazy: bool = False,
+    executor: Optional[Executor] = None,
+    parser: Optional[str] = None,
+    cache_dir: Optional[str] = None,
+    metrics: Optional[PyI18nMetrics] = None
+) -> Union[dict, LazyLocale]:
     """Load translations from a single locale directory.
 
     Args:
         path (str): path to the locale directory
         ser_mod (object): module for serialization
         l_type (str): loader type
+        lazy (bool): return LazyLocale which parses namespace
+                        files on first access
+        executor (Executor): thread or process pool used to read
+                        and parse namespace files concurrently,
+                        ignored in lazy mode
+        parser (Optional[str]): parser backend name to pin,
+                        fastest installed one is used by default
+        cache_dir (Optional[str]): persistent parse cache directory,
+                        unchanged files are not parsed again
+        metrics (Optional[PyI18nMetrics]): records load time of files
 
     Return:
-        dict: loaded translations for the locale
+        Union[dict, LazyLocale]: loaded translations for the locale
     """
     if not exists(path):
         warning((
@@ -30,19 +140,37 @@ def load_locale(path: str, ser_mod: Type, l_type: str) -> dict:
         return {}
 
     file_extension: str = ser_mod.__name__
-    loaded_locale: dict = {}
+    files: dict = {}
 
     for file_name in get_files(path, file_extension):
         file_path: str = join(path, file_name)
-        namespace: str = splitext(file_name)[0]
 
         if not stat(file_path).st_size:
             continue
 
-        locale_content = load_file(file_path, ser_mod, l_type)
-        loaded_locale[namespace] = locale_content
+        files[splitext(file_name)[0]] = file_path
+
+    if lazy:
+        return LazyLocale(path, files, ser_mod, l_type, parser,
+                          cache_dir, metrics)
+
+    worker: Callable = load_file_by_name if metrics is None \
+        else partial(timed_call, load_file_by_name)
+    args: tuple = (files.values(), repeat(ser_mod.__name__),
+                   repeat(l_type), repeat(parser), repeat(cache_dir))
+    contents = map(worker, *args) if executor is None \
+        else executor.map(worker, *args)
 
-    return loaded_locale
+    if metrics is None:
+        return dict(zip(files, contents))
+
+    loaded: dict = {}
+    for (namespace, file_path), (seconds, content) in zip(
+            files.items(), contents):
+        metrics.record_load(file_path, seconds)
+        loaded[namespace] = content
+
+    return loaded
 
 
 def get_files(path: str, file_extension: str) -> List[str]:
@@ -83,6 +211,38 @@ def load_file(file_path: str, ser_mod: Type, l_type: str) -> Dict:
         return ser_mod.load(file, **loader_params)
 
 
+def load_file_by_name(
+    file_path: str,
+    ser_name: str,
+    l_type: str,
+    parser: Optional[str] = None,
+    cache_dir: Optional[str] = None
+) -> Dict:
+    """Load translations from a single file using serialization module
+        given by name, modules can't be pickled so process pools
+        have to import it on their side. Formats with parser backends
+        (yaml, json) are parsed by the fastest installed backend.
+
+    Args:
+        file_path (str): path to the translation file
+        ser_name (str): name of serialization module (e.g. "yaml", "json")
+        l_type (str): type of file to load (e.g. "yaml", "json")
+        parser (Optional[str]): parser backend name to pin
+        cache_dir (Optional[str]): persistent parse cache directory,
+                                    parser backend formats only
+
+    Return:
+        dict: loaded translations from the file
+    """
+    if has_parser(ser_name) and cache_dir:
+        return parse_cached(file_path, ser_name, cache_dir, parser)
+
+    if has_parser(ser_name):
+        return parse_file(file_path, ser_name, parser)
+
+    return load_file(file_path, import_module(ser_name), l_type)
+
+
 def get_locales(path: str, namespaced: bool, ext: str) -> tuple:
     """Returns a tuple of locales from the specified path.
 
@@ -116,3 +276,59 @@ def file_override(content: dict, file_path: str, ser_mod: Type) -> None:
     """
     with open(file_path, 'w', encoding='utf-8') as file:
         ser_mod.dump(content, file)
+
+
+def flatten(content: dict, prefix: str = '') -> dict:
+    """Flatten nested translations into a dot-path index.
+
+    Every nested dict is kept under its own path as well, so
+    subtree lookups resolve with the same single lookup as leaves.
+
+    Args:
+        content (dict): nested translations for a single locale
+        prefix (str): path prefix prepended to every key
+
+    Return:
+        dict: mapping of dot-separated paths to translations
+    """
+    flat: dict = {}
+    stack: list = [(prefix, content)]
+
+    while stack:
+        base, node = stack.pop()
+        for key, value in node.items():
+            # nested lookups split paths into str segments,
+            # non-str keys are unreachable there, keep it consistent
+            if not isinstance(key, str):
+                continue
+
+            path: str = f"{base}.{key}" if base else key
+            flat[path] = value
+
+            if isinstance(value, dict):
+                stack.append((path, value))
+
+    return flat
+
+
+def merge_translations(*contents: Mapping) -> dict:
+    """Deep merge translations, later contents override earlier ones
+        and nested dicts are merged key by key. Contents are not
+        modified, subtrees present in one of them only are shared.
+
+    Args:
+        *contents (Mapping): translations, lowest priority first
+
+    Return:
+        dict: merged translations
+    """
+    merged: dict = {}
+    for content in contents:
+        for key, value in content.items():
+            current: Any = merged.get(key)
+            if isinstance(value, Mapping) and isinstance(current, Mapping):
+                merged[key] = merge_translations(current, value)
+            else:
+                merged[key] = value
+
+    return merged
@@ -0,0 +1,147 @@
+"""
+This module provides precompiled interpolation templates used by
+PyI18n.gettext. Translation strings are parsed once with
+string.Formatter.parse and rendered by joining prepared segments.
+"""
+from collections import defaultdict
+from string import Formatter
+from typing import Callable, Optional, Tuple
+
+CONVERTERS: dict = {'r': repr, 's': str, 'a': ascii}
+
+
+class CompiledTemplate:
+    """ Translation string parsed into literal and placeholder segments
+
+    Attributes:
+        source (str): original translation string
+        names (tuple): placeholder names used in the string
+        head (str): literal text before the first placeholder
+        fields (tuple): (name, converter, format_spec, literal) per
+                        placeholder, literal is the text following it
+        simple (bool): False when the string uses syntax that can't
+                        be rendered from segments (positional, attribute
+                        or index fields, nested specs, malformed braces),
+                        such strings are rendered with str.format_map
+    """
+
+    __slots__ = ('source', 'names', 'head', 'fields', 'simple')
+
+    def __init__(self, source: str) -> None:
+        """ Parse translation string
+
+        Args:
+            source (str): translation string
+
+        Return:
+            None
+        """
+        self.source: str = source
+        self.names: tuple = ()
+        self.head: str = ''
+        self.fields: tuple = ()
+        self.simple: bool = False
+
+        parsed: Optional[list] = self.__parse(source)
+        if parsed is None:
+            return
+
+        self.head, self.fields = parsed[0], tuple(parsed[1])
+        self.names = tuple(dict.fromkeys(field[0] for field in self.fields))
+        self.simple = True
+
+    @staticmethod
+    def __parse(source: str) -> Optional[Tuple[str, list]]:
+        """ split string into head and fields, should not be called directly
+
+        Return:
+            Optional[Tuple[str, list]]: head and fields,
+                                        None when string is not simple
+        """
+        try:
+            parsed: list = list(Formatter().parse(source))
+        except ValueError:
+            return None
+
+        head: str = ''
+        fields: list = []
+        for literal, name, spec, conversion in parsed:
+            if fields:
+                field_name, converter, field_spec, tail = fields[-1]
+                fields[-1] = (field_name, converter,
+                              field_spec, tail + literal)
+            else:
+                head += literal
+
+            if name is None:
+                continue
+
+            if not name or name.isdigit() or '.' in name or '[' in name \
+                    or '{' in spec or conversion not in (None, *CONVERTERS):
+                return None
+
+            fields.append((name, CONVERTERS.get(conversion), spec, ''))
+
+        return head, fields
+
+    def render(self, kwargs: dict) -> str:
+        """ Render template with interpolation variables
+
+        Missing placeholders render as empty string.
+
+        Args:
+            kwargs (dict): interpolation variables
+
+        Return:
+            str: rendered translation
+        """
+        if not self.simple:
+            try:
+                return self.source.format_map(defaultdict(str, **kwargs))
+            except KeyError:
+                return self.source
+
+        get: Callable = kwargs.get
+        parts: list = [self.head]
+        for name, converter, spec, literal in self.fields:
+            value = get(name, '')
+            if converter is not None:
+                value = converter(value)
+            parts.append(format(value, spec))
+            parts.append(literal)
+
+        return ''.join(parts)
+
+
+def compile_template(source: str) -> CompiledTemplate:
+    """ Compile translation string into template
+
+    Args:
+        source (str): translation string
+
+    Return:
+        CompiledTemplate: compiled template
+    """
+    return CompiledTemplate(source)
+
+
+def placeholders(source: str) -> frozenset:
+    """ Extract names of placeholders used in translation string,
+        attribute and index access is reduced to the base name
+
+    Args:
+        source (str): translation string
+
+    Return:
+        frozenset: placeholder names, positional ones as their index,
+                    empty for malformed strings
+    """
+    try:
+        parsed: list = list(Formatter().parse(source))
+    except ValueError:
+        return frozenset()
+
+    return frozenset(
+        name.split('.', 1)[0].split('[', 1)[0]
+        for _, name, _, _ in parsed if name is not None
+    )
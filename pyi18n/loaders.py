@@ -3,12 +3,28 @@ This module defines the PyI18n loaders which
 load translations from files in YAML or JSON format.
 """
 
-from os.path import exists, join
-from typing import Type
+from asyncio import gather, get_running_loop
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import repeat
+from os import stat
+from os.path import basename, exists, isdir, join, splitext
+from sys import getsizeof
+from threading import Lock, local
+from typing import Callable, Optional, Tuple, Type
 import json
 import yaml
 
-from pyi18n.helpers import load_locale
+from pyi18n.cache import parse_cached
+from pyi18n.compaction import compact_catalog
+from pyi18n.metrics import PyI18nMetrics, timed_call
+from pyi18n.helpers import get_files, load_file_by_name, load_locale
+from pyi18n.compiled import read_catalog, stale_sources, write_catalog
+from pyi18n.mmapped import (
+    open_mmap_catalog, read_mmap_header, write_mmap_catalog)
+from pyi18n.parsers import (  # noqa: F401
+    ParserBackend, available_parsers, get_parser, has_parser, parse_file)
 
 
 class LoaderType:
@@ -17,6 +33,49 @@ class LoaderType:
     BASE: str = "base"
     YAML: str = "yaml"
     JSON: str = "json"
+    COMPILED: str = "compiled"
+    MMAP: str = "mmap"
+
+
+# compaction of loads started by load_async is deferred until all
+# locales are loaded, flag is set only in executor thread running them
+_deferred: local = local()
+
+
+class ExecutorMode:
+    """Enum for the concurrent loading modes."""
+
+    THREAD: str = "thread"
+    PROCESS: str = "process"
+
+
+def load_locale_file(
+    file_path: str,
+    ser_name: str,
+    locale: str,
+    parser: Optional[str] = None,
+    cache_dir: Optional[str] = None
+) -> Tuple[bool, Optional[dict]]:
+    """Load single locale file, module level so process pools
+        can pickle it.
+
+    Args:
+        file_path (str): path to the locale file
+        ser_name (str): name of serialization module
+        locale (str): locale stored in the file
+        parser (Optional[str]): parser backend name to pin
+        cache_dir (Optional[str]): persistent parse cache directory
+
+    Return:
+        Tuple[bool, Optional[dict]]: (False, None) if file is corrupted,
+                                        (True, translations) otherwise
+    """
+    try:
+        content: dict = parse_cached(file_path, ser_name, cache_dir, parser) \
+            if cache_dir else parse_file(file_path, ser_name, parser)
+        return True, content[locale]
+    except (json.decoder.JSONDecodeError, yaml.YAMLError):
+        return False, None
 
 
 class PyI18nBaseLoader:
@@ -25,28 +84,88 @@ class PyI18nBaseLoader:
     Attributes:
         load_path (str): path to translations
         namespaced (bool): tells loader should look for namespaces
+        lazy (bool): namespaced only, parse namespace files
+                        on first access instead of up front
+        max_workers (int): read and parse files concurrently
+                            with that many workers, None loads
+                            files one after another
+        mode (str): "thread" or "process" pool, process pool
+                    scales CPU-bound YAML parsing
+        parser (str): pin parser backend (e.g. "pyyaml", "orjson"),
+                        fastest installed one is used by default
+        cache_dir (str): persistent parse cache directory, parsed
+                            files are stored there and not parsed
+                            again until they change, None disables it
+        compact (bool): intern keys and deduplicate string values
+                        of loaded translations, equal values share
+                        one object across locales and namespaces
+        saved_bytes (int): bytes released by compaction so far, net
+                            of string pool built during each load
+        metrics (PyI18nMetrics): records load time of every file,
+                                    set by PyI18n.enable_metrics
 
         type (str): loader type
+        extensions (tuple): file extensions loader reads,
+                            empty when unknown (custom loaders)
+        flat (bool): loader returns catalogs keyed by dot-separated
+                        paths (mapping resolving "a.b" directly)
+                        instead of nested dicts
     """
 
     type: str = LoaderType.BASE
+    extensions: tuple = ()
+    flat: bool = False
 
     def __init__(
         self,
         load_path: str = "locales/",
-        namespaced: bool = False
+        namespaced: bool = False,
+        lazy: bool = False,
+        max_workers: Optional[int] = None,
+        mode: str = ExecutorMode.THREAD,
+        parser: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        compact: bool = False,
+        metrics: Optional[PyI18nMetrics] = None
     ) -> None:
         """Initialize loader class
 
         Args:
             load_path (str): path to translations
             namespaced (bool): namespaces support
+            lazy (bool): namespaced only, load namespaces on first access
+            max_workers (int): number of concurrent workers
+            mode (str): "thread" or "process" workers
+            parser (Optional[str]): parser backend name to pin
+            cache_dir (Optional[str]): persistent parse cache directory
+            compact (bool): compact loaded translations
+            metrics (Optional[PyI18nMetrics]): records file load times
 
         Return:
             None
+
+        Raises:
+            ValueError: if mode is not "thread" or "process"
+                        or pinned parser is not available
         """
+        if mode not in (ExecutorMode.THREAD, ExecutorMode.PROCESS):
+            raise ValueError(f"unknown executor mode {mode}, "
+                             "use thread or process")
+
+        if parser is not None:
+            get_parser(self.type, parser)
+
         self.load_path: str = load_path
         self.namespaced: bool = namespaced
+        self.lazy: bool = lazy
+        self.max_workers: Optional[int] = max_workers
+        self.mode: str = mode
+        self.parser: Optional[str] = parser
+        self.cache_dir: Optional[str] = cache_dir
+        self.compact: bool = compact
+        self.saved_bytes: int = 0
+        self._compact_lock: Lock = Lock()
+        self.metrics: Optional[PyI18nMetrics] = metrics
 
     def load(self, locales: tuple, ser_mod: Type) -> dict:
         """Load translations for given locales,
@@ -66,7 +185,7 @@ class PyI18nBaseLoader:
 
         file_extension: str = ser_mod.__name__
 
-        loaded: dict = {}
+        files: dict = {}
         for locale in locales:
             file_path: str = f"{self.load_path}{locale}.{file_extension}"
 
@@ -76,38 +195,132 @@ class PyI18nBaseLoader:
                 else:
                     continue
 
-            try:
-                loaded[locale] = self.__load_file(
-                    file_path, file_extension, ser_mod, locale
-                )
-            except (json.decoder.JSONDecodeError, yaml.YAMLError):
-                continue
+            files[locale] = file_path
+
+        args: tuple = (files.values(), repeat(file_extension),
+                       files.keys(), repeat(self.parser),
+                       repeat(self.cache_dir))
+        worker: Callable = load_locale_file if self.metrics is None \
+            else partial(timed_call, load_locale_file)
+        executor: Optional[Executor] = self._create_executor()
+
+        if executor is None:
+            results: list = list(map(worker, *args))
+        else:
+            with executor:
+                results: list = list(executor.map(worker, *args))
+
+        if self.metrics is not None:
+            for file_path, (seconds, _) in zip(files.values(), results):
+                self.metrics.record_load(file_path, seconds)
+            results = [result for _, result in results]
+
+        return self._compact({
+            locale: content
+            for locale, (loaded, content) in zip(files, results) if loaded
+        })
+
+    async def load_async(self, locales: tuple) -> dict:
+        """Load translations for given locales without blocking
+            event loop, every locale is read and parsed concurrently
+            by load in default executor of running loop, so custom
+            loaders implementing load support it as well.
+
+        Process mode loaders load all locales with single load call,
+        parsing is spread over their process pool.
+
+        Args:
+            locales (tuple): locales to load
+
+        Return:
+            dict: loaded translations, same as returned by load
+        """
+        loop = get_running_loop()
+        if self.max_workers and self.mode == ExecutorMode.PROCESS:
+            return await loop.run_in_executor(None, self.load, locales)
+
+        compact: bool = getattr(self, 'compact', False)
+        results: list = await gather(*(
+            loop.run_in_executor(
+                None, self._load_deferred if compact else self.load,
+                (locale,))
+            for locale in locales
+        ))
+
+        loaded: dict = {}
+        for result in results:
+            loaded.update(result)
+
+        if compact:
+            # single pool for all locales, so values are shared across them
+            await loop.run_in_executor(None, self._compact, loaded)
 
         return loaded
 
-    def __load_file(
-        self,
-        file_path: str,
-        ext: str,
-        ser_mod: Type,
-        locale: str
-    ) -> dict:
-        """loads content, should not be called directly
+    def _load_deferred(self, locales: tuple) -> dict:
+        """Load translations without compacting them, runs in executor
+            thread of load_async
+
+        Args:
+            locales (tuple): locales to load
+
+        Return:
+            dict: loaded translations
+        """
+        _deferred.active = True
+        try:
+            return self.load(locales)
+        finally:
+            _deferred.active = False
+
+    def _compact(self, loaded: dict) -> dict:
+        """Compact loaded translations in place when enabled, values
+            are shared across locales and namespaces loaded together.
+            String pool is discarded afterwards, so it doesn't grow
+            with every reload. Lazily parsed namespaces are skipped.
+
+        Args:
+            loaded (dict): loaded translations
+
+        Return:
+            dict: the same translations
+        """
+        if not self.compact or getattr(_deferred, 'active', False):
+            return loaded
+
+        pool: dict = {}
+        saved: int = 0
+        for content in loaded.values():
+            if isinstance(content, dict):
+                saved += compact_catalog(content, pool)
+
+        # pool was allocated to compact, count released memory net of it
+        saved = max(saved - getsizeof(pool), 0)
+        with self._compact_lock:
+            self.saved_bytes += saved
+
+        return loaded
+
+    def _create_executor(self) -> Optional[Executor]:
+        """Create pool for concurrent loading.
 
         Return:
-            dict: loaded content
+            Optional[Executor]: None when max_workers is not set
         """
-        with open(file_path, "r", encoding="utf-8") as _f:
-            load_params: dict = {
-                "Loader": yaml.FullLoader} if ext in ("yml", "yaml") else {}
+        if not self.max_workers:
+            return None
+
+        if self.mode == ExecutorMode.PROCESS:
+            return ProcessPoolExecutor(max_workers=self.max_workers)
 
-            return ser_mod.load(_f, **load_params)[locale]
+        return ThreadPoolExecutor(max_workers=self.max_workers)
 
     def _load_namespaced(self, locales: tuple, ser_mod: Type) -> dict:
         """Load translations from namespaces.
 
         Should be overridden in child classes.
-        This will look for a locale (directories) and load all namespaces.
+        This will look for a locale (directories) and load all namespaces,
+        in lazy mode namespaces are parsed on first access.
 
         Args:
             locales (tuple): locales to load
@@ -116,17 +329,126 @@ class PyI18nBaseLoader:
         Return:
             dict: loaded translations
         """
+        executor: Optional[Executor] = None if self.lazy \
+            else self._create_executor()
+
         loaded: dict = {}
-        for locale in locales:
+        try:
+            for locale in locales:
+                path: str = join(self.load_path, locale)
+                loaded_locale: dict = load_locale(
+                    path, ser_mod, self.type, self.lazy,
+                    executor, self.parser, self.cache_dir, self.metrics)
+
+                if not loaded_locale:
+                    continue
+
+                loaded.setdefault(locale, loaded_locale)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        return self._compact(loaded)
+
+    def has_locale(self, locale: str) -> bool:
+        """Cheap check if translations for locale exist,
+            nothing is parsed.
+
+        Args:
+            locale (str): locale to check
+
+        Return:
+            bool: False if locale file (or directory for namespaced
+                    loaders) doesn't exist, True otherwise or when
+                    loader extensions are unknown
+        """
+        if self.namespaced:
+            return isdir(join(self.load_path, locale))
+
+        if not self.extensions:
+            return True
+
+        return any(
+            exists(f"{self.load_path}{locale}.{ext}")
+            for ext in self.extensions
+        )
+
+    def sources(self, locale: str) -> tuple:
+        """Return files translations for locale are loaded from,
+            used to detect changed files on reload.
+
+        Args:
+            locale (str): locale to get files for
+
+        Return:
+            tuple: paths of existing source files
+        """
+        if self.namespaced:
             path: str = join(self.load_path, locale)
-            loaded_locale: dict = load_locale(path, ser_mod, self.type)
+            if not isdir(path):
+                return ()
 
-            if not loaded_locale:
-                continue
+            return tuple(
+                join(path, name)
+                for name in sorted(get_files(path, self.type))
+            )
 
-            loaded.setdefault(locale, loaded_locale)
+        for ext in self.extensions or (self.type,):
+            file_path: str = f"{self.load_path}{locale}.{ext}"
+            if exists(file_path):
+                return (file_path,)
 
-        return loaded
+        return ()
+
+    def reload(self, previous: dict, changed: dict) -> dict:
+        """Load locales again after their source files changed.
+
+        Namespaced built-in loaders re-parse only changed namespace
+        files, other loaders load changed locales again with load.
+
+        Args:
+            previous (dict): currently loaded translations
+            changed (dict): locale to paths of changed source files
+
+        Return:
+            dict: reloaded translations, locales missing here
+                    don't have translations anymore
+        """
+        if not self.namespaced or self.lazy or not has_parser(self.type):
+            return self.load(tuple(changed))
+
+        reloaded: dict = {}
+        for locale, paths in changed.items():
+            namespaces: dict = {
+                splitext(basename(path))[0]: path
+                for path in self.sources(locale)
+            }
+            content: dict = {
+                namespace: body
+                for namespace, body in (previous.get(locale) or {}).items()
+                if namespace in namespaces
+            }
+
+            for path in paths:
+                namespace: str = splitext(basename(path))[0]
+                if namespaces.get(namespace) != path:
+                    continue
+
+                if not stat(path).st_size:
+                    content.pop(namespace, None)
+                    continue
+
+                seconds, content[namespace] = timed_call(
+                    load_file_by_name, path, self.type, self.type,
+                    self.parser, self.cache_dir)
+
+                if self.metrics is not None:
+                    self.metrics.record_load(path, seconds)
+
+            if content:
+                reloaded[locale] = content
+
+        return self._compact(reloaded)
 
     def get_path(self) -> str:
         """Return loader path
@@ -143,11 +465,14 @@ class PyI18nJsonLoader(PyI18nBaseLoader):
     Attributes:
         load_path (str): path to translations
         namespaced (bool): tells loader should look for namespaces
+        lazy (bool): namespaced only, parse namespace files
+                        on first access instead of up front
 
         type (str): loader type
     """
 
     type: str = LoaderType.JSON
+    extensions: tuple = ("json",)
 
     def load(self, locales: tuple) -> dict:
         """Load translations for given locales using json
@@ -173,11 +498,14 @@ class PyI18nYamlLoader(PyI18nBaseLoader):
     Attributes:
         load_path (str): path to translations
         namespaced (bool): tells loader should look for namespaces
+        lazy (bool): namespaced only, parse namespace files
+                        on first access instead of up front
 
         type (str): loader type
     """
 
     type: str = LoaderType.YAML
+    extensions: tuple = ("yaml", "yml")
 
     def load(self, locales: tuple) -> dict:
         """Load translations for given locales using yaml
@@ -194,3 +522,195 @@ class PyI18nYamlLoader(PyI18nBaseLoader):
             return super()._load_namespaced(locales, yaml)
 
         return super().load(locales, yaml)
+
+
+class StalePolicy:
+    """Enum for compiled catalog behaviour when sources changed."""
+
+    RAISE: str = "raise"
+    RECOMPILE: str = "recompile"
+    IGNORE: str = "ignore"
+
+
+class PyI18nCompiledLoader(PyI18nBaseLoader):
+    """PyI18n compiled catalog loader class,
+        loads catalog produced by `pyi18n-tasks compile`
+
+    Attributes:
+        load_path (str): path to compiled catalog file
+        source_path (Optional[str]): locales directory catalog was
+                                    compiled from, defaults to one
+                                    recorded in catalog header
+        on_stale (str): "raise", "recompile" or "ignore" when
+                        sources changed since compilation
+
+        type (str): loader type
+    """
+
+    type: str = LoaderType.COMPILED
+
+    def __init__(
+        self,
+        load_path: str = "locales.i18nc",
+        source_path: Optional[str] = None,
+        on_stale: str = StalePolicy.RAISE
+    ) -> None:
+        """Initialize loader class
+
+        Args:
+            load_path (str): path to compiled catalog file
+            source_path (Optional[str]): locales directory
+            on_stale (str): "raise", "recompile" or "ignore"
+
+        Return:
+            None
+
+        Raises:
+            ValueError: if on_stale policy is unknown
+        """
+        if on_stale not in (StalePolicy.RAISE, StalePolicy.RECOMPILE,
+                            StalePolicy.IGNORE):
+            raise ValueError(f"unknown stale policy {on_stale}, "
+                             "use raise, recompile or ignore")
+
+        super().__init__(load_path)
+        self.source_path: Optional[str] = source_path
+        self.on_stale: str = on_stale
+
+    def load(self, locales: tuple) -> dict:
+        """Load translations for given locales from compiled catalog
+
+        Args:
+            locales (tuple): locales to load
+
+        Return:
+            dict: loaded translations
+
+        Raises:
+            ValueError: if catalog is stale and on_stale is "raise"
+        """
+        if not exists(self.load_path):
+            return {}
+
+        if self.on_stale != StalePolicy.IGNORE:
+            header: dict = self._read_header()
+            stale: list = stale_sources(header, self.source_path)
+
+            if stale and self.on_stale == StalePolicy.RAISE:
+                raise ValueError(
+                    f"compiled catalog {self.load_path} is stale, changed "
+                    f"sources: {', '.join(stale)}, run pyi18n-tasks compile")
+
+            if stale:
+                self._write(self.source_path or header["source_path"],
+                            header["format"])
+
+        seconds, translations = timed_call(self._read_translations)
+        if self.metrics is not None:
+            self.metrics.record_load(self.load_path, seconds)
+
+        return {
+            locale: translations[locale]
+            for locale in locales if locale in translations
+        }
+
+    async def load_async(self, locales: tuple) -> dict:
+        """Load translations for given locales from compiled catalog
+            in default executor, catalog is read once for all locales
+
+        Args:
+            locales (tuple): locales to load
+
+        Return:
+            dict: loaded translations
+        """
+        return await get_running_loop().run_in_executor(
+            None, self.load, locales)
+
+    def sources(self, locale: str) -> tuple:
+        """Return catalog file, every locale is loaded from it
+
+        Args:
+            locale (str): locale to get files for
+
+        Return:
+            tuple: path of catalog file if it exists
+        """
+        return (self.load_path,) if exists(self.load_path) else ()
+
+    def _read_header(self) -> dict:
+        """Read catalog header
+
+        Return:
+            dict: catalog header
+        """
+        return read_catalog(self.load_path, header_only=True)[0]
+
+    def _read_translations(self) -> dict:
+        """Read translations of every locale in catalog
+
+        Return:
+            dict: translations per locale
+        """
+        return read_catalog(self.load_path)[1]
+
+    def _write(self, source_path: str, fmt: str) -> None:
+        """Recompile catalog from sources
+
+        Args:
+            source_path (str): locales directory
+            fmt (str): format of locale files catalog was compiled from
+        """
+        write_catalog(self.load_path, source_path, fmt)
+
+
+class PyI18nMmapLoader(PyI18nCompiledLoader):
+    """PyI18n memory-mapped catalog loader class,
+        loads catalog produced by `pyi18n-tasks compile -f mmap`.
+
+    Catalogs are flat and read-only, values are decoded on demand from
+    the mapped file, so pre-fork workers share it through page cache.
+
+    Attributes:
+        load_path (str): path to memory-mapped catalog file
+        source_path (Optional[str]): locales directory catalog was
+                                    compiled from
+        on_stale (str): "raise", "recompile" or "ignore" when
+                        sources changed since compilation
+        cache_size (int): per locale LRU size of decoded lookups
+
+        type (str): loader type
+    """
+
+    type: str = LoaderType.MMAP
+    flat: bool = True
+
+    def __init__(
+        self,
+        load_path: str = "locales.i18nm",
+        source_path: Optional[str] = None,
+        on_stale: str = StalePolicy.RAISE,
+        cache_size: int = 256
+    ) -> None:
+        """Initialize loader class
+
+        Args:
+            load_path (str): path to memory-mapped catalog file
+            source_path (Optional[str]): locales directory
+            on_stale (str): "raise", "recompile" or "ignore"
+            cache_size (int): LRU size of decoded lookups, 0 disables it
+
+        Return:
+            None
+        """
+        super().__init__(load_path, source_path, on_stale)
+        self.cache_size: int = cache_size
+
+    def _read_header(self) -> dict:
+        return read_mmap_header(self.load_path)
+
+    def _read_translations(self) -> dict:
+        return open_mmap_catalog(self.load_path, self.cache_size)[1]
+
+    def _write(self, source_path: str, fmt: str) -> None:
+        write_mmap_catalog(self.load_path, source_path, fmt)
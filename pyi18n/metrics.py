@@ -0,0 +1,210 @@
+"""
+This module provides opt-in runtime metrics of PyI18n and loaders:
+lookup, miss and interpolation counts per locale, sampled lookup latency
+histograms and load durations of every file. Metrics are collected only
+when enabled with PyI18n.enable_metrics, disabled instances don't
+execute any of this code.
+"""
+from collections import Counter
+from threading import Lock
+from time import perf_counter
+from typing import Any, Callable, Optional, Tuple
+
+# upper bounds of latency histogram buckets in seconds
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 1e-3, float("inf"),
+)
+
+
+def timed_call(func: Callable, *args) -> Tuple[float, Any]:
+    """Call function and measure its duration, module level
+        so process pools can pickle it wrapped in partial.
+
+    Args:
+        func (Callable): function to call
+        *args: function arguments
+
+    Return:
+        Tuple[float, Any]: duration in seconds and function result
+    """
+    start: float = perf_counter()
+    result: Any = func(*args)
+    return perf_counter() - start, result
+
+
+class PyI18nMetrics:
+    """Runtime metrics collector
+
+    Counters are updated without locking, under heavy concurrency
+    they are approximate. Latency is measured for every
+    sample_every-th lookup only.
+
+    Attributes:
+        sample_every (int): measure latency of every n-th lookup
+        callback (Optional[Callable]): called with event name and data,
+                                        "gettext" for sampled lookups,
+                                        "load" for loaded files
+    """
+
+    def __init__(
+        self,
+        sample_every: int = 100,
+        callback: Optional[Callable[[str, dict], None]] = None
+    ) -> None:
+        """Initialize empty metrics
+
+        Args:
+            sample_every (int): measure latency of every n-th lookup
+            callback (Optional[Callable[[str, dict], None]]): receives
+                                        every latency sample and file load
+
+        Return:
+            None
+        """
+        self.sample_every: int = max(1, sample_every)
+        self.callback: Optional[Callable[[str, dict], None]] = callback
+        self._lock: Lock = Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear collected metrics
+
+        Return:
+            None
+        """
+        self._calls: int = 0
+        self._lookups: Counter = Counter()
+        self._misses: Counter = Counter()
+        self._interpolations: Counter = Counter()
+        self._latency: dict = {}
+        self._files: dict = {}
+
+    def sample(self) -> bool:
+        """Check if current lookup should be timed
+
+        Return:
+            bool: True for every sample_every-th call
+        """
+        self._calls += 1
+        return not self._calls % self.sample_every
+
+    def record_lookup(self, locale: str, count: int = 1) -> None:
+        """Count lookups in locale
+
+        Args:
+            locale (str): looked up locale
+            count (int): number of looked up paths
+
+        Return:
+            None
+        """
+        self._lookups[locale] += count
+
+    def record_miss(self, locale: str) -> None:
+        """Count missing translation in locale
+
+        Args:
+            locale (str): looked up locale
+
+        Return:
+            None
+        """
+        self._misses[locale] += 1
+
+    def record_interpolation(self, locale: str) -> None:
+        """Count rendered interpolation template in locale
+
+        Args:
+            locale (str): looked up locale
+
+        Return:
+            None
+        """
+        self._interpolations[locale] += 1
+
+    def record_latency(self, locale: str, path: str, seconds: float) -> None:
+        """Add lookup duration to locale latency histogram
+
+        Args:
+            locale (str): looked up locale
+            path (str): looked up path
+            seconds (float): lookup duration
+
+        Return:
+            None
+        """
+        with self._lock:
+            histogram: list = self._latency.setdefault(
+                locale, [0] * (len(LATENCY_BUCKETS) + 1))
+            for index, bound in enumerate(LATENCY_BUCKETS):
+                if seconds <= bound:
+                    histogram[index] += 1
+                    break
+            histogram[-1] += seconds
+
+        if self.callback is not None:
+            self.callback("gettext", {
+                "locale": locale, "path": path, "seconds": seconds})
+
+    def record_load(self, file_path: str, seconds: float) -> None:
+        """Record duration of reading and parsing file
+
+        Args:
+            file_path (str): loaded file
+            seconds (float): load duration
+
+        Return:
+            None
+        """
+        with self._lock:
+            loads, total, _ = self._files.get(file_path, (0, 0.0, 0.0))
+            self._files[file_path] = (loads + 1, total + seconds, seconds)
+
+        if self.callback is not None:
+            self.callback("load", {"path": file_path, "seconds": seconds})
+
+    def snapshot(self) -> dict:
+        """Return copy of collected metrics
+
+        Return:
+            dict: "locales" with lookups, hits, misses, interpolations
+                    and latency histogram (bucket upper bound to count)
+                    per locale, "files" with loads count, total and last
+                    duration per file
+        """
+        with self._lock:
+            latency: dict = {
+                locale: list(histogram)
+                for locale, histogram in self._latency.items()
+            }
+            files: dict = dict(self._files)
+
+        locales: dict = {}
+        for locale in sorted({*self._lookups, *self._misses, *latency}):
+            lookups: int = self._lookups[locale]
+            misses: int = self._misses[locale]
+            histogram: list = latency.get(
+                locale, [0] * (len(LATENCY_BUCKETS) + 1))
+            locales[locale] = {
+                "lookups": lookups,
+                "hits": max(0, lookups - misses),
+                "misses": misses,
+                "interpolations": self._interpolations[locale],
+                "latency": {
+                    "samples": sum(histogram[:-1]),
+                    "seconds": histogram[-1],
+                    "buckets": {
+                        "+Inf" if bound == float("inf") else repr(bound):
+                        count
+                        for bound, count in zip(LATENCY_BUCKETS, histogram)
+                    },
+                },
+            }
+
+        return {
+            "locales": locales,
+            "files": {
+                path: {"loads": loads, "seconds": total, "last": last}
+                for path, (loads, total, last) in sorted(files.items())
+            },
+        }
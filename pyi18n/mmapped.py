@@ -0,0 +1,362 @@
+"""
+This module implements memory-mapped catalogs. Every locale is stored as
+a hash table of entry indexes, a table of entries sorted by key and UTF-8
+blobs of keys and values. Values are decoded on demand, so pre-fork
+workers mapping the same file share its pages through the OS page cache.
+"""
+from collections.abc import Mapping
+from functools import lru_cache
+from mmap import ACCESS_READ, mmap
+from struct import Struct
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+from zlib import crc32
+import marshal
+
+from pyi18n.cache import write_atomic
+from pyi18n.compiled import build_catalog
+
+MMAP_MAGIC: bytes = b"PYI18NM\x01"
+MMAP_VERSION: int = 1
+
+# key offset, key length, value offset, value length, value kind
+ENTRY: Struct = Struct("<IIIII")
+SLOT: Struct = Struct("<I")
+HEADER_SIZE: Struct = Struct("<I")
+
+# offsets within locale section are 32-bit
+MAX_SECTION_SIZE: int = 0xFFFFFFFF
+
+KIND_STR: int = 0
+KIND_MARSHAL: int = 1
+KIND_EMPTY: int = 2
+
+
+def _leaves(content: dict) -> List[Tuple[bytes, int, bytes]]:
+    """Flatten nested translations into encoded leaf entries
+
+    Args:
+        content (dict): nested translations for single locale
+
+    Return:
+        List[Tuple[bytes, int, bytes]]: key, value kind and value,
+                                        sorted by encoded key
+    """
+    leaves: list = []
+    stack: list = [("", content)]
+
+    while stack:
+        base, node = stack.pop()
+        for key, value in node.items():
+            if not isinstance(key, str):
+                continue
+
+            path: str = f"{base}.{key}" if base else key
+            if isinstance(value, dict) and value:
+                stack.append((path, value))
+            elif isinstance(value, dict):
+                leaves.append((path.encode(), KIND_EMPTY, b""))
+            elif isinstance(value, str):
+                leaves.append((path.encode(), KIND_STR, value.encode()))
+            else:
+                leaves.append((path.encode(), KIND_MARSHAL,
+                               marshal.dumps(value)))
+
+    return sorted(leaves)
+
+
+def _build_section(content: dict) -> Tuple[bytes, int, int]:
+    """Build single locale section
+
+    Args:
+        content (dict): nested translations for single locale
+
+    Return:
+        Tuple[bytes, int, int]: section bytes, entries count, slots count
+
+    Raises:
+        ValueError: if section doesn't fit 32-bit offsets
+    """
+    leaves: list = _leaves(content)
+    count: int = len(leaves)
+    slots: int = 1
+    while slots < count * 2:
+        slots *= 2
+
+    table: list = [0] * slots
+    entries: bytearray = bytearray()
+    blob: bytearray = bytearray()
+    blob_start: int = slots * SLOT.size + count * ENTRY.size
+
+    size: int = blob_start + sum(
+        len(key) + len(value) for key, _, value in leaves)
+    if size > MAX_SECTION_SIZE:
+        raise ValueError(f"section of {size} bytes exceeds "
+                         f"{MAX_SECTION_SIZE} bytes addressable by "
+                         "memory-mapped catalog")
+
+    for index, (key, kind, value) in enumerate(leaves):
+        slot: int = crc32(key) & (slots - 1)
+        while table[slot]:
+            slot = (slot + 1) & (slots - 1)
+        table[slot] = index + 1
+
+        key_offset: int = blob_start + len(blob)
+        blob += key
+        entries += ENTRY.pack(key_offset, len(key),
+                              blob_start + len(blob), len(value), kind)
+        blob += value
+
+    section: bytes = b"".join(SLOT.pack(slot) for slot in table) \
+        + bytes(entries) + bytes(blob)
+    return section, count, slots
+
+
+def write_mmap_catalog(
+    catalog_path: str,
+    source_path: str,
+    fmt: Optional[str] = None
+) -> dict:
+    """Compile locales directory into memory-mapped catalog file,
+        written atomically through temporary file
+
+    Args:
+        catalog_path (str): path to output catalog file
+        source_path (str): path to locales directory
+        fmt (Optional[str]): format of locale files,
+                                see compiled.scan_sources
+
+    Return:
+        dict: catalog header
+
+    Raises:
+        ValueError: if locale doesn't fit 32-bit offsets (over 4 GiB)
+    """
+    header, translations = build_catalog(source_path, fmt)
+
+    sections: list = []
+    locales: dict = {}
+    offset: int = 0
+    for locale, content in translations.items():
+        try:
+            section, count, slots = _build_section(content)
+        except ValueError as err:
+            raise ValueError(f"locale {locale}: {err}") from err
+        locales[locale] = (offset, count, slots)
+        sections.append(section)
+        offset += len(section)
+
+    header = {**header, "version": MMAP_VERSION, "locales": locales}
+    header_bytes: bytes = marshal.dumps(header)
+
+    def write(_f: BinaryIO) -> None:
+        _f.write(MMAP_MAGIC)
+        _f.write(HEADER_SIZE.pack(len(header_bytes)))
+        _f.write(header_bytes)
+        for section in sections:
+            _f.write(section)
+
+    # workers may recompile the same catalog at once
+    write_atomic(catalog_path, write)
+
+    return header
+
+
+def read_mmap_header(catalog_path: str) -> dict:
+    """Read header of memory-mapped catalog without mapping it
+
+    Args:
+        catalog_path (str): path to catalog file
+
+    Return:
+        dict: catalog header
+
+    Raises:
+        ValueError: if file isn't compatible memory-mapped catalog
+    """
+    with open(catalog_path, "rb") as _f:
+        return _read_header(_f.read(len(MMAP_MAGIC) + HEADER_SIZE.size),
+                            _f, catalog_path)
+
+
+def _read_header(prefix: bytes, _f: Any, catalog_path: str) -> dict:
+    """validate magic and read header, should not be called directly"""
+    if prefix[:len(MMAP_MAGIC)] != MMAP_MAGIC:
+        raise ValueError(f"{catalog_path} is not a memory-mapped catalog")
+
+    size: int = HEADER_SIZE.unpack_from(prefix, len(MMAP_MAGIC))[0]
+    header: dict = marshal.loads(_f.read(size))
+    if header.get("version") != MMAP_VERSION:
+        raise ValueError(f"{catalog_path} catalog version "
+                         f"{header.get('version')} is not supported")
+    return header
+
+
+def open_mmap_catalog(
+    catalog_path: str,
+    cache_size: int = 256
+) -> Tuple[dict, Dict[str, 'MmapCatalog']]:
+    """Map catalog file into memory
+
+    Args:
+        catalog_path (str): path to catalog file
+        cache_size (int): per locale LRU size of decoded lookups,
+                            0 disables caching
+
+    Return:
+        Tuple[dict, Dict[str, MmapCatalog]]: header and catalog per locale
+    """
+    with open(catalog_path, "rb") as _f:
+        header: dict = _read_header(
+            _f.read(len(MMAP_MAGIC) + HEADER_SIZE.size), _f, catalog_path)
+        data_start: int = _f.tell()
+        buffer: mmap = mmap(_f.fileno(), 0, access=ACCESS_READ)
+
+    return header, {
+        locale: MmapCatalog(buffer, data_start + offset, count, slots,
+                            cache_size)
+        for locale, (offset, count, slots) in header["locales"].items()
+    }
+
+
+class MmapCatalog(Mapping):
+    """Read-only flat catalog of single locale backed by mmap,
+        keys are dot-separated paths.
+
+    Looking up a path that is a prefix of other keys returns
+    nested dict built from them, same as nested translations.
+
+    Attributes:
+        count (int): number of leaf entries
+        slots (int): size of hash table
+    """
+
+    def __init__(
+        self,
+        buffer: mmap,
+        offset: int,
+        count: int,
+        slots: int,
+        cache_size: int = 256
+    ) -> None:
+        """Initialize catalog over mapped section
+
+        Args:
+            buffer (mmap): mapped catalog file
+            offset (int): section offset in file
+            count (int): number of entries
+            slots (int): size of hash table
+            cache_size (int): LRU size of decoded lookups, 0 disables it
+
+        Return:
+            None
+        """
+        self._buffer: mmap = buffer
+        self._offset: int = offset
+        self._entries: int = offset + slots * SLOT.size
+        self.count: int = count
+        self.slots: int = slots
+        self._lookup = lru_cache(maxsize=cache_size)(self._read) \
+            if cache_size else self._read
+
+    def __getitem__(self, path: str) -> Any:
+        return self._lookup(path)
+
+    def __contains__(self, path: object) -> bool:
+        if not isinstance(path, str):
+            return False
+
+        key: bytes = path.encode()
+        if self._find(key) is not None:
+            return True
+
+        start: int = self._prefix_start(key + b".")
+        return start < self.count and \
+            self._key(start).startswith(key + b".")
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(self.count):
+            yield self._key(index).decode()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _entry(self, index: int) -> Tuple[int, int, int, int, int]:
+        """unpack entry, should not be called directly"""
+        return ENTRY.unpack_from(
+            self._buffer, self._entries + index * ENTRY.size)
+
+    def _key(self, index: int) -> bytes:
+        """read encoded key of entry, should not be called directly"""
+        key_offset, key_len, _, _, _ = self._entry(index)
+        start: int = self._offset + key_offset
+        return self._buffer[start:start + key_len]
+
+    def _value(self, index: int) -> Any:
+        """decode value of entry, should not be called directly"""
+        _, _, value_offset, value_len, kind = self._entry(index)
+        if kind == KIND_EMPTY:
+            return {}
+
+        start: int = self._offset + value_offset
+        value: bytes = self._buffer[start:start + value_len]
+        return value.decode() if kind == KIND_STR else marshal.loads(value)
+
+    def _find(self, key: bytes) -> Any:
+        """probe hash table, should not be called directly
+
+        Return:
+            Optional[int]: entry index or None if key doesn't exist
+        """
+        mask: int = self.slots - 1
+        slot: int = crc32(key) & mask
+        while True:
+            index: int = SLOT.unpack_from(
+                self._buffer, self._offset + slot * SLOT.size)[0]
+            if not index:
+                return None
+
+            if self._key(index - 1) == key:
+                return index - 1
+
+            slot = (slot + 1) & mask
+
+    def _prefix_start(self, prefix: bytes) -> int:
+        """bisect first entry with key >= prefix,
+            should not be called directly"""
+        low, high = 0, self.count
+        while low < high:
+            middle: int = (low + high) // 2
+            if self._key(middle) < prefix:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _read(self, path: str) -> Any:
+        """lookup path, should not be called directly
+
+        Raises:
+            KeyError: if path doesn't exist
+        """
+        key: bytes = path.encode()
+        index = self._find(key)
+        if index is not None:
+            return self._value(index)
+
+        prefix: bytes = key + b"."
+        subtree: dict = {}
+        for index in range(self._prefix_start(prefix), self.count):
+            entry_key: bytes = self._key(index)
+            if not entry_key.startswith(prefix):
+                break
+
+            node: dict = subtree
+            *parents, leaf = entry_key[len(prefix):].decode().split(".")
+            for parent in parents:
+                node = node.setdefault(parent, {})
+            node[leaf] = self._value(index)
+
+        if not subtree:
+            raise KeyError(path)
+
+        return subtree
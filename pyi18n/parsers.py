@@ -0,0 +1,204 @@
+"""
+This module defines parser backends used by the built-in loaders.
+Faster backends (libyaml, orjson) are detected when installed and
+preferred over pure python ones, a backend can also be pinned by name.
+"""
+from typing import Any, BinaryIO, Dict, Optional, Tuple, Type
+import json
+import yaml
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+class ParserBackend:
+    """Base parser backend
+
+    Attributes:
+        name (str): backend name used to pin it
+        format (str): serialization format, same as serializer
+                        module name used by loaders ("yaml", "json")
+        errors (tuple): exceptions raised for corrupted content
+    """
+
+    name: str = ""
+    format: str = ""
+    errors: tuple = ()
+
+    @classmethod
+    def available(cls) -> bool:
+        """Check if backend dependencies are installed
+
+        Return:
+            bool: True if backend can be used
+        """
+        return True
+
+    def loads(self, content: bytes) -> Any:
+        """Parse file content, should be overridden in child classes.
+
+        Args:
+            content (bytes): raw file content
+
+        Return:
+            Any: parsed content
+        """
+        raise NotImplementedError
+
+    def load(self, file: BinaryIO) -> Any:
+        """Parse content of open file, backends able to parse
+            streams override it, so raw content isn't held in memory
+
+        Args:
+            file (BinaryIO): file opened in binary mode
+
+        Return:
+            Any: parsed content
+        """
+        return self.loads(file.read())
+
+
+class PyYamlParser(ParserBackend):
+    """Pure python PyYAML backend"""
+
+    name: str = "pyyaml"
+    format: str = "yaml"
+    errors: tuple = (yaml.YAMLError,)
+    loader: Type = yaml.FullLoader
+
+    def loads(self, content: bytes) -> Any:
+        return yaml.load(content, Loader=self.loader)
+
+    def load(self, file: BinaryIO) -> Any:
+        return yaml.load(file, Loader=self.loader)
+
+
+class LibYamlParser(PyYamlParser):
+    """PyYAML backend built with libyaml bindings,
+        uses CFullLoader so results match PyYamlParser
+    """
+
+    name: str = "libyaml"
+    loader: Type = getattr(yaml, "CFullLoader", yaml.FullLoader)
+
+    @classmethod
+    def available(cls) -> bool:
+        return bool(yaml.__with_libyaml__) and hasattr(yaml, "CFullLoader")
+
+
+class JsonParser(ParserBackend):
+    """Standard library json backend"""
+
+    name: str = "json"
+    format: str = "json"
+    errors: tuple = (json.decoder.JSONDecodeError,)
+
+    def loads(self, content: bytes) -> Any:
+        return json.loads(content)
+
+
+class OrjsonParser(JsonParser):
+    """orjson backend, orjson.JSONDecodeError
+        is a subclass of json.decoder.JSONDecodeError
+    """
+
+    name: str = "orjson"
+
+    @classmethod
+    def available(cls) -> bool:
+        return orjson is not None
+
+    def loads(self, content: bytes) -> Any:
+        return orjson.loads(content)
+
+
+# backends per format, in order of preference
+PARSERS: Dict[str, Tuple[Type[ParserBackend], ...]] = {
+    "yaml": (LibYamlParser, PyYamlParser),
+    "json": (OrjsonParser, JsonParser),
+}
+
+_instances: Dict[Tuple[str, Optional[str]], ParserBackend] = {}
+
+
+def available_parsers(fmt: str) -> Tuple[str, ...]:
+    """Return names of installed backends for given format
+
+    Args:
+        fmt (str): serialization format ("yaml", "json")
+
+    Return:
+        Tuple[str, ...]: backend names in order of preference
+    """
+    return tuple(
+        backend.name for backend in PARSERS.get(fmt, ())
+        if backend.available()
+    )
+
+
+def has_parser(fmt: str) -> bool:
+    """Check if format is handled by parser backends
+
+    Args:
+        fmt (str): serialization format
+
+    Return:
+        bool: True if format has parser backends
+    """
+    return fmt in PARSERS
+
+
+def get_parser(fmt: str, name: Optional[str] = None) -> ParserBackend:
+    """Return parser backend for format, fastest installed one
+        unless pinned by name
+
+    Args:
+        fmt (str): serialization format ("yaml", "json")
+        name (Optional[str]): backend name to pin, e.g. "pyyaml"
+
+    Return:
+        ParserBackend: parser backend instance
+
+    Raises:
+        ValueError: if format is unknown or pinned backend
+                    doesn't exist or isn't installed
+    """
+    try:
+        return _instances[(fmt, name)]
+    except KeyError:
+        pass
+
+    if fmt not in PARSERS:
+        raise ValueError(f"no parser backends for {fmt} format")
+
+    for backend in PARSERS[fmt]:
+        if name not in (None, backend.name):
+            continue
+
+        if backend.available():
+            _instances[(fmt, name)] = backend()
+            return _instances[(fmt, name)]
+
+        if name is not None:
+            break
+
+    raise ValueError(f"parser {name} for {fmt} format is not available, "
+                     f"installed: {', '.join(available_parsers(fmt))}")
+
+
+def parse_file(file_path: str, fmt: str, name: Optional[str] = None) -> Any:
+    """Read and parse file with parser backend
+
+    Args:
+        file_path (str): path to the file
+        fmt (str): serialization format ("yaml", "json")
+        name (Optional[str]): backend name to pin
+
+    Return:
+        Any: parsed content
+    """
+    parser: ParserBackend = get_parser(fmt, name)
+    with open(file_path, "rb") as _f:
+        return parser.loads(_f.read())
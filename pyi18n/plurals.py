@@ -0,0 +1,343 @@
+"""
+This module provides CLDR plural rules used by PyI18n.gettext to select
+plural form of translation by count. Rule strings are compiled once
+per language into plain Python functions, so selecting plural category
+costs a few integer comparisons per call.
+"""
+from decimal import Decimal, InvalidOperation
+from re import compile as re_compile, split
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+CATEGORIES: Tuple[str, ...] = ("zero", "one", "two", "few", "many", "other")
+OPERANDS: Tuple[str, ...] = ("n", "i", "v", "f", "t", "w", "e", "c")
+
+_MILLIONS: str = "e = 0 and i != 0 and i % 1000000 = 0 and v = 0 " \
+    "or e != 0..5"
+
+# CLDR plural rules per language, "other" is implicit
+PLURAL_RULES: Dict[str, Dict[str, str]] = {
+    "other": {},
+    "en": {"one": "i = 1 and v = 0"},
+    "de": {"one": "i = 1 and v = 0"},
+    "nl": {"one": "i = 1 and v = 0"},
+    "sv": {"one": "i = 1 and v = 0"},
+    "et": {"one": "i = 1 and v = 0"},
+    "fi": {"one": "i = 1 and v = 0"},
+    "nb": {"one": "n = 1"},
+    "no": {"one": "n = 1"},
+    "el": {"one": "n = 1"},
+    "hu": {"one": "n = 1"},
+    "tr": {"one": "n = 1"},
+    "bg": {"one": "n = 1"},
+    "da": {"one": "n = 1 or t != 0 and i = 0,1"},
+    "hi": {"one": "i = 0 or n = 1"},
+    "bn": {"one": "i = 0 or n = 1"},
+    "fr": {"one": "i = 0,1", "many": _MILLIONS},
+    "es": {"one": "n = 1", "many": _MILLIONS},
+    "it": {"one": "i = 1 and v = 0", "many": _MILLIONS},
+    "ca": {"one": "i = 1 and v = 0", "many": _MILLIONS},
+    "pt": {"one": "i = 0..1", "many": _MILLIONS},
+    "pt_PT": {"one": "i = 1 and v = 0", "many": _MILLIONS},
+    "pl": {
+        "one": "i = 1 and v = 0",
+        "few": "v = 0 and i % 10 = 2..4 and i % 100 != 12..14",
+        "many": "v = 0 and i != 1 and i % 10 = 0..1 "
+                "or v = 0 and i % 10 = 5..9 or v = 0 and i % 100 = 12..14",
+    },
+    "ru": {
+        "one": "v = 0 and i % 10 = 1 and i % 100 != 11",
+        "few": "v = 0 and i % 10 = 2..4 and i % 100 != 12..14",
+        "many": "v = 0 and i % 10 = 0 or v = 0 and i % 10 = 5..9 "
+                "or v = 0 and i % 100 = 11..14",
+    },
+    "uk": {
+        "one": "v = 0 and i % 10 = 1 and i % 100 != 11",
+        "few": "v = 0 and i % 10 = 2..4 and i % 100 != 12..14",
+        "many": "v = 0 and i % 10 = 0 or v = 0 and i % 10 = 5..9 "
+                "or v = 0 and i % 100 = 11..14",
+    },
+    "be": {
+        "one": "n % 10 = 1 and n % 100 != 11",
+        "few": "n % 10 = 2..4 and n % 100 != 12..14",
+        "many": "n % 10 = 0 or n % 10 = 5..9 or n % 100 = 11..14",
+    },
+    "cs": {"one": "i = 1 and v = 0", "few": "i = 2..4 and v = 0",
+           "many": "v != 0"},
+    "sk": {"one": "i = 1 and v = 0", "few": "i = 2..4 and v = 0",
+           "many": "v != 0"},
+    "hr": {
+        "one": "v = 0 and i % 10 = 1 and i % 100 != 11 "
+               "or f % 10 = 1 and f % 100 != 11",
+        "few": "v = 0 and i % 10 = 2..4 and i % 100 != 12..14 "
+               "or f % 10 = 2..4 and f % 100 != 12..14",
+    },
+    "sr": {
+        "one": "v = 0 and i % 10 = 1 and i % 100 != 11 "
+               "or f % 10 = 1 and f % 100 != 11",
+        "few": "v = 0 and i % 10 = 2..4 and i % 100 != 12..14 "
+               "or f % 10 = 2..4 and f % 100 != 12..14",
+    },
+    "sl": {
+        "one": "v = 0 and i % 100 = 1",
+        "two": "v = 0 and i % 100 = 2",
+        "few": "v = 0 and i % 100 = 3..4 or v != 0",
+    },
+    "lt": {
+        "one": "n % 10 = 1 and n % 100 != 11..19",
+        "few": "n % 10 = 2..9 and n % 100 != 11..19",
+        "many": "f != 0",
+    },
+    "lv": {
+        "zero": "n % 10 = 0 or n % 100 = 11..19 "
+                "or v = 2 and f % 100 = 11..19",
+        "one": "n % 10 = 1 and n % 100 != 11 "
+               "or v = 2 and f % 10 = 1 and f % 100 != 11 "
+               "or v != 2 and f % 10 = 1",
+    },
+    "ro": {
+        "one": "i = 1 and v = 0",
+        "few": "v != 0 or n = 0 or n != 1 and n % 100 = 1..19",
+    },
+    "he": {"one": "i = 1 and v = 0 or i = 0 and v != 0",
+           "two": "i = 2 and v = 0"},
+    "ar": {
+        "zero": "n = 0", "one": "n = 1", "two": "n = 2",
+        "few": "n % 100 = 3..10", "many": "n % 100 = 11..99",
+    },
+    "ga": {"one": "n = 1", "two": "n = 2", "few": "n = 3..6",
+           "many": "n = 7..10"},
+    "cy": {"zero": "n = 0", "one": "n = 1", "two": "n = 2", "few": "n = 3",
+           "many": "n = 6"},
+    "ja": {}, "zh": {}, "ko": {}, "th": {}, "vi": {}, "id": {}, "ms": {},
+}
+
+# used for languages missing in PLURAL_RULES
+DEFAULT_LANGUAGE: str = "en"
+
+_TOKEN = re_compile(r"\s*(?:(\d+)|(\.\.)|(!=|=|%|,)|([a-z]+))")
+
+_compiled: Dict[str, Callable[[Any], str]] = {}
+
+
+def plural_operands(number: Any) -> Tuple[Any, int, int, int, int, int,
+                                          int, int]:
+    """Compute CLDR plural operands of number, visible fraction
+        digits are taken from its decimal representation, so "1.50"
+        and Decimal("1.50") have two of them and 1.5 has one.
+
+    Args:
+        number (Any): int, float, Decimal or numeric string
+
+    Return:
+        Tuple[Any, int, int, int, int, int, int, int]: n, i, v, f, t, w,
+                                                        e and c operands
+
+    Raises:
+        ValueError: if number is not finite number
+    """
+    if isinstance(number, int):
+        absolute: int = abs(int(number))
+        return absolute, absolute, 0, 0, 0, 0, 0, 0
+
+    try:
+        value: Decimal = abs(Decimal(str(number).strip()))
+    except InvalidOperation as error:
+        raise ValueError(f"{number!r} is not a number") from error
+
+    if not value.is_finite():
+        raise ValueError(f"{number!r} is not a finite number")
+
+    integer, _, fraction = format(value, "f").partition(".")
+    trimmed: str = fraction.rstrip("0")
+
+    return (value if fraction else int(integer), int(integer),
+            len(fraction), int(fraction or 0), int(trimmed or 0),
+            len(trimmed), 0, 0)
+
+
+def compile_rules(rules: Dict[str, str]) -> Callable[[Any], str]:
+    """Compile CLDR plural rules into function returning
+        plural category of count
+
+    Args:
+        rules (Dict[str, str]): category to CLDR rule condition,
+                                e.g. {"one": "i = 1 and v = 0"},
+                                "other" is used when none matches
+
+    Return:
+        Callable[[Any], str]: function of count, non-numeric counts
+                                are "other"
+
+    Raises:
+        ValueError: if category is unknown or rule can't be parsed
+    """
+    unknown: set = set(rules) - set(CATEGORIES)
+    if unknown:
+        raise ValueError(f"unknown plural categories {sorted(unknown)}")
+
+    lines: list = [
+        "def plural(count):",
+        "    if count.__class__ is int:",
+        "        n = i = -count if count < 0 else count",
+        "        v = f = t = w = e = c = 0",
+        "    else:",
+        "        try:",
+        "            n, i, v, f, t, w, e, c = operands(count)",
+        "        except (TypeError, ValueError):",
+        "            return 'other'",
+    ]
+    for category in CATEGORIES:
+        if category == "other" or category not in rules:
+            continue
+        lines.append(f"    if {_condition(rules[category])}:")
+        lines.append(f"        return {category!r}")
+    lines.append("    return 'other'")
+
+    namespace: dict = {"operands": plural_operands}
+    exec("\n".join(lines), namespace)  # pylint: disable=exec-used
+    return namespace["plural"]
+
+
+def plural_rule(locale: str) -> Callable[[Any], str]:
+    """Return compiled plural rule of locale, rules are compiled once
+        per language and shared. Locale is matched as it is
+        (e.g. "pt_PT"), then by its language ("pl" for "pl-PL"),
+        languages without known rules use DEFAULT_LANGUAGE rules.
+
+    Args:
+        locale (str): locale name
+
+    Return:
+        Callable[[Any], str]: function of count returning its category
+    """
+    normalized: str = locale.replace("-", "_")
+    language: str = split("[_-]", locale)[0].lower()
+    for name in (locale, normalized, language, DEFAULT_LANGUAGE):
+        if name in PLURAL_RULES:
+            break
+
+    try:
+        return _compiled[name]
+    except KeyError:
+        rule: Callable[[Any], str] = compile_rules(PLURAL_RULES[name])
+        return _compiled.setdefault(name, rule)
+
+
+def resolve_rule(
+    locale: str,
+    rule: Optional[Union[str, Dict[str, str], Callable]] = None
+) -> Callable[[Any], str]:
+    """Resolve plural rule configured for locale
+
+    Args:
+        locale (str): locale name
+        rule (Optional[Union[str, Dict[str, str], Callable]]): language
+                        whose rules locale uses, CLDR rules of locale
+                        or function of count, rules of locale by default
+
+    Return:
+        Callable[[Any], str]: function of count returning its category
+
+    Raises:
+        ValueError: if rules can't be compiled
+    """
+    if rule is None:
+        return plural_rule(locale)
+    if isinstance(rule, str):
+        return plural_rule(rule)
+    if isinstance(rule, dict):
+        return compile_rules(rule)
+
+    return rule
+
+
+def _condition(rule: str) -> str:
+    """translate CLDR condition into Python expression,
+        should not be called directly
+
+    Raises:
+        ValueError: if rule can't be parsed
+    """
+    tokens: list = []
+    position: int = 0
+    rule = rule.split("@")[0].strip()
+    while position < len(rule):
+        match = _TOKEN.match(rule, position)
+        if match is None:
+            raise ValueError(f"invalid plural rule {rule!r}")
+        tokens.append(next(token for token in match.groups() if token))
+        position = match.end()
+
+    if not tokens:
+        raise ValueError("empty plural rule")
+
+    conditions: list = []
+    relations: list = []
+    index: int = 0
+    while index < len(tokens):
+        relation, index = _relation(rule, tokens, index)
+        relations.append(relation)
+        if index == len(tokens) or tokens[index] == "or":
+            conditions.append(" and ".join(relations))
+            relations = []
+        elif tokens[index] != "and":
+            raise ValueError(f"invalid plural rule {rule!r}")
+        index += 1
+
+    if relations or tokens[-1] in ("and", "or"):
+        raise ValueError(f"invalid plural rule {rule!r}")
+
+    return " or ".join(conditions)
+
+
+def _relation(rule: str, tokens: list, index: int) -> Tuple[str, int]:
+    """translate single relation starting at token index,
+        should not be called directly
+
+    Return:
+        Tuple[str, int]: Python expression and index of next token
+
+    Raises:
+        ValueError: if relation can't be parsed
+    """
+    def take() -> str:
+        nonlocal index
+        if index == len(tokens):
+            raise ValueError(f"incomplete plural rule {rule!r}")
+        index += 1
+        return tokens[index - 1]
+
+    operand: str = take()
+    if operand not in OPERANDS:
+        raise ValueError(f"unknown operand {operand!r} in {rule!r}")
+
+    expression: str = operand
+    operator: str = take()
+    if operator == "%":
+        expression = f"({operand} % {int(take())})"
+        operator = take()
+    if operator not in ("=", "!="):
+        raise ValueError(f"invalid operator {operator!r} in {rule!r}")
+
+    alternatives: list = []
+    while True:
+        low: int = int(take())
+        if index < len(tokens) and tokens[index] == "..":
+            index += 1
+            high: int = int(take())
+            # n may be fractional, ranges match its integer values only
+            integral: str = f" and {expression} % 1 == 0" \
+                if operand == "n" else ""
+            alternatives.append(f"{low} <= {expression} <= {high}{integral}")
+        else:
+            alternatives.append(f"{expression} == {low}")
+
+        if index == len(tokens) or tokens[index] != ",":
+            break
+        index += 1
+
+    matched: str = " or ".join(alternatives)
+    if operator == "!=":
+        return f"not ({matched})", index
+
+    return f"({matched})", index
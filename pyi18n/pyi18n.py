@@ -4,15 +4,39 @@ for internationalization and localization in Python. It uses a loader to load
 translation files and provides a gettext method to retrieve translations for
 a specified locale and path.
 """
-from collections import defaultdict
-from typing import Optional, Union
+from asyncio import get_running_loop
+from collections import ChainMap
+from typing import Callable, Dict, Iterable, Mapping, Optional, Tuple, Union
 from operator import getitem
 from functools import reduce
-from os.path import exists
-from os import getcwd
+from os.path import basename, exists, getsize, splitext
+from os import getcwd, stat
+from threading import Lock
+from time import perf_counter
+from logging import warning
 
 from .loaders import PyI18nBaseLoader
 from .loaders import PyI18nYamlLoader
+from .helpers import LazyLocale, flatten, merge_translations
+from .frozen import FrozenCatalog, freeze_catalog
+from .interpolation import CompiledTemplate, compile_template
+from .metrics import PyI18nMetrics
+from .plurals import resolve_rule
+from .stats import deep_sizeof, section_stats, sum_stats
+from .views import PrefixIndex, TranslationView
+from .watcher import PyI18nWatcher
+
+
+class MissingPolicy:
+    """Enum for the missing translation policies."""
+
+    MESSAGE: str = "message"
+    KEY: str = "key"
+    RAISE: str = "raise"
+
+
+# returned by flat catalogs lookups when path doesn't exist
+_MISSING: object = object()
 
 
 class PyI18n:
@@ -20,9 +44,38 @@ class PyI18n:
 
     Attributes:
         available_locales (tuple): list of available locales
+        _available_locales (frozenset): available locales
+                                        for O(1) membership checks
         load_path (str): path to locales directory
+        flat_index (bool): resolve paths through precomputed
+                            dot-path index instead of nested dicts
         _loaded_translations (dict): (class attribute) dictionary
                                     of loaded translations
+        _flat_translations (dict): dot-path index per locale,
+                                    filled only when flat_index is set
+        _templates (dict): interpolation templates compiled lazily,
+                            keyed by catalog translation string,
+                            cleared on reload
+        lazy (bool): parse locale files on first use instead of
+                        at initialization
+        _pending (dict): lazy mode locks of locales registered
+                            but not loaded yet
+        _fingerprints (dict): mtime and size of source files
+                                per loaded locale, used by reload
+        _generation (int): incremented on every catalog swap
+        frozen (bool): locales are stored as immutable compact
+                        FrozenCatalog, nested dicts are dropped
+        _chains (dict): lookup chain per locale, the locale
+                        followed by its resolved fallbacks
+        on_missing (Union[str, Callable]): missing translation policy
+        _misses (dict): negative lookup cache, [result, lookups] of
+                        missing translations keyed by (locale, path),
+                        at most miss_cache_size most frequent ones
+        _metrics (Optional[PyI18nMetrics]): runtime metrics, None
+                                            when disabled
+        _plurals (dict): compiled plural rule per locale
+        _prefix_indexes (dict): sorted prefix index per locale,
+                                with catalog it was built from
 
     Examples:
         >>> from pyi18n import PyI18n
@@ -34,12 +87,21 @@ class PyI18n:
     """
 
     _loaded_translations: dict = {}
+    _flat_translations: dict = {}
 
     def __init__(
         self,
         available_locales: tuple,
         load_path: str = 'locales/',
-        loader: Optional[PyI18nBaseLoader] = None
+        loader: Optional[PyI18nBaseLoader] = None,
+        flat_index: bool = False,
+        lazy: bool = False,
+        frozen: bool = False,
+        fallbacks: Optional[dict] = None,
+        on_missing: Union[str, Callable] = MissingPolicy.MESSAGE,
+        miss_cache_size: int = 4096,
+        metrics: Union[bool, PyI18nMetrics] = False,
+        plural_rules: Optional[dict] = None
     ) -> None:
 
         """ Initialize i18n class
@@ -47,12 +109,79 @@ class PyI18n:
         Args:
             available_locales (tuple): list of available locales
             load_path (str): path to locales directory
+            loader (PyI18nBaseLoader): loader used to read translations
+            flat_index (bool): precompute dot-path index at load time,
+                                so gettext does a single dict lookup,
+                                always on for flat loaders
+            lazy (bool): register locales at initialization but parse
+                            them on first gettext for that locale
+            frozen (bool): store locales as FrozenCatalog, sorted
+                            tuples of keys and values, trades
+                            mutation for memory, implies flat_index,
+                            so lazy namespaces are parsed at once
+            fallbacks (dict): locale to fallback locale or tuple of
+                            them, e.g. {"pt_BR": "pt", "pt": "en"},
+                            chains are resolved transitively and
+                            merged into flat index at load time,
+                            implies flat_index, so lazy namespaces
+                            are parsed at once
+            on_missing (Union[str, Callable]): result of missing
+                            translations, "message" (default) returns
+                            "missing translation for: ..." message,
+                            "key" returns path, "raise" raises KeyError,
+                            callable(locale, path) returns its result
+            miss_cache_size (int): number of missing (locale, path)
+                            results cached and counted, the most
+                            frequent half is kept when cache is full
+            metrics (Union[bool, PyI18nMetrics]): enable runtime
+                            metrics from the start, so loading is
+                            measured as well, see enable_metrics
+            plural_rules (dict): locale to plural rule used by count
+                            interpolation variable, language whose CLDR
+                            rules locale uses (e.g. {"jp": "ja"}), dict
+                            of CLDR rules per category or callable(count)
+                            returning category, CLDR rules of locale
+                            language by default
 
         Return:
             None
+
+        Raises:
+            ValueError: if on_missing policy or plural rule is invalid
         """
 
         self.available_locales: tuple = available_locales
+        self._available_locales: frozenset = frozenset(available_locales)
+        self.flat_index: bool = flat_index
+        self.lazy: bool = lazy
+        self.frozen: bool = frozen
+        self.fallbacks: dict = {
+            locale: (chain,) if isinstance(chain, str) else tuple(chain)
+            for locale, chain in (fallbacks or {}).items()
+        }
+        self._chains: dict = {
+            locale: self.__chain(locale) for locale in available_locales
+        }
+        if not callable(on_missing) and on_missing not in (
+                MissingPolicy.MESSAGE, MissingPolicy.KEY, MissingPolicy.RAISE):
+            raise ValueError(f"unknown missing translation policy "
+                             f"{on_missing}, use message, key, raise "
+                             "or callable")
+
+        self.on_missing: Union[str, Callable] = on_missing
+        self.miss_cache_size: int = miss_cache_size
+        self._misses: dict = {}
+        self._metrics: Optional[PyI18nMetrics] = None
+        self._plurals: dict = {
+            locale: resolve_rule(locale, (plural_rules or {}).get(locale))
+            for locale in available_locales
+        }
+        self._templates: dict = {}
+        self._prefix_indexes: dict = {}
+        self._pending: dict = {}
+        self._fingerprints: dict = {}
+        self._generation: int = 0
+        self._swap_lock: Lock = Lock()
         self.load_path: str = f"{getcwd()}/{load_path}"
         self.loader: PyI18nBaseLoader = loader or PyI18nYamlLoader(
             self.load_path)
@@ -60,6 +189,14 @@ class PyI18n:
         self.load_path: str = self.loader.get_path() if self.loader.get_path(
         ) != self.load_path else self.load_path
 
+        # flat loaders return dot-path catalogs, use them as index directly
+        self.flat_index = self.flat_index or self.loader.flat \
+            or self.frozen or bool(self.fallbacks)
+
+        if metrics:
+            self.enable_metrics(
+                metrics if isinstance(metrics, PyI18nMetrics) else None)
+
         self.__pyi18n_init()
 
     def __pyi18n_init(self) -> None:
@@ -71,18 +208,448 @@ class PyI18n:
 
         """
 
-        if not self.available_locales:
+        if not self._available_locales:
             raise ValueError("available locales must be specified")
 
+        for chain in self.fallbacks.values():
+            for fallback in chain:
+                if fallback not in self._available_locales:
+                    raise ValueError(f"fallback locale {fallback} not "
+                                     "specified in available locales")
+
         if not exists(self.load_path):
             raise FileNotFoundError(f"{self.load_path} directory "
                                     "not found, please create it")
 
-        self._loaded_translations: dict = self.loader.load(
-                                            self.available_locales)
+        if self.lazy:
+            self._loaded_translations: dict = {}
+            self._flat_translations: dict = {}
+            self._pending: dict = {
+                locale: Lock() for locale in self.available_locales
+                if any(map(self.loader.has_locale, self._chains[locale]))
+            }
+            return
+
+        self.__install(self.loader.load(self.available_locales))
+
+    def __install(self, loaded: dict) -> None:
+        """ set eagerly loaded translations, build flat index
+            and record source fingerprints
+
+        Args:
+            loaded (dict): translations returned by loader
+
+        """
+        self._loaded_translations: dict = loaded
+
+        if self.flat_index:
+            self._flat_translations: dict = {}
+            for locale in self.available_locales:
+                catalog: Optional[Mapping] = self.__effective(locale, loaded)
+                if catalog is not None:
+                    self._flat_translations[locale] = catalog
+
+        if self.frozen:
+            self._loaded_translations = {
+                locale: self.__frozen(locale, loaded, self._flat_translations)
+                for locale in loaded
+            }
+
+        self._fingerprints: dict = {
+            locale: self.__fingerprint(locale)
+            for locale in self.available_locales
+        }
+        self._pending: dict = {}
+
+    @classmethod
+    async def create_async(
+        cls,
+        available_locales: tuple,
+        load_path: str = 'locales/',
+        loader: Optional[PyI18nBaseLoader] = None,
+        flat_index: bool = False,
+        lazy: bool = False,
+        frozen: bool = False,
+        fallbacks: Optional[dict] = None,
+        on_missing: Union[str, Callable] = MissingPolicy.MESSAGE,
+        miss_cache_size: int = 4096,
+        metrics: Union[bool, PyI18nMetrics] = False,
+        plural_rules: Optional[dict] = None
+    ) -> 'PyI18n':
+        """ Create i18n instance without blocking event loop,
+            locales are loaded concurrently with loader.load_async
+            and flat index is built in executor
+
+        Args:
+            available_locales (tuple): list of available locales
+            load_path (str): path to locales directory
+            loader (PyI18nBaseLoader): loader used to read translations
+            flat_index (bool): precompute dot-path index at load time
+            lazy (bool): register locales only, parse them on first use
+            frozen (bool): store locales as FrozenCatalog
+            fallbacks (dict): locale to fallback locales
+            on_missing (Union[str, Callable]): missing translation policy
+            miss_cache_size (int): number of missing results cached
+            metrics (Union[bool, PyI18nMetrics]): enable runtime metrics
+            plural_rules (dict): locale to plural rule
+
+        Returns:
+            PyI18n: initialized instance, same as created with constructor
+
+        Raises:
+            ValueError: if on_missing policy or plural rule is invalid
+
+        """
+        i18n: PyI18n = cls(available_locales, load_path, loader,
+                           flat_index, lazy=True, frozen=frozen,
+                           fallbacks=fallbacks, on_missing=on_missing,
+                           miss_cache_size=miss_cache_size, metrics=metrics,
+                           plural_rules=plural_rules)
+        if lazy:
+            return i18n
+
+        loaded: dict = await i18n.loader.load_async(i18n.available_locales)
+        await get_running_loop().run_in_executor(None, i18n.__install, loaded)
+        i18n.lazy = False
+
+        return i18n
+
+    def __fingerprint(self, locale: str) -> dict:
+        """ mtime and size of locale source files
+
+        Args:
+            locale (str): locale to get fingerprint for
+
+        Returns:
+            dict: source file path to (mtime_ns, size)
+
+        """
+        fingerprint: dict = {}
+        for path in self.loader.sources(locale):
+            try:
+                stats = stat(path)
+            except FileNotFoundError:
+                continue
+            fingerprint[path] = (stats.st_mtime_ns, stats.st_size)
+
+        return fingerprint
+
+    def reload(self, changed_only: bool = True) -> tuple:
+        """ Reload translations through the loader
+
+        Source files are compared by mtime and size with ones recorded
+        at load time, only locales with changed files are loaded again
+        (namespaced built-in loaders re-parse only changed namespaces).
+        New catalogs are published with single reference swap, so
+        concurrent gettext calls never see partially updated state.
+        Locales registered in lazy mode, but not used yet, are skipped.
+
+        Args:
+            changed_only (bool): reload only locales with changed files,
+                                    reload every loaded locale otherwise
+
+        Returns:
+            tuple: reloaded locales
+
+        """
+        with self._swap_lock:
+            changed, fingerprints = self.__changed_sources(changed_only)
+            if not changed:
+                return ()
+
+            loaded: dict = self.__reload_locales(changed, fingerprints)
+            flat: dict = self.__rebuild_indexes(changed, loaded)
+
+            self._fingerprints = {**self._fingerprints, **fingerprints}
+            self._loaded_translations = loaded
+            self._flat_translations = flat
+            # results may differ for new catalogs, counts are kept
+            self._misses = {
+                key: [_MISSING, entry[1]]
+                for key, entry in self._misses.items()}
+            # strings of replaced catalogs are not looked up anymore
+            self._templates = {}
+            self._generation += 1
+
+        return tuple(changed)
+
+    def __changed_sources(self, changed_only: bool) -> Tuple[dict, dict]:
+        """ find loaded locales with changed source files
+
+        Args:
+            changed_only (bool): skip locales with unchanged files
+
+        Returns:
+            Tuple[dict, dict]: locale to its changed files
+                                and locale to its new fingerprint
+
+        """
+        changed: dict = {}
+        fingerprints: dict = {}
+        for locale in self.available_locales:
+            # fallbacks of lazily loaded locales are loaded
+            # before they are used themselves
+            if locale in self._pending and \
+                    locale not in self._loaded_translations:
+                continue
+
+            current: dict = self.__fingerprint(locale)
+            previous: dict = self._fingerprints.get(locale, {})
+            if changed_only and current == previous:
+                continue
+
+            changed[locale] = tuple(
+                path for path in current
+                if current[path] != previous.get(path)
+            ) if changed_only else tuple(current)
+            fingerprints[locale] = current
+
+        return changed, fingerprints
+
+    def __reload_locales(self, changed: dict, fingerprints: dict) -> dict:
+        """ load changed locales through the loader, locales which
+            couldn't be loaded keep previous translations
+
+        Args:
+            changed (dict): locale to its changed files
+            fingerprints (dict): locale to its new fingerprint
+
+        Returns:
+            dict: new raw translations per locale
+
+        """
+        # frozen catalogs can't be patched per namespace
+        reloaded: dict = self.loader.load(tuple(changed)) \
+            if self.frozen else self.loader.reload(
+                self._loaded_translations, changed)
+
+        loaded: dict = dict(self._loaded_translations)
+        for locale in changed:
+            if locale in reloaded:
+                loaded[locale] = reloaded[locale]
+            elif locale in loaded and fingerprints[locale]:
+                warning(f"locale {locale} couldn't be reloaded, "
+                        "keeping previous translations")
+            else:
+                loaded.pop(locale, None)
+
+        return loaded
+
+    def __rebuild_indexes(self, changed: dict, loaded: dict) -> dict:
+        """ rebuild lookup catalogs of locales whose fallback chain
+            changed, changed locales are frozen again in frozen mode
+
+        Args:
+            changed (dict): locale to its changed files
+            loaded (dict): new raw translations, frozen in place
+
+        Returns:
+            dict: new lookup catalogs per locale
+
+        """
+        flat: dict = dict(self._flat_translations)
+        for locale in self.available_locales if self.flat_index else ():
+            if locale in self._pending or \
+                    changed.keys().isdisjoint(self._chains[locale]):
+                continue
+
+            catalog: Optional[Mapping] = self.__effective(locale, loaded)
+            if catalog is None:
+                flat.pop(locale, None)
+            else:
+                flat[locale] = catalog
+
+        for locale in changed if self.frozen else ():
+            if locale in loaded and locale not in self._pending:
+                loaded[locale] = self.__frozen(locale, loaded, flat)
+
+        return flat
+
+    def watch(self, interval: float = 1.0) -> 'PyI18nWatcher':
+        """ Start background thread reloading changed files
+
+        Args:
+            interval (float): seconds between polls
+
+        Returns:
+            PyI18nWatcher: started watcher, call stop() to finish it
+
+        """
+        watcher: PyI18nWatcher = PyI18nWatcher(self, interval)
+        watcher.start()
+        return watcher
+
+    def freeze(self) -> None:
+        """ Convert loaded locales into immutable FrozenCatalog,
+            locales loaded later (lazy mode, reload) are frozen as well.
+            Nested dicts are released, subtree lookups still return views.
+
+        """
+        with self._swap_lock:
+            if self.frozen:
+                return
+
+            self.frozen = True
+            loaded: dict = self._loaded_translations
+            flat: dict = {}
+            for locale in self.available_locales:
+                catalog: Optional[Mapping] = None \
+                    if locale in self._pending \
+                    else self.__effective(locale, loaded)
+                if catalog is not None:
+                    flat[locale] = catalog
+
+            loaded = {
+                locale: self.__frozen(locale, loaded, flat)
+                if locale in flat else content
+                for locale, content in loaded.items()
+            }
+
+            # nested lookups work on frozen catalogs too, so concurrent
+            # gettext is correct whichever flag and dict it reads first
+            self._flat_translations = flat
+            self._loaded_translations = loaded
+            self.flat_index = True
+            self._generation += 1
+
+    def __chain(self, locale: str) -> tuple:
+        """ resolve fallback chain of locale, depth first,
+            each locale appears once
+
+        Args:
+            locale (str): locale to resolve chain for
+
+        Returns:
+            tuple: locale followed by its fallbacks
+
+        """
+        chain: list = []
+        stack: list = [locale]
+        while stack:
+            current: str = stack.pop()
+            if current in chain:
+                continue
+
+            chain.append(current)
+            stack.extend(reversed(self.fallbacks.get(current, ())))
+
+        return tuple(chain)
+
+    def __effective(self, locale: str, loaded: dict) -> Optional[Mapping]:
+        """ build lookup catalog of locale overlaid on its fallbacks,
+            so fallback hits cost single lookup as well
+
+        Args:
+            locale (str): locale to build catalog for
+            loaded (dict): raw translations per locale
+
+        Returns:
+            Optional[Mapping]: dot-path index, None if neither locale
+                                nor its fallbacks have translations
+
+        """
+        contents: list = [
+            loaded[member] for member in self._chains[locale]
+            if member in loaded
+        ]
+        if not contents:
+            return None
+
+        if len(contents) == 1:
+            return self.__index(contents[0])
+
+        # flat loaders catalogs aren't materialized, misses in locale
+        # fall through to fallbacks instead
+        if self.loader.flat:
+            return ChainMap(*contents)
 
-    def gettext(self, locale: str, path: str, **kwargs) -> Union[dict, str]:
-        """ Get translation for given locale and path
+        return self.__index(merge_translations(*reversed(contents)))
+
+    def __frozen(self, locale: str, loaded: dict, flat: dict) -> Mapping:
+        """ frozen translations of locale, shares lookup catalog
+            when no fallback was merged into it
+
+        Args:
+            locale (str): locale to freeze
+            loaded (dict): raw translations per locale
+            flat (dict): lookup catalogs per locale
+
+        Returns:
+            Mapping: frozen translations
+
+        """
+        if all(member == locale for member in self._chains[locale]
+               if member in loaded):
+            return flat[locale]
+
+        return freeze_catalog(loaded[locale])
+
+    def __index(self, content: dict) -> dict:
+        """ build dot-path index for locale content,
+            flat loaders content is already indexed
+
+        Args:
+            content (dict): locale content returned by loader
+
+        Returns:
+            dict: dot-path index, FrozenCatalog in frozen mode
+
+        """
+        if self.loader.flat:
+            return content
+
+        return freeze_catalog(content) if self.frozen else flatten(content)
+
+    def __load_locale(self, locale: str) -> None:
+        """ load single registered locale in lazy mode,
+            concurrent callers wait and the file is parsed only once
+
+        Args:
+            locale (str): locale to load
+
+        """
+        lock: Optional[Lock] = self._pending.get(locale)
+        if lock is None:
+            return
+
+        with lock:
+            if locale not in self._pending:
+                return
+
+            missing: tuple = tuple(
+                member for member in self._chains[locale]
+                if member not in self._loaded_translations
+            )
+            loaded: dict = self.loader.load(missing) if missing else {}
+            fingerprints: dict = {
+                member: self.__fingerprint(member) for member in missing
+            }
+
+            with self._swap_lock:
+                translations: dict = self._loaded_translations
+                for member in missing:
+                    if member in loaded:
+                        translations.setdefault(member, loaded[member])
+                    self._fingerprints.setdefault(member, fingerprints[member])
+
+                catalog: Optional[Mapping] = self.__effective(
+                    locale, translations) if self.flat_index else None
+                if catalog is not None:
+                    self._flat_translations[locale] = catalog
+                if self.frozen and locale in translations:
+                    translations[locale] = self.__frozen(
+                        locale, translations, self._flat_translations)
+
+                del self._pending[locale]
+
+    def gettext(
+        self,
+        locale: str,
+        path: str,
+        **kwargs
+    ) -> Union[TranslationView, str]:
+        """ Get translation for given locale and path,
+            subtrees are returned as read-only TranslationView
 
         Args:
             locale (str): locale to get translation for
@@ -90,42 +657,608 @@ class PyI18n:
             **kwargs (dict): interpolation variables
 
         Returns:
-            Union[dict, str]: translation str, dict or error message
+            Union[TranslationView, str]: translation str,
+                                            view or error message
 
         Raises:
             ValueError: if locale is not in self.available_locales
+            KeyError: if translation is missing and on_missing is "raise"
 
         """
 
-        if locale not in self.available_locales:
+        if locale not in self._available_locales:
             raise ValueError(f"locale {locale} not specified "
                              "in available locales")
 
-        founded: Union[dict, str] = self.__find(path, locale)
+        return self._translate(locale, self.__catalog(locale), path, kwargs)
+
+    def gettext_many(
+        self,
+        locale: str,
+        paths: Union['PyI18nKeySet', Iterable[str]],
+        **kwargs
+    ) -> Dict[str, Union[dict, str]]:
+        """ Get translations for many paths in given locale at once
+
+        Locale is validated once and interpolation variables are
+        shared between all translations.
+
+        Args:
+            locale (str): locale to get translations for
+            paths (Union[PyI18nKeySet, Iterable[str]]): paths to translations,
+                                        pass PyI18nKeySet to reuse it
+                                        across calls
+            **kwargs (dict): interpolation variables
+
+        Returns:
+            Dict[str, Union[dict, str]]: translations keyed by path
+
+        Raises:
+            ValueError: if locale is not in self.available_locales
+            KeyError: if translation is missing and on_missing is "raise"
+
+        """
+
+        if locale not in self._available_locales:
+            raise ValueError(f"locale {locale} not specified "
+                             "in available locales")
+
+        keys: PyI18nKeySet = paths if isinstance(paths, PyI18nKeySet) \
+            else PyI18nKeySet(paths)
+        catalog: dict = self.__catalog(locale)
+
+        if 'count' in kwargs:
+            category: str = self._plurals[locale](kwargs['count'])
+            founded: dict = {
+                path: self.__find_plural(catalog, locale, path, category)
+                for path in keys.paths
+            }
+        elif self.flat_index:
+            founded: dict = {
+                path: catalog.get(path, _MISSING) for path in keys.paths}
+            for path, value in founded.items():
+                if value is _MISSING:
+                    founded[path] = self.__missing(locale, path)
+        else:
+            founded: dict = {
+                path: self.__find_segments(catalog, locale, path, segments)
+                for path, segments in zip(keys.paths, keys.segments)
+            }
+
+        for path, value in founded.items():
+            if value.__class__ is dict:
+                founded[path] = TranslationView(value)
+            elif kwargs and isinstance(value, str):
+                founded[path] = self.__template(
+                    locale, path, value).render(kwargs)
 
-        if len(kwargs) > 0 and isinstance(founded, str):
-            try:
-                return founded.format_map(defaultdict(str, **kwargs))
-            except KeyError:
-                return founded
         return founded
 
-    def __find(self, path: str, locale: str) -> Union[dict, str]:
-        """ Find translation for given path and locale
+    def for_locale(self, locale: str) -> 'PyI18nTranslator':
+        """ Return translator bound to given locale
+
+        Locale is validated once here, translator holds a direct
+        reference to the locale catalog and skips validation per call.
+
+        Args:
+            locale (str): locale to bind translator to
+
+        Returns:
+            PyI18nTranslator: translator for given locale
+
+        Raises:
+            ValueError: if locale is not in self.available_locales
+
+        """
+
+        if locale not in self._available_locales:
+            raise ValueError(f"locale {locale} not specified "
+                             "in available locales")
+
+        return PyI18nTranslator(self, locale, self.__catalog(locale))
+
+    def subtree(self, locale: str, path: str = "") -> Union[Mapping, str]:
+        """ Get subtree of translations from sorted prefix index,
+            nothing is copied, so whole UI sections can be passed
+            around cheaply (use to_dict to serialize them)
 
         Args:
+            locale (str): locale to get subtree for
+            path (str): dot-separated path, whole locale by default
+
+        Returns:
+            Union[Mapping, str]: read-only SubtreeView, translation
+                                    when path is a leaf or missing result
+
+        Raises:
+            ValueError: if locale is not in self.available_locales
+            KeyError: if path is missing and on_missing is "raise"
+
+        """
+        try:
+            return self.__prefix_index(locale).find(path)
+        except KeyError:
+            return self.__missing(locale, path)
+
+    def keys_with_prefix(self, locale: str, prefix: str) -> Tuple[str, ...]:
+        """ Get leaf paths starting with prefix from sorted prefix index,
+            prefix is matched as string, "errors.valid" matches
+            "errors.validation.email" as well
+
+        Args:
+            locale (str): locale to get paths for
+            prefix (str): prefix of paths
+
+        Returns:
+            Tuple[str, ...]: sorted leaf paths
+
+        Raises:
+            ValueError: if locale is not in self.available_locales
+
+        """
+        return self.__prefix_index(locale).keys_with_prefix(prefix)
+
+    def __prefix_index(self, locale: str) -> PrefixIndex:
+        """ Return prefix index of locale, built on first use
+            and again after its catalog was swapped
+
+        Args:
+            locale (str): locale to get index for
+
+        Returns:
+            PrefixIndex: index of locale lookup catalog
+
+        Raises:
+            ValueError: if locale is not in self.available_locales
+
+        """
+        if locale not in self._available_locales:
+            raise ValueError(f"locale {locale} not specified "
+                             "in available locales")
+
+        catalog: Mapping = self.__catalog(locale)
+        cached: Optional[tuple] = self._prefix_indexes.get(locale)
+        if cached is not None and cached[0] is catalog:
+            return cached[1]
+
+        index: PrefixIndex = PrefixIndex(catalog, self.flat_index)
+        self._prefix_indexes[locale] = (catalog, index)
+        return index
+
+    def _translate(
+        self,
+        locale: str,
+        catalog: dict,
+        path: str,
+        kwargs: dict
+    ) -> Union[dict, str]:
+        """ Resolve and interpolate translation from already
+            validated locale catalog
+
+        Args:
+            locale (str): locale catalog belongs to
+            catalog (dict): locale catalog, nested or flat index
             path (str): path to translation
-            locale (str): locale to get translation for
+            kwargs (dict): interpolation variables
 
         Returns:
             Union[dict, str]: translation str, dict or error message
 
+        """
+        if 'count' in kwargs:
+            founded: Union[dict, str] = self.__find_plural(
+                catalog, locale, path, self._plurals[locale](kwargs['count']))
+        else:
+            founded: Union[dict, str] = self.__find(catalog, locale, path)
+
+        if kwargs and isinstance(founded, str):
+            return self.__template(locale, path, founded).render(kwargs)
+        if founded.__class__ is dict:
+            # shared with every caller, must not be mutated
+            return TranslationView(founded)
+        return founded
+
+    def __catalog(self, locale: str) -> dict:
+        """ Return catalog used for lookups in given locale,
+            in lazy mode locale is loaded on first call
+
+        Args:
+            locale (str): locale to get catalog for
+
+        Returns:
+            dict: flat index when enabled, nested translations otherwise,
+                    empty dict if locale wasn't loaded
+
+        """
+        catalogs: dict = self._flat_translations if self.flat_index \
+            else self._loaded_translations
+
+        try:
+            return catalogs[locale]
+        except KeyError:
+            if locale not in self._pending:
+                return {}
+
+        self.__load_locale(locale)
+        catalogs = self._flat_translations if self.flat_index \
+            else self._loaded_translations
+
+        return catalogs.get(locale, {})
+
+    def __template(
+        self,
+        locale: str,
+        path: str,
+        text: str
+    ) -> CompiledTemplate:
+        """ Return compiled template for translation string,
+            compiles it on first use. Only catalog strings are cached,
+            missing results differ per path and are compiled each time
+
+        Args:
+            locale (str): locale translation was looked up in
+            path (str): path translation was looked up by
+            text (str): translation string
+
+        Returns:
+            CompiledTemplate: compiled template
+
+        """
+        try:
+            return self._templates[text]
+        except KeyError:
+            template: CompiledTemplate = compile_template(text)
+            entry: Optional[list] = self._misses.get((locale, path))
+            if entry is not None and entry[0] is text:
+                return template
+            self._templates[text] = template
+            return template
+
+    def __find(self, catalog: dict, locale: str, path: str) -> Union[dict, str]:
+        """ Find translation for given path in locale catalog
+
+        Args:
+            catalog (dict): locale catalog, nested or flat index
+            locale (str): locale to get translation for
+            path (str): path to translation
+
+        Returns:
+            Union[dict, str]: translation str, dict or missing result
+
+        """
+        if self.flat_index:
+            founded = catalog.get(path, _MISSING)
+            return self.__missing(locale, path) if founded is _MISSING \
+                else founded
+
+        try:
+            return reduce(getitem, path.split('.'), catalog)
+        except (KeyError, TypeError):
+            return self.__missing(locale, path)
+
+    def __find_plural(
+        self,
+        catalog: dict,
+        locale: str,
+        path: str,
+        category: str
+    ) -> Union[dict, str]:
+        """ Find plural form of translation, path subkey named
+            after plural category, "other" subkey when category
+            is missing or translation itself when it has no forms
+
+        Args:
+            catalog (dict): locale catalog, nested or flat index
+            locale (str): locale to get translation for
+            path (str): path to translation
+            category (str): plural category of count
+
+        Returns:
+            Union[dict, str]: translation str, dict or missing result
+
+        """
+        if self.flat_index:
+            founded = catalog.get(f"{path}.{category}", _MISSING)
+            if founded is _MISSING:
+                founded = catalog.get(f"{path}.other", _MISSING)
+            return self.__find(catalog, locale, path) \
+                if founded is _MISSING else founded
+
+        founded = self.__find(catalog, locale, path)
+        if isinstance(founded, dict):
+            return founded.get(category, founded.get('other', founded))
+        return founded
+
+    def __find_segments(
+        self,
+        catalog: dict,
+        locale: str,
+        path: str,
+        segments: tuple
+    ) -> Union[dict, str]:
+        """ Find translation for already split path in nested catalog
+
+        Args:
+            catalog (dict): nested locale catalog
+            locale (str): locale to get translation for
+            path (str): path to translation
+            segments (tuple): path split by dots
+
+        Returns:
+            Union[dict, str]: translation str, dict or missing result
+
         """
         try:
-            return reduce(getitem, path.split('.'),
-                          self._loaded_translations[locale])
+            return reduce(getitem, segments, catalog)
         except (KeyError, TypeError):
-            return f"missing translation for: {locale}.{path}"
+            return self.__missing(locale, path)
+
+    def __missing(self, locale: str, path: str) -> object:
+        """ count missing translation and return result of on_missing
+            policy, results are cached per (locale, path)
+
+        Args:
+            locale (str): locale translation is missing in
+            path (str): path to translation
+
+        Returns:
+            object: message, path or result of on_missing callable
+
+        Raises:
+            KeyError: if on_missing is "raise"
+
+        """
+        try:
+            entry: list = self._misses[(locale, path)]
+        except KeyError:
+            entry: list = self.__miss_entry(locale, path)
+
+        entry[1] += 1
+        founded: object = entry[0]
+        if founded is _MISSING:
+            founded = entry[0] = self.__missing_result(locale, path)
+
+        if self._metrics is not None:
+            self._metrics.record_miss(locale)
+
+        if self.on_missing == MissingPolicy.RAISE:
+            raise KeyError(founded)
+
+        return founded
+
+    def __miss_entry(self, locale: str, path: str) -> list:
+        """ Add entry of first miss of (locale, path) to negative
+            lookup cache, keeping the most frequent half when full
+
+        Args:
+            locale (str): locale translation is missing in
+            path (str): path to translation
+
+        Returns:
+            list: [result, lookups] entry, result is not resolved yet
+
+        """
+        misses: dict = self._misses
+        if len(misses) >= self.miss_cache_size:
+            frequent: list = sorted(
+                misses.items(), key=lambda item: item[1][1],
+                reverse=True)[:self.miss_cache_size // 2]
+            misses = self._misses = dict(frequent)
+
+        entry: list = [_MISSING, 0]
+        misses[(locale, path)] = entry
+        return entry
+
+    def __missing_result(self, locale: str, path: str) -> object:
+        """ Return result of on_missing policy for missing translation
+
+        Args:
+            locale (str): locale translation is missing in
+            path (str): path to translation
+
+        Returns:
+            object: message, path or result of on_missing callable
+
+        """
+        if callable(self.on_missing):
+            return self.on_missing(locale, path)
+        if self.on_missing == MissingPolicy.KEY:
+            return path
+        return f"missing translation for: {locale}.{path}"
+
+    def enable_metrics(
+        self,
+        metrics: Optional[PyI18nMetrics] = None
+    ) -> PyI18nMetrics:
+        """ Start collecting runtime metrics
+
+        Instrumented lookups are installed as instance attributes
+        shadowing _translate and gettext_many, so instances without
+        metrics run the same code as before. Loader without own
+        metrics records file load times into the same collector.
+
+        Args:
+            metrics (Optional[PyI18nMetrics]): collector to use,
+                                                new one by default
+
+        Returns:
+            PyI18nMetrics: enabled collector
+
+        """
+        self._metrics = metrics or PyI18nMetrics()
+        self._translate = self.__translate_measured
+        self.gettext_many = self.__gettext_many_measured
+
+        if getattr(self.loader, 'metrics', None) is None:
+            self.loader.metrics = self._metrics
+
+        return self._metrics
+
+    def disable_metrics(self) -> None:
+        """ Stop collecting runtime metrics and restore
+            uninstrumented lookups
+
+        """
+        self.__dict__.pop('_translate', None)
+        self.__dict__.pop('gettext_many', None)
+
+        if self._metrics is not None and \
+                getattr(self.loader, 'metrics', None) is self._metrics:
+            self.loader.metrics = None
+
+        self._metrics = None
+
+    def stats(self) -> dict:
+        """ Return snapshot of runtime metrics
+
+        Returns:
+            dict: metrics snapshot, see PyI18nMetrics.snapshot,
+                    empty when metrics are disabled
+
+        """
+        return {} if self._metrics is None else self._metrics.snapshot()
+
+    def __translate_measured(
+        self,
+        locale: str,
+        catalog: dict,
+        path: str,
+        kwargs: dict
+    ) -> Union[dict, str]:
+        """ _translate recording metrics, installed by enable_metrics """
+        metrics: PyI18nMetrics = self._metrics
+        metrics.record_lookup(locale)
+
+        if metrics.sample():
+            start: float = perf_counter()
+            founded = type(self)._translate(self, locale, catalog, path, kwargs)
+            metrics.record_latency(locale, path, perf_counter() - start)
+        else:
+            founded = type(self)._translate(self, locale, catalog, path, kwargs)
+
+        if kwargs and isinstance(founded, str):
+            metrics.record_interpolation(locale)
+
+        return founded
+
+    def __gettext_many_measured(
+        self,
+        locale: str,
+        paths: Union['PyI18nKeySet', Iterable[str]],
+        **kwargs
+    ) -> Dict[str, Union[dict, str]]:
+        """ gettext_many recording metrics, installed by enable_metrics """
+        metrics: PyI18nMetrics = self._metrics
+        founded: dict = type(self).gettext_many(self, locale, paths, **kwargs)
+        metrics.record_lookup(locale, len(founded))
+
+        if kwargs:
+            for value in founded.values():
+                if isinstance(value, str):
+                    metrics.record_interpolation(locale)
+
+        return founded
+
+    def memory_report(self, measure_parse: bool = False) -> dict:
+        """ Report footprint of loaded locales and their namespaces
+
+        Objects shared between locales (interned keys, deduplicated
+        values) are counted for the first locale using them. Locales
+        registered in lazy mode, but not used yet, are skipped, so are
+        namespaces not parsed yet.
+
+        Args:
+            measure_parse (bool): parse source files again with every
+                                    installed parser backend and report
+                                    parse times
+
+        Returns:
+            dict: "locales" with files, size, keys, depth, memory and
+                    parse_seconds per locale (see stats.section_stats),
+                    "namespaces" per locale of namespaced loaders and
+                    "index_memory" of flat index, "total" with size,
+                    keys and memory of all locales
+
+        """
+        fmt: Optional[str] = self.loader.type if measure_parse else None
+        loaded: dict = self._loaded_translations
+        flat: dict = self._flat_translations if self.flat_index else {}
+        seen: set = set()
+        sources: set = set()
+        locales: dict = {}
+
+        for locale in self.available_locales:
+            if locale not in loaded:
+                continue
+
+            files: tuple = self.loader.sources(locale)
+            sources.update(files)
+            if self.loader.namespaced and not self.loader.flat:
+                by_name: dict = {
+                    splitext(basename(path))[0]: path for path in files}
+                namespaces: dict = {
+                    namespace: section_stats(
+                        body, tuple(filter(None, (by_name.get(namespace),))),
+                        fmt, seen)
+                    for namespace, body in self.__namespaces(loaded[locale])
+                }
+                report: dict = sum_stats(namespaces.values())
+                report["namespaces"] = namespaces
+                # locale container itself, namespaces are already counted
+                report["memory"] += deep_sizeof(loaded[locale], seen)
+            else:
+                report: dict = section_stats(
+                    loaded[locale], files, fmt, seen, self.loader.flat)
+
+            report["index_memory"] = deep_sizeof(flat[locale], seen) \
+                if locale in flat else 0
+            locales[locale] = report
+
+        return {
+            "locales": locales,
+            "total": {
+                "size": sum(getsize(path) for path in sources),
+                "keys": sum(report["keys"] for report in locales.values()),
+                "memory": sum(
+                    report["memory"] + report["index_memory"]
+                    for report in locales.values()),
+            },
+        }
+
+    @staticmethod
+    def __namespaces(content: Mapping) -> Iterable[Tuple[str, object]]:
+        """ namespaces of locale already in memory
+
+        Args:
+            content (Mapping): translations of namespaced locale
+
+        Returns:
+            Iterable[Tuple[str, object]]: namespace and its translations
+
+        """
+        if isinstance(content, FrozenCatalog):
+            return content.children()
+        if isinstance(content, LazyLocale):
+            return ((namespace, content[namespace])
+                    for namespace in content.loaded_namespaces)
+
+        return content.items()
+
+    def missing_translations(self) -> Dict[Tuple[str, str], int]:
+        """ Return how many times missing translations were looked up,
+            counts are bounded by miss_cache_size, rare misses are
+            dropped first
+
+        Returns:
+            Dict[Tuple[str, str], int]: lookups per (locale, path),
+                                        most frequent first
+
+        """
+        # sort is stable, equally frequent misses keep first seen order
+        return {
+            key: entry[1] for key, entry in sorted(
+                self._misses.items(), key=lambda item: item[1][1],
+                reverse=True)}
 
     def get_loader(self) -> PyI18nBaseLoader:
         """ Return loader class
@@ -135,3 +1268,92 @@ class PyI18n:
 
         """
         return self.loader
+
+
+class PyI18nTranslator:
+    """ Translator bound to a single locale
+
+    Created by PyI18n.for_locale, useful when locale is known up front
+    (e.g. once per web request) and validation per call is a waste.
+
+    Attributes:
+        i18n (PyI18n): instance translator was created from
+        locale (str): bound locale
+
+    Examples:
+        >>> translator = pyi18n.for_locale("en")
+        >>> translator.t("hello.world")
+        'Hello, world!'
+    """
+
+    __slots__ = ('i18n', 'locale', '_catalog', '_generation')
+
+    def __init__(self, i18n: PyI18n, locale: str, catalog: dict) -> None:
+        """ Initialize translator, use PyI18n.for_locale instead
+
+        Args:
+            i18n (PyI18n): instance translator is created from
+            locale (str): already validated locale
+            catalog (dict): locale catalog
+
+        Return:
+            None
+        """
+        self.i18n: PyI18n = i18n
+        self.locale: str = locale
+        self._catalog: dict = catalog
+        self._generation: int = i18n._generation
+
+    def t(self, path: str, **kwargs) -> Union[dict, str]:
+        """ Get translation for given path in bound locale,
+            catalog is re-bound after PyI18n.reload swapped it
+
+        Args:
+            path (str): path to translation
+            **kwargs (dict): interpolation variables
+
+        Returns:
+            Union[dict, str]: translation str, dict or error message
+
+        """
+        i18n: PyI18n = self.i18n
+        if self._generation != i18n._generation:
+            self._generation = i18n._generation
+            self._catalog = i18n.for_locale(self.locale)._catalog
+
+        return i18n._translate(self.locale, self._catalog, path, kwargs)
+
+
+class PyI18nKeySet:
+    """ Precomputed set of translation paths for PyI18n.gettext_many
+
+    Paths are split once, so the same key set can be reused
+    across requests (e.g. all keys used by one template).
+
+    Attributes:
+        paths (tuple): paths to translations, duplicates removed
+        segments (tuple): each path split by dots
+
+    Examples:
+        >>> keys = PyI18nKeySet(("hello.world", "hello.hello_user"))
+        >>> pyi18n.gettext_many("en", keys, user="John")
+        {'hello.world': 'Hello, world!', 'hello.hello_user': 'Hello John!'}
+    """
+
+    __slots__ = ('paths', 'segments')
+
+    def __init__(self, paths: Iterable[str]) -> None:
+        """ Initialize key set
+
+        Args:
+            paths (Iterable[str]): paths to translations
+
+        Return:
+            None
+        """
+        self.paths: tuple = tuple(dict.fromkeys(paths))
+        self.segments: tuple = tuple(
+            tuple(path.split('.')) for path in self.paths)
+
+    def __len__(self) -> int:
+        return len(self.paths)
@@ -1,24 +1,83 @@
 """
 PyI18n Command-line interface
 
-This module provides a command-line interface for the normalize task,
-    which sorts locales in alphabetical order.
+This module provides a command-line interface for the tasks:
+    normalize, which sorts locales in alphabetical order,
+    compile, which builds binary catalog for PyI18nCompiledLoader,
+    stats, which reports size, parse time and memory of locales,
+    check, which compares keys and placeholders of locales.
 
 Examples:
 $ pyi18n-tasks normalize -p my_app/locales/
 Sorts the locales in alphabetical order.
+
+$ pyi18n-tasks normalize -p my_app/locales/ --check
+Exits with status 1 if some locale is not sorted, nothing is written.
+
+$ pyi18n-tasks compile -p my_app/locales/ -o my_app/locales.i18nc
+Compiles the locales into single catalog file,
+pass -f mmap for memory-mapped catalog and -s yaml or -s json when
+directory has locale files of both formats.
+
+$ pyi18n-tasks stats -p my_app/locales/ --json -o stats.json
+Writes size, parse time, keys, depth and memory of every locale
+and namespace as JSON, prints table without --json.
+
+$ pyi18n-tasks check -p my_app/locales/ -r en
+Prints JSON report of keys and placeholders differing from en locale,
+exits with status 1 if there are any.
 """
 from argparse import ArgumentParser
 from .tasks import normalize
+from .tasks import compile as compile_task
+from .tasks import stats
+from .tasks import check
+
+TASKS: tuple = ("normalize", "compile", "stats", "check")
 
 
 def cli() -> None:
     """ A command-line interface function """
     parser = ArgumentParser()
-    parser.add_argument("normalize", help="Sort locales in alphabetical order")
+    parser.add_argument("task", choices=TASKS,
+                        help="normalize: sort locales in alphabetical order, "
+                        "compile: build binary catalog, "
+                        "stats: report footprint of locales, "
+                        "check: compare keys and placeholders of locales")
     parser.add_argument("-p", "--path", help="Path to locales",
                         default="locales", type=str, required=False)
+    parser.add_argument("-o", "--output", help="Output path of compiled "
+                        "catalog, defaults to <path>.i18nc, or of stats "
+                        "and check reports, defaults to stdout",
+                        default=None, type=str, required=False)
+    parser.add_argument("-f", "--format", help="Compiled catalog format",
+                        choices=tuple(compile_task.CATALOG_FORMATS),
+                        default="marshal", required=False)
+    parser.add_argument("-s", "--source-format", help="Format of locale "
+                        "files to compile, required when locales directory "
+                        "has both yaml and json files",
+                        choices=("yaml", "json"), default=None,
+                        required=False)
+    parser.add_argument("--check", help="Only report files which are not "
+                        "normalized, exit with status 1 if there are any",
+                        action="store_true")
+    parser.add_argument("-j", "--jobs", help="Number of worker processes "
+                        "of normalize and check, defaults to number of CPUs",
+                        default=None, type=int, required=False)
+    parser.add_argument("--json", help="Write stats report as JSON",
+                        action="store_true")
+    parser.add_argument("-r", "--reference", help="Reference locale of "
+                        "check, defaults to en or first locale",
+                        default=None, type=str, required=False)
 
     args = parser.parse_args()
-    if args.normalize:
-        normalize.normalize_locales(args.path)
+    if args.task == "normalize":
+        normalize.normalize_locales(args.path, args.check, args.jobs)
+    elif args.task == "compile":
+        compile_task.compile_locales(args.path, args.output, args.format,
+                                     args.source_format)
+    elif args.task == "stats":
+        stats.locale_stats(args.path, args.output, args.json)
+    elif args.task == "check":
+        check.check_locales(args.path, args.reference, args.output,
+                            args.jobs)
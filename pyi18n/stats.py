@@ -0,0 +1,236 @@
+"""
+This module measures footprint of locale catalogs: file size, parse
+time per parser backend, number of keys, nesting depth and deep
+in-memory size. It's used by PyI18n.memory_report and the stats task.
+"""
+from os.path import getsize
+from sys import getsizeof
+from time import perf_counter
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from .frozen import FrozenCatalog
+from .helpers import LazyLocale
+from .parsers import available_parsers, get_parser, has_parser
+
+# columns of stats table: (title, report field)
+COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("files", "files"),
+    ("size", "size"),
+    ("keys", "keys"),
+    ("depth", "depth"),
+    ("memory", "memory"),
+)
+
+
+def deep_sizeof(obj: Any, seen: Optional[set] = None) -> int:
+    """Compute size of object and everything it references,
+        each object is counted once, so interned keys and shared
+        values are counted only by the first caller passing the same
+        seen set. Lazy locales are counted with parsed namespaces only,
+        other mappings (e.g. memory-mapped catalogs) by their own size.
+
+    Args:
+        obj (Any): object to measure
+        seen (Optional[set]): ids of objects already counted
+
+    Return:
+        int: size in bytes
+    """
+    seen = set() if seen is None else seen
+    size: int = 0
+    stack: list = [obj]
+
+    while stack:
+        current: Any = stack.pop()
+        if id(current) in seen:
+            continue
+
+        seen.add(id(current))
+        size += getsizeof(current)
+
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        elif isinstance(current, LazyLocale):
+            stack.extend(
+                current[namespace] for namespace in current.loaded_namespaces)
+        elif hasattr(type(current), '__slots__'):
+            stack.extend(
+                getattr(current, slot) for slot in type(current).__slots__
+                if hasattr(current, slot))
+
+    return size
+
+
+def count_keys(content: Any, flat: bool = False) -> Tuple[int, int]:
+    """Count translation leaves and maximal nesting depth
+
+    Args:
+        content (Any): nested translations, FrozenCatalog or
+                        dot-path catalog of flat loaders
+        flat (bool): content is dot-path catalog
+
+    Return:
+        Tuple[int, int]: number of leaves and depth, 1 for flat dict
+    """
+    if flat:
+        return len(content), max(
+            (path.count(".") + 1 for path in content), default=0)
+
+    keys: int = 0
+    depth: int = 0
+    stack: list = [(content, 1)]
+    while stack:
+        node, level = stack.pop()
+        items: Iterable = node.children() \
+            if isinstance(node, FrozenCatalog) else node.items()
+        for _, value in items:
+            if isinstance(value, (dict, FrozenCatalog)):
+                stack.append((value, level + 1))
+            else:
+                keys += 1
+                depth = max(depth, level)
+
+    return keys, depth
+
+
+def parse_times(file_path: str, fmt: str) -> Dict[str, float]:
+    """Measure parse time of file with every installed parser
+        backend, file is read once and parsed from memory
+
+    Args:
+        file_path (str): path to the file
+        fmt (str): serialization format ("yaml", "json")
+
+    Return:
+        Dict[str, float]: backend name to parse seconds, empty
+                            for formats without parser backends
+    """
+    if not has_parser(fmt):
+        return {}
+
+    with open(file_path, "rb") as _f:
+        content: bytes = _f.read()
+
+    times: Dict[str, float] = {}
+    for name in available_parsers(fmt):
+        parser = get_parser(fmt, name)
+        start: float = perf_counter()
+        parser.loads(content)
+        times[name] = perf_counter() - start
+
+    return times
+
+
+def section_stats(
+    content: Any,
+    sources: Tuple[str, ...] = (),
+    fmt: Optional[str] = None,
+    seen: Optional[set] = None,
+    flat: bool = False
+) -> dict:
+    """Measure single locale or namespace
+
+    Args:
+        content (Any): translations of the section
+        sources (Tuple[str, ...]): files section is loaded from
+        fmt (Optional[str]): format of sources, parse times
+                                are measured when given
+        seen (Optional[set]): ids of objects already counted
+        flat (bool): content is dot-path catalog
+
+    Return:
+        dict: "files", "size" (bytes on disk), "keys", "depth",
+                "memory" (deep size in bytes) and "parse_seconds"
+                per parser backend
+    """
+    keys, depth = count_keys(content, flat)
+    parse_seconds: Dict[str, float] = {}
+    for file_path in sources if fmt else ():
+        for name, seconds in parse_times(file_path, fmt).items():
+            parse_seconds[name] = parse_seconds.get(name, 0.0) + seconds
+
+    return {
+        "files": len(sources),
+        "size": sum(getsize(file_path) for file_path in sources),
+        "keys": keys,
+        "depth": depth,
+        "memory": deep_sizeof(content, seen),
+        "parse_seconds": parse_seconds,
+    }
+
+
+def sum_stats(sections: Iterable[dict]) -> dict:
+    """Sum stats of namespaces into locale stats, depth
+        includes namespace level
+
+    Args:
+        sections (Iterable[dict]): stats of namespaces
+
+    Return:
+        dict: summed stats
+    """
+    total: dict = {"files": 0, "size": 0, "keys": 0, "depth": 0,
+                   "memory": 0, "parse_seconds": {}}
+    for section in sections:
+        for field in ("files", "size", "keys", "memory"):
+            total[field] += section[field]
+        total["depth"] = max(total["depth"], section["depth"] + 1)
+        for name, seconds in section["parse_seconds"].items():
+            total["parse_seconds"][name] = \
+                total["parse_seconds"].get(name, 0.0) + seconds
+
+    return total
+
+
+def format_table(report: dict) -> str:
+    """Format report as text table, one row per locale
+        followed by rows of its namespaces
+
+    Args:
+        report (dict): report with "locales" stats
+
+    Return:
+        str: table
+    """
+    backends: list = sorted({
+        name for stats in _rows(report) for name in stats[1]["parse_seconds"]
+    })
+    header: list = ["locale", *(title for title, _ in COLUMNS),
+                    *(f"{name} ms" for name in backends)]
+    rows: list = [header]
+    for name, stats in _rows(report):
+        rows.append([
+            name,
+            *(str(stats[field]) for _, field in COLUMNS),
+            *(f"{stats['parse_seconds'][backend] * 1000:.2f}"
+              if backend in stats["parse_seconds"] else "-"
+              for backend in backends),
+        ])
+
+    widths: list = [max(len(row[index]) for row in rows)
+                    for index in range(len(header))]
+    return "\n".join(
+        "  ".join(
+            cell.ljust(width) if not index else cell.rjust(width)
+            for index, (cell, width) in enumerate(zip(row, widths))
+        ).rstrip()
+        for row in rows
+    )
+
+
+def _rows(report: dict) -> list:
+    """flatten report into (name, stats) rows, should not be called
+        directly"""
+    rows: list = []
+    for locale, stats in report["locales"].items():
+        rows.append((locale, stats))
+        rows.extend(
+            (f"  {locale}/{namespace}", namespace_stats)
+            for namespace, namespace_stats in stats.get(
+                "namespaces", {}).items()
+        )
+
+    return rows
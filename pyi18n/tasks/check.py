@@ -0,0 +1,302 @@
+""" This module contains functions for checking consistency of i18n
+    localization files: keys missing or extra in locales and translations
+    with different placeholders than the reference locale has. """
+from concurrent.futures import ProcessPoolExecutor
+from os import getcwd, cpu_count
+from os.path import basename, dirname, exists, splitext
+from typing import Any, Dict, Optional, Tuple
+from logging import error
+import json
+import sys
+
+from pyi18n.helpers import merge_translations
+from pyi18n.interpolation import placeholders
+from pyi18n.parsers import get_parser
+from pyi18n.plurals import CATEGORIES
+from pyi18n.tasks.normalize import (
+    FORMATS, are_locales_namespaced, is_directory_empty, locale_files)
+
+# reference locale flattened by check_locales, set in every worker
+_state: dict = {}
+
+_NO_PLACEHOLDERS: frozenset = frozenset()
+_CATEGORIES: frozenset = frozenset(CATEGORIES)
+
+
+def check_locales(
+    locale_path: str = 'locales/',
+    reference: Optional[str] = None,
+    output: Optional[str] = None,
+    max_workers: Optional[int] = None
+) -> dict:
+    """Compares keys and placeholders of every locale with reference
+        locale, writes JSON report to output file or stdout and exits
+        with status 1 when any locale differs
+
+    Args:
+        locale_path (str): locales directory, relative to working directory
+        reference (Optional[str]): reference locale, "en" if it exists,
+                                    first locale by name otherwise
+        output (Optional[str]): file to write report to, stdout by default
+        max_workers (Optional[int]): number of worker processes,
+                                        number of CPUs by default
+
+    Return:
+        dict: report, "reference", "ok", "locales" with "missing"
+                and "extra" keys and "placeholders" mismatches per locale
+                and "unparsable" files with their parser errors
+    """
+    locale_path: str = f"{getcwd()}/{locale_path}"
+
+    if not exists(locale_path):
+        error(f"{locale_path} does not exist")
+        exit(1)
+
+    if is_directory_empty(locale_path):
+        error(f"{locale_path} is empty")
+        exit(1)
+
+    namespaced: bool = are_locales_namespaced(locale_path)
+    groups: Dict[str, Tuple[str, ...]] = group_files(
+        locale_files(locale_path, namespaced), namespaced)
+    if not groups:
+        error("no locales found, check your path")
+        exit(1)
+
+    reference = reference or ("en" if "en" in groups else min(groups))
+    if reference not in groups:
+        error(f"reference locale {reference} not found")
+        exit(1)
+
+    report: dict = build_report(groups, reference, namespaced, max_workers)
+    text: str = json.dumps(report, indent=2, sort_keys=True)
+
+    # unparsable files are skipped, the others are checked anyway
+    for file_path, message in report["unparsable"].items():
+        error(f"{file_path} couldn't be checked: {message}")
+
+    if output is None:
+        sys.stdout.write(f"{text}\n")
+    else:
+        with open(output, "w", encoding="utf-8") as _f:
+            _f.write(f"{text}\n")
+
+    if not report["ok"]:
+        exit(1)
+
+    return report
+
+
+def group_files(
+    files: Tuple[str, ...],
+    namespaced: bool
+) -> Dict[str, Tuple[str, ...]]:
+    """Group locale files by locale
+
+    Args:
+        files (Tuple[str, ...]): locale files
+        namespaced (bool): files are namespaces in locale directories
+
+    Return:
+        Dict[str, Tuple[str, ...]]: locale to its files
+    """
+    groups: dict = {}
+    for file_path in files:
+        locale: str = basename(dirname(file_path)) if namespaced \
+            else splitext(basename(file_path))[0]
+        groups.setdefault(locale, []).append(file_path)
+
+    return {locale: tuple(paths) for locale, paths in groups.items()}
+
+
+def build_report(
+    groups: Dict[str, Tuple[str, ...]],
+    reference: str,
+    namespaced: bool,
+    max_workers: Optional[int] = None
+) -> dict:
+    """Flatten reference locale and diff other locales against it
+        in worker processes, workers receive reference once and
+        return differences only
+
+    Args:
+        groups (Dict[str, Tuple[str, ...]]): locale to its files
+        reference (str): reference locale
+        namespaced (bool): files are namespaces in locale directories
+        max_workers (Optional[int]): number of worker processes
+
+    Return:
+        dict: report, see check_locales
+    """
+    expected, unparsable = flatten_locale(
+        groups[reference], namespaced, reference)
+    locales: tuple = tuple(sorted(set(groups) - {reference}))
+    workers: int = min(max_workers or cpu_count() or 1, len(locales))
+
+    if workers <= 1:
+        _set_reference(expected)
+        try:
+            results: list = [
+                diff_locale(groups[locale], namespaced, locale)
+                for locale in locales
+            ]
+        finally:
+            _state.clear()
+    else:
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=_set_reference,
+                                 initargs=(expected,)) as executor:
+            results: list = list(executor.map(
+                diff_locale, (groups[locale] for locale in locales),
+                (namespaced,) * len(locales), locales))
+
+    diffs: list = []
+    for diff, failed in results:
+        diffs.append(diff)
+        unparsable.update(failed)
+
+    return {
+        "reference": reference,
+        "keys": len(expected),
+        "ok": not unparsable and not any(
+            diff["missing"] or diff["extra"] or diff["placeholders"]
+            for diff in diffs),
+        "locales": dict(zip(locales, diffs)),
+        "unparsable": dict(sorted(unparsable.items())),
+    }
+
+
+def flatten_locale(
+    files: Tuple[str, ...],
+    namespaced: bool,
+    locale: str
+) -> Tuple[Dict[str, Optional[frozenset]], Dict[str, str]]:
+    """Load locale files and flatten them into leaf paths,
+        namespace name is the first path segment of namespaced locales,
+        plural forms (subtree of CLDR categories with "other") are
+        single leaf with placeholders of all forms
+
+    Args:
+        files (Tuple[str, ...]): files of the locale
+        namespaced (bool): files are namespaces in locale directory
+        locale (str): locale name
+
+    Return:
+        Tuple[Dict[str, Optional[frozenset]], Dict[str, str]]: leaf path
+            to placeholder names, None for non-str leaves, and parser
+            errors of skipped unparsable files
+    """
+    contents, unparsable = _load_contents(files, namespaced, locale)
+
+    # translations repeat a lot, parse each string once
+    names: dict = {}
+    flat: dict = {}
+    stack: list = [("", merge_translations(*contents))]
+    while stack:
+        base, node = stack.pop()
+        for key, value in node.items():
+            path: str = f"{base}.{key}" if base else str(key)
+            if isinstance(value, dict) and not _is_plural(value):
+                stack.append((path, value))
+            else:
+                flat[path] = _leaf_placeholders(value, names)
+
+    return flat, unparsable
+
+
+def diff_locale(
+    files: Tuple[str, ...],
+    namespaced: bool,
+    locale: str
+) -> Tuple[dict, Dict[str, str]]:
+    """Diff locale against reference set by build_report
+
+    Args:
+        files (Tuple[str, ...]): files of the locale
+        namespaced (bool): files are namespaces in locale directory
+        locale (str): locale name
+
+    Return:
+        Tuple[dict, Dict[str, str]]: sorted "missing" and "extra" keys
+            and "placeholders", path to "missing" and "extra"
+            placeholder names, and parser errors of unparsable files
+    """
+    expected: dict = _state["reference"]
+    actual, unparsable = flatten_locale(files, namespaced, locale)
+
+    mismatched: dict = {}
+    for path in expected.keys() & actual.keys():
+        wanted, found = expected[path], actual[path]
+        if wanted is None or found is None or wanted == found:
+            continue
+
+        mismatched[path] = {
+            "missing": sorted(wanted - found),
+            "extra": sorted(found - wanted),
+        }
+
+    return {
+        "missing": sorted(expected.keys() - actual.keys()),
+        "extra": sorted(actual.keys() - expected.keys()),
+        "placeholders": dict(sorted(mismatched.items())),
+    }, unparsable
+
+
+def _set_reference(expected: dict) -> None:
+    """store flattened reference locale, runs as process pool
+        initializer, should not be called directly"""
+    _state["reference"] = expected
+
+
+def _load_contents(
+    files: Tuple[str, ...],
+    namespaced: bool,
+    locale: str
+) -> Tuple[list, Dict[str, str]]:
+    """parse locale files into translations of the locale and
+        errors of unparsable files, should not be called directly"""
+    contents: list = []
+    unparsable: dict = {}
+    for file_path in files:
+        parser: Any = get_parser(FORMATS[file_path.rsplit(".", 1)[-1]])
+        try:
+            with open(file_path, "rb") as _f:
+                content: Any = parser.load(_f)
+        except parser.errors as exc:
+            unparsable[file_path] = str(exc)
+            continue
+
+        if not isinstance(content, dict):
+            continue
+
+        if namespaced:
+            content = {splitext(basename(file_path))[0]: content}
+        elif isinstance(content.get(locale), dict):
+            content = content[locale]
+        contents.append(content)
+
+    return contents, unparsable
+
+
+def _is_plural(value: dict) -> bool:
+    """plural forms differ per language, they are compared as one
+        leaf, should not be called directly"""
+    return "other" in value and _CATEGORIES.issuperset(value)
+
+
+def _leaf_placeholders(value: Any, names: dict) -> Optional[frozenset]:
+    """placeholder names of leaf, names caches them per string,
+        should not be called directly"""
+    if isinstance(value, dict):
+        return frozenset().union(*(
+            _leaf_placeholders(form, names) or _NO_PLACEHOLDERS
+            for form in value.values()))
+
+    if not isinstance(value, str):
+        return None
+    if "{" not in value:
+        return _NO_PLACEHOLDERS
+
+    if value not in names:
+        names[value] = placeholders(value)
+    return names[value]
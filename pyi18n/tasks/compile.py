@@ -0,0 +1,54 @@
+""" This module contains functions for compiling i18n localization files
+    into a single binary catalog. """
+from os import getcwd
+from os.path import exists
+from typing import Optional
+from logging import error, info
+
+from pyi18n.compiled import write_catalog
+from pyi18n.mmapped import write_mmap_catalog
+from pyi18n.tasks.normalize import is_directory_empty
+
+# catalog format: (writer, default extension)
+CATALOG_FORMATS: dict = {
+    "marshal": (write_catalog, "i18nc"),
+    "mmap": (write_mmap_catalog, "i18nm"),
+}
+
+
+def compile_locales(
+    locale_path: str = 'locales/',
+    output: Optional[str] = None,
+    catalog_format: str = "marshal",
+    source_format: Optional[str] = None
+) -> None:
+    """Compiles locales directory (flat or namespaced) into catalog file
+        loadable with PyI18nCompiledLoader ("marshal" format) or
+        PyI18nMmapLoader ("mmap" format), by default written next
+        to the locales directory as <directory>.i18nc (.i18nm).
+        Only files of source_format ("yaml", "json") are compiled,
+        it's required when directory has files of both formats"""
+    locale_path: str = f"{getcwd()}/{locale_path}"
+
+    if not exists(locale_path):
+        error(f"{locale_path} does not exist")
+        exit(1)
+
+    if is_directory_empty(locale_path):
+        error(f"{locale_path} is empty")
+        exit(1)
+
+    if catalog_format not in CATALOG_FORMATS:
+        error(f"unknown catalog format {catalog_format}")
+        exit(1)
+
+    writer, ext = CATALOG_FORMATS[catalog_format]
+    output: str = output or f"{locale_path.rstrip('/')}.{ext}"
+
+    try:
+        header: dict = writer(output, locale_path, source_format)
+    except ValueError as exc:
+        error(str(exc))
+        exit(1)
+
+    info(f"compiled {len(header['sources'])} files into {output}")
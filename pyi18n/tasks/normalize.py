@@ -1,18 +1,49 @@
-""" This module contains functions for normalizing i18n localization files. """
-from os import listdir, getcwd
-from os.path import exists, isdir, join
-from typing import Callable, Optional, Type, Tuple
-from pathlib import Path
-from logging import error
+""" This module contains functions for normalizing i18n localization files.
+    Files are normalized independently by a process pool, one file
+    at a time per worker, canonical form is streamed into temporary file
+    and replaces the original only when it differs, so memory is bounded
+    by the largest file and files already normalized are left untouched.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from hashlib import sha256
+from os import listdir, getcwd, cpu_count, replace, unlink
+from os.path import dirname, exists, getsize, isdir, isfile, join
+from shutil import copymode
+from tempfile import NamedTemporaryFile
+from typing import Any, BinaryIO, Callable, Optional, Tuple
+from logging import error, info
 import json
 import yaml
 
-from pyi18n.loaders import (
-    PyI18nBaseLoader, PyI18nJsonLoader, PyI18nYamlLoader)
+from pyi18n.parsers import get_parser
 
+# file extension: serialization format
+FORMATS: dict = {"yml": "yaml", "yaml": "yaml", "json": "json"}
 
-def normalize_locales(locale_path: str = 'locales/') -> None:
-    """Sorts the keys in alphabetically order, and overrides files"""
+# size of chunks written and hashed at once
+CHUNK_SIZE: int = 1 << 16
+
+
+def normalize_locales(
+    locale_path: str = 'locales/',
+    check: bool = False,
+    max_workers: Optional[int] = None
+) -> Tuple[str, ...]:
+    """Sorts the keys in alphabetically order, and overrides files
+        which are not normalized yet
+
+    Args:
+        locale_path (str): locales directory, relative to working directory
+        check (bool): only report files which are not normalized
+                        and exit with status 1 if there are any
+        max_workers (Optional[int]): number of worker processes,
+                                        number of CPUs by default
+
+    Return:
+        Tuple[str, ...]: rewritten files, files which couldn't
+                            be parsed are logged and skipped
+    """
     locale_path: str = f"{getcwd()}/{locale_path}"
 
     if not exists(locale_path):
@@ -23,152 +54,244 @@ def normalize_locales(locale_path: str = 'locales/') -> None:
         error(f"{locale_path} is empty")
         exit(1)
 
-    __perform_normalize(locale_path)
+    files: Tuple[str, ...] = locale_files(
+        locale_path, are_locales_namespaced(locale_path))
+    if not files:
+        error("no locales found, check your path")
+        exit(1)
+
+    changed, failed = __normalize_files(files, check, max_workers)
+
+    # unparsable files are skipped, the others are normalized anyway
+    for file_path, exc in failed:
+        error(f"{file_path} couldn't be normalized: {exc}")
+
+    if check and (changed or failed):
+        for file_path in changed:
+            error(f"{file_path} is not normalized")
+        exit(1)
+
+    info(f"normalized {len(changed)} of {len(files)} files" if not check
+         else f"all {len(files)} files are normalized")
+    return changed
 
 
-def __perform_normalize(locale_path: str) -> None:
-    """private method to perform normalization,
+def __normalize_files(
+    files: Tuple[str, ...],
+    check: bool,
+    max_workers: Optional[int]
+) -> Tuple[Tuple[str, ...], Tuple[tuple, ...]]:
+    """private method normalizing files in worker processes, returns
+    changed files and (file, exception) of failed ones,
     should not be called directly"""
+    workers: int = min(max_workers or cpu_count() or 1, len(files))
+    job: Callable = partial(normalize_file, check=check)
 
-    namespaced: bool = are_locales_namespaced(locale_path)
-    loader, ext = get_loader(locale_path, namespaced)
-    locales: tuple = get_locales(locale_path, namespaced, ext)
+    if workers <= 1:
+        results: list = [__run(job, file_path) for file_path in files]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures: list = [
+                executor.submit(job, file_path) for file_path in files]
+            results: list = [
+                __run(future.result) for future in futures]
 
-    loader: PyI18nBaseLoader = loader(locale_path, namespaced)
+    failed: Tuple[tuple, ...] = tuple(
+        (file_path, result) for file_path, result in zip(files, results)
+        if isinstance(result, Exception))
 
-    if not locales:
-        error("no locales found, check your path")
-        exit(1)
+    return tuple(
+        file_path for file_path, result in zip(files, results)
+        if result is True), failed
 
-    __save_normalized(loader, locales, namespaced)
 
+def __run(func: Callable, *args) -> object:
+    """private method returning exception raised by
+    function instead of raising it, should not be called directly"""
+    try:
+        return func(*args)
+    except Exception as exc:  # pylint: disable=broad-except
+        return exc
 
-def __save_normalized(
-    loader: PyI18nBaseLoader,
-    locales: tuple,
-    namespaced: bool = False,
-) -> None:
-    ext: str = loader.type.replace('yaml', 'yml')
 
-    if not locales:
-        error("no locales found, check your path")
-        exit(1)
+def normalize_file(file_path: str, check: bool = False) -> bool:
+    """Normalize single locale file, canonical serialization is streamed
+        into temporary file next to it, which replaces the file only
+        when its hash differs from hash of file content
+
+    Args:
+        file_path (str): path to locale file, format is taken
+                            from its extension
+        check (bool): don't write, only compare hashes
+
+    Return:
+        bool: True if file was not normalized, documents without
+                any content (e.g. only comments) are left untouched
+    """
+    fmt: str = FORMATS[file_path.rsplit(".", 1)[-1]]
+    with open(file_path, "rb") as _f:
+        content: Any = get_parser(fmt).load(_f)
+
+    # loaders skip such files, dumped "null" would become a translation
+    if content is None:
+        return False
+
+    temporary: Optional[BinaryIO] = None if check else NamedTemporaryFile(
+        "wb", dir=dirname(file_path), prefix=".", suffix=".tmp",
+        delete=False)
+    try:
+        writer: CanonicalWriter = CanonicalWriter(temporary)
+        write_canonical(content, fmt, writer)
+        del content
+
+        digest: bytes = writer.digest()
+        if temporary is not None:
+            temporary.close()
+
+        if digest == file_digest(file_path):
+            return False
+
+        if temporary is not None:
+            copymode(file_path, temporary.name)
+            replace(temporary.name, file_path)
+            temporary = None
+
+        return True
+    finally:
+        if temporary is not None:
+            temporary.close()
+            unlink(temporary.name)
+
+
+class CanonicalWriter:
+    """Text stream hashing written content and writing it
+        encoded to binary file in chunks
+
+    Attributes:
+        file (Optional[BinaryIO]): file to write to, content
+                                    is only hashed when None
+    """
+
+    def __init__(self, file: Optional[BinaryIO] = None) -> None:
+        """Initialize writer
+
+        Args:
+            file (Optional[BinaryIO]): file opened in binary mode
 
-    translations: dict = loader.load(locales)
+        Return:
+            None
+        """
+        self.file: Optional[BinaryIO] = file
+        self._hash = sha256()
+        self._buffer: list = []
+        self._size: int = 0
 
-    serializers: dict[str, Callable] = {
-        "json": lambda c, f: json.dump(c, f, sort_keys=True, indent=4),
-        "yml": yaml.dump,
-    }
+    def write(self, text: str) -> None:
+        """Buffer text, full chunks are flushed
 
-    ser_mod: Callable = serializers[ext]
+        Args:
+            text (str): serialized content
 
-    for locale in translations.items():
-        if namespaced:
-            namespace, content = locale
+        Return:
+            None
+        """
+        self._buffer.append(text)
+        self._size += len(text)
+        if self._size >= CHUNK_SIZE:
+            self.flush()
 
-            for name, body in content.items():
-                full_path: str = f"{loader.load_path}{namespace}/{name}.{ext}"
-                file_override(body, full_path, ser_mod)
+    def flush(self) -> None:
+        """Hash and write buffered text
 
-            return
+        Return:
+            None
+        """
+        chunk: bytes = "".join(self._buffer).encode()
+        self._buffer, self._size = [], 0
+        self._hash.update(chunk)
+        if self.file is not None:
+            self.file.write(chunk)
 
-        full_path: str = f"{loader.load_path}{locale[0]}.{ext}"
-        file_override({locale[0]: locale[1]}, full_path, ser_mod)
+    def digest(self) -> bytes:
+        """Flush buffered text and return hash of written content
 
+        Return:
+            bytes: sha256 digest
+        """
+        self.flush()
+        return self._hash.digest()
 
-def get_locales(locale_path: str, namespaced: bool, ext: str) -> tuple:
-    """Returns a tuple of locales from the specified path.
+
+def write_canonical(content: Any, fmt: str, stream: CanonicalWriter) -> None:
+    """Serialize content in canonical form with sorted keys,
+        chunk by chunk, without building the whole document
 
     Args:
-        locale_path (str): representing the path to the locales directory.
-        namespaced (bool): tells function if should
-                            look for loader in namespaced way.
-        ext (str): A string representing the file extension of the locales.
+        content (Any): parsed locale file
+        fmt (str): "yaml" or "json"
+        stream (CanonicalWriter): text stream to write to
 
     Return:
-        tuple: locales found in the directory.
+        None
     """
-    target_func: dict = {
-        True: lambda: [
-            p.name for p
-            in Path(locale_path).iterdir() if p.is_dir()],
-        False: lambda: [
-            Path(file).stem for file
-            in listdir(locale_path)if file.endswith(ext)
-        ],
-    }
-    return tuple(target_func[namespaced]())
+    if fmt == "yaml":
+        yaml.dump(content, stream)
+        return
 
+    for chunk in json.JSONEncoder(sort_keys=True, indent=4).iterencode(
+            content):
+        stream.write(chunk)
 
-def file_override(content: dict, file_path: str, ser_mod: Callable) -> None:
-    """Override the contents of the file at the specified file path.
+
+def file_digest(file_path: str) -> bytes:
+    """Hash file content chunk by chunk
 
     Args:
-        content (dict): A dictionary representing the content to
-                            be written to the file.
-        file_path (str): A string representing the path to the file
-                            to be overridden.
-        ser_mod (object): An object representing the serialization module
-                            to be used for writing.
+        file_path (str): path to the file
 
     Return:
-        None
+        bytes: sha256 digest
     """
-    with open(file_path, 'w', encoding='utf-8') as file:
-        ser_mod(content, file)
-
+    digest = sha256()
+    with open(file_path, "rb") as _f:
+        for chunk in iter(partial(_f.read, CHUNK_SIZE), b""):
+            digest.update(chunk)
 
-def are_locales_namespaced(locale_path: str) -> bool:
-    """Check if locales are namespaced"""
-    return all(
-        map(
-            lambda x: isdir(join(locale_path, x)), listdir(locale_path)
-        )
-    )
+    return digest.digest()
 
 
-def get_loader(
-    locale_path: str,
-    namespaced: bool
-) -> Tuple[Type[PyI18nBaseLoader], str]:
-    """Analyses given path and return loader based on that.
-        Note you in your files you have to store only locales
-        if you have other files not related to locales it could return
-        false loader of even worse throw an exception
+def locale_files(locale_path: str, namespaced: bool) -> Tuple[str, ...]:
+    """Returns paths of locale files in supported formats
 
     Args:
-        locale_path (str): locales path
+        locale_path (str): representing the path to the locales directory.
         namespaced (bool): tells function if should
-                            look for loader in namespaced way.
+                            look for files in locale directories.
 
     Return:
-        [loaders.PyI18nBaseLoader, str]
-
+        Tuple[str, ...]: sorted paths of locale files, empty files
+                            are skipped as loaders do
     """
+    directories: list = [
+        join(locale_path, name) for name in listdir(locale_path)
+    ] if namespaced else [locale_path]
+
+    return tuple(sorted(
+        join(directory, name)
+        for directory in directories for name in listdir(directory)
+        if name.rsplit(".", 1)[-1] in FORMATS
+        and isfile(join(directory, name))
+        and getsize(join(directory, name))
+    ))
 
-    first: str = listdir(locale_path)[0]
-    functions: dict[bool, Callable[[], str]] = {
-        True: lambda: listdir(join(locale_path, first))[0].split(".")[-1],
-        False: lambda: first.split(".")[-1],
-    }
-    ext: str = functions[namespaced]()
-    ext_loaders: dict[str, Type[PyI18nBaseLoader]] = {
-        'yaml': PyI18nYamlLoader,
-        'yml': PyI18nYamlLoader,
-        'json': PyI18nJsonLoader,
-    }
-
-    loader_class: Optional[Type[PyI18nBaseLoader]] = ext_loaders.get(ext)
-
-    if not loader_class:
-        error(
-            "You're not using default loader version, "
-            "make sure you pass -l argument"
-        )
-        exit(1)
 
-    return (loader_class, ext)
+def are_locales_namespaced(locale_path: str) -> bool:
+    """Check if locales are namespaced"""
+    return all(
+        map(
+            lambda x: isdir(join(locale_path, x)), listdir(locale_path)
+        )
+    )
 
 
 def is_directory_empty(directory_path: str) -> bool:
@@ -0,0 +1,126 @@
+""" This module contains functions for reporting size, parse time
+    and memory footprint of i18n localization files. """
+from collections import Counter
+from os import getcwd
+from os.path import basename, dirname, exists, splitext
+from typing import Any, Optional, Tuple
+from logging import error
+import json
+import sys
+
+from pyi18n.parsers import get_parser
+from pyi18n.stats import format_table, section_stats, sum_stats
+from pyi18n.tasks.normalize import (
+    FORMATS, are_locales_namespaced, is_directory_empty, locale_files)
+
+
+def locale_stats(
+    locale_path: str = 'locales/',
+    output: Optional[str] = None,
+    as_json: bool = False
+) -> dict:
+    """Reports files, size, parse time per parser backend, keys, depth
+        and deep in-memory size of every locale and namespace, as table
+        or JSON written to output file or stdout
+
+    Args:
+        locale_path (str): locales directory, relative to working directory
+        output (Optional[str]): file to write report to, stdout by default
+        as_json (bool): write JSON instead of table
+
+    Return:
+        dict: report with "locales" stats, "total" and "unparsable"
+                files with their parser errors
+    """
+    locale_path: str = f"{getcwd()}/{locale_path}"
+
+    if not exists(locale_path):
+        error(f"{locale_path} does not exist")
+        exit(1)
+
+    if is_directory_empty(locale_path):
+        error(f"{locale_path} is empty")
+        exit(1)
+
+    namespaced: bool = are_locales_namespaced(locale_path)
+    files: Tuple[str, ...] = locale_files(locale_path, namespaced)
+    if not files:
+        error("no locales found, check your path")
+        exit(1)
+
+    report: dict = build_report(files, namespaced)
+    for file_path, message in report["unparsable"].items():
+        error(f"{file_path} couldn't be measured: {message}")
+
+    text: str = json.dumps(report, indent=2, sort_keys=True) \
+        if as_json else format_table(report)
+
+    if output is None:
+        sys.stdout.write(f"{text}\n")
+    else:
+        with open(output, "w", encoding="utf-8") as _f:
+            _f.write(f"{text}\n")
+
+    return report
+
+
+def build_report(files: Tuple[str, ...], namespaced: bool) -> dict:
+    """Measure locale files one by one, parsed content
+        is released before the next file is parsed, unparsable
+        files are skipped
+
+    Args:
+        files (Tuple[str, ...]): locale files
+        namespaced (bool): files are namespaces in locale directories
+
+    Return:
+        dict: report with "locales" stats, "total" and "unparsable"
+                files with their parser errors
+    """
+    sections: dict = {}
+    unparsable: dict = {}
+    # same locale stored in several formats is reported per file
+    stems: Counter = Counter(splitext(file_path)[0] for file_path in files)
+    for file_path in files:
+        fmt: str = FORMATS[file_path.rsplit(".", 1)[-1]]
+        name: str = splitext(basename(file_path))[0]
+        locale: str = basename(dirname(file_path)) if namespaced else name
+
+        parser: Any = get_parser(fmt)
+        try:
+            with open(file_path, "rb") as _f:
+                content: dict = parser.load(_f)
+        except parser.errors as exc:
+            unparsable[file_path] = str(exc)
+            continue
+
+        if not isinstance(content, dict):
+            content = {}
+        if not namespaced and isinstance(content.get(locale), dict):
+            content = content[locale]
+
+        if stems[splitext(file_path)[0]] > 1:
+            name = basename(file_path)
+
+        stats: dict = section_stats(content, (file_path,), fmt)
+        if namespaced:
+            sections.setdefault(locale, {})[name] = stats
+        else:
+            sections[name] = stats
+
+    locales: dict = {}
+    for locale, stats in sorted(sections.items()):
+        if namespaced:
+            locales[locale] = sum_stats(stats.values())
+            locales[locale]["namespaces"] = stats
+        else:
+            locales[locale] = stats
+
+    return {
+        "locales": locales,
+        "total": {
+            field: sum(stats[field] for stats in locales.values())
+            for field in ("files", "size", "keys", "memory")
+        },
+        "unparsable": unparsable,
+    }
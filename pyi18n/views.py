@@ -0,0 +1,271 @@
+"""
+This module provides read-only views of translations. Subtrees returned
+by PyI18n.gettext are wrapped in TranslationView instead of exposing
+dicts shared by the whole process, PrefixIndex keeps sorted leaf paths
+of a locale, so keys and subtrees under a prefix are found with bisect
+instead of walking nested dicts.
+"""
+from bisect import bisect_left
+from operator import itemgetter
+from collections.abc import Mapping
+from typing import Any, Iterator, Tuple
+
+from .frozen import FrozenCatalog
+
+
+class TranslationView(Mapping):
+    """Zero-copy read-only view of nested translations,
+        nested dicts are wrapped in views as they are accessed.
+
+    Use to_dict to get a copy, e.g. to serialize it.
+    """
+
+    __slots__ = ('_data',)
+
+    def __init__(self, data: dict) -> None:
+        """Wrap translations
+
+        Args:
+            data (dict): nested translations, not copied
+
+        Return:
+            None
+        """
+        self._data: dict = data
+
+    def __getitem__(self, key: str) -> Any:
+        value: Any = self._data[key]
+        return TranslationView(value) if value.__class__ is dict else value
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._data!r})"
+
+    def to_dict(self) -> dict:
+        """Build nested dict with content of the view
+
+        Return:
+            dict: copy of nested translations
+        """
+        return _to_dict(self)
+
+
+class PrefixIndex:
+    """Sorted leaf paths of a single locale with their values,
+        strings sharing a prefix are adjacent in sorted order, so every
+        prefix query is a pair of binary searches.
+
+    Attributes:
+        paths (Tuple[str, ...]): sorted dot-separated leaf paths
+        values (tuple): translations of paths
+        ranks (Tuple[int, ...]): position of paths in catalog order
+    """
+
+    __slots__ = ('paths', 'values', 'ranks')
+
+    def __init__(self, catalog: Mapping, flat: bool = False) -> None:
+        """Build index from lookup catalog
+
+        Args:
+            catalog (Mapping): nested translations, FrozenCatalog
+                                or dot-path index
+            flat (bool): catalog is dot-path index (flat index,
+                            flat loaders catalog), subtrees
+                            stored under their own paths are skipped
+
+        Return:
+            None
+        """
+        items: list = sorted(
+            ((path, rank, value) for rank, (path, value)
+             in enumerate(_leaves(catalog, flat))),
+            key=itemgetter(0))
+        self.paths: Tuple[str, ...] = tuple(item[0] for item in items)
+        self.ranks: Tuple[int, ...] = tuple(item[1] for item in items)
+        self.values: tuple = tuple(item[2] for item in items)
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def span(self, prefix: str) -> Tuple[int, int]:
+        """Return range of paths starting with prefix
+
+        Args:
+            prefix (str): string prefix
+
+        Return:
+            Tuple[int, int]: start and end index
+        """
+        start: int = bisect_left(self.paths, prefix)
+        if not prefix:
+            return start, len(self.paths)
+
+        end: int = bisect_left(
+            self.paths, prefix[:-1] + chr(ord(prefix[-1]) + 1), start) \
+            if prefix[-1] != chr(0x10FFFF) else len(self.paths)
+        return start, end
+
+    def keys_with_prefix(self, prefix: str) -> Tuple[str, ...]:
+        """Return leaf paths starting with prefix
+
+        Args:
+            prefix (str): string prefix, e.g. "errors.valid"
+
+        Return:
+            Tuple[str, ...]: sorted leaf paths
+        """
+        start, end = self.span(prefix)
+        return self.paths[start:end]
+
+    def find(self, path: str) -> Any:
+        """Return leaf value or subtree view under path
+
+        Args:
+            path (str): dot-separated path, empty for whole locale
+
+        Return:
+            Any: leaf value or SubtreeView
+
+        Raises:
+            KeyError: if path doesn't exist
+        """
+        prefix: str = f"{path}." if path else ""
+        start, end = self.span(prefix)
+        if start < end:
+            return SubtreeView(self, prefix, start, end)
+
+        index: int = bisect_left(self.paths, path)
+        if index < len(self.paths) and self.paths[index] == path:
+            return self.values[index]
+
+        raise KeyError(path)
+
+
+class SubtreeView(Mapping):
+    """Read-only view of leaves under a prefix of PrefixIndex,
+        keys are the next path segments in the order of catalog
+        index was built from, values are leaves or nested views,
+        nothing is copied.
+    """
+
+    __slots__ = ('_index', '_prefix', '_start', '_end')
+
+    def __init__(self, index: PrefixIndex, prefix: str,
+                 start: int, end: int) -> None:
+        """Initialize view, use PrefixIndex.find instead
+
+        Args:
+            index (PrefixIndex): index of locale
+            prefix (str): prefix of paths ending with dot,
+                            empty for whole locale
+            start (int): first path under prefix
+            end (int): index after last path under prefix
+
+        Return:
+            None
+        """
+        self._index: PrefixIndex = index
+        self._prefix: str = prefix
+        self._start: int = start
+        self._end: int = end
+
+    def __getitem__(self, key: str) -> Any:
+        return self._index.find(f"{self._prefix}{key}")
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str):
+            return False
+
+        try:
+            self._index.find(f"{self._prefix}{key}")
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[str]:
+        ranks: Tuple[int, ...] = self._index.ranks
+        first: dict = {}
+        for segment, start, end in self._segments():
+            rank: int = min(ranks[start:end])
+            first[segment] = min(first.get(segment, rank), rank)
+
+        return iter(sorted(first, key=first.__getitem__))
+
+    def __len__(self) -> int:
+        return len({segment for segment, _, _ in self._segments()})
+
+    def _segments(self) -> Iterator[Tuple[str, int, int]]:
+        """iterate over next path segments with range of their
+            paths in sorted order, should not be called directly"""
+        paths: Tuple[str, ...] = self._index.paths
+        offset: int = len(self._prefix)
+        index: int = self._start
+        while index < self._end:
+            segment, dot, _ = paths[index][offset:].partition(".")
+
+            # paths under the segment are adjacent, skip all of them
+            end: int = self._index.span(f"{self._prefix}{segment}.")[1] \
+                if dot else index + 1
+            yield segment, index, end
+            index = end
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._prefix.rstrip('.')!r})"
+
+    def to_dict(self) -> dict:
+        """Build nested dict with content of the view
+
+        Return:
+            dict: copy of nested translations
+        """
+        return _to_dict(self)
+
+
+def _leaves(catalog: Mapping, flat: bool) -> Iterator[Tuple[str, Any]]:
+    """iterate over leaf paths and values of catalog,
+        should not be called directly"""
+    if flat and not isinstance(catalog, FrozenCatalog):
+        for path, value in catalog.items():
+            if isinstance(path, str) and \
+                    not isinstance(value, (Mapping, FrozenCatalog)):
+                yield path, value
+        return
+
+    # depth first in catalog order, subtree is walked before its siblings
+    stack: list = [("", _items(catalog))]
+    while stack:
+        base, items = stack[-1]
+        for key, value in items:
+            if not isinstance(key, str):
+                continue
+
+            path: str = f"{base}.{key}" if base else key
+            if isinstance(value, (dict, FrozenCatalog)):
+                stack.append((path, _items(value)))
+                break
+            yield path, value
+        else:
+            stack.pop()
+
+
+def _items(node: Mapping) -> Iterator[Tuple[str, Any]]:
+    """iterate over items of catalog node without building dicts
+        of frozen subtrees, should not be called directly"""
+    return iter(node.children()) if isinstance(node, FrozenCatalog) \
+        else iter(node.items())
+
+
+def _to_dict(view: Mapping) -> dict:
+    """copy view into nested dicts, should not be called directly"""
+    return {
+        key: _to_dict(value) if isinstance(value, Mapping) else value
+        for key, value in view.items()
+    }
@@ -0,0 +1,57 @@
+"""
+This module provides PyI18nWatcher, background thread polling locale
+source files and reloading changed ones through PyI18n.reload.
+"""
+from logging import exception
+from threading import Event, Thread
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .pyi18n import PyI18n
+
+
+class PyI18nWatcher(Thread):
+    """ Daemon thread calling PyI18n.reload every interval
+
+    Changes are detected by polling mtime and size of source files,
+    it works everywhere and costs one stat per file per interval.
+
+    Attributes:
+        i18n (PyI18n): instance to reload
+        interval (float): seconds between polls
+    """
+
+    def __init__(self, i18n: 'PyI18n', interval: float = 1.0) -> None:
+        """ Initialize watcher, use PyI18n.watch instead
+
+        Args:
+            i18n (PyI18n): instance to reload
+            interval (float): seconds between polls
+
+        Return:
+            None
+        """
+        super().__init__(name="pyi18n-watcher", daemon=True)
+        self.i18n: 'PyI18n' = i18n
+        self.interval: float = interval
+        self._stopped: Event = Event()
+
+    def run(self) -> None:
+        """ poll until stopped, errors are logged and polling continues """
+        while not self._stopped.wait(self.interval):
+            try:
+                self.i18n.reload()
+            except Exception:  # pylint: disable=broad-except
+                exception("pyi18n watcher failed to reload translations")
+
+    def stop(self, timeout: float = None) -> None:
+        """ Stop polling and wait for thread to finish
+
+        Args:
+            timeout (float): seconds to wait for thread
+
+        Return:
+            None
+        """
+        self._stopped.set()
+        self.join(timeout)
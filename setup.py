@@ -15,8 +15,11 @@ setup(
     license='MIT License',
     author_email='sectasy0@gmail.com',
     url='https://github.com/sectasy0/pyi18n',
-    packages=find_packages(),
+    packages=find_packages(exclude=('benchmarks', 'benchmarks.*')),
     install_requires=['PyYAML>=5.4'],
+    extras_require={
+        'fast': ['orjson'],
+    },
     entry_points={
         'console_scripts': [
             'pyi18n-tasks=pyi18n.pyi18n_tasks:cli',
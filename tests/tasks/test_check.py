@@ -0,0 +1,110 @@
+# flake8: noqa
+import json
+import os
+import pytest
+from pyi18n.tasks import check
+from tests.helpers import test_path, empty_locales, namespaced_json
+
+
+def _write(directory, files: dict) -> str:
+    for name, content in files.items():
+        path = directory / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(content))
+    return f"{os.path.relpath(directory)}/"
+
+
+def test_check_fixture_locales(capsys):
+    with pytest.raises(SystemExit):
+        check.check_locales(test_path)
+    report = json.loads(capsys.readouterr().out)
+    assert report["ok"] is False
+    assert report["reference"] == "en"
+    assert report["keys"] == 14
+    # pl translation of announcement.hello doesn't use {user}
+    assert report["locales"]["pl"] == {"missing": [], "extra": [], "placeholders": {
+        "announcement.hello": {"missing": ["user"], "extra": []}}}
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_check_differences(tmp_path, max_workers):
+    path = _write(tmp_path, {
+        "en.json": {"en": {"a": "A {name}", "b": {"c": "C", "d": "D"}, "n": 1,
+                           "apples": {"one": "one apple", "other": "{count} apples"}}},
+        "pl.json": {"pl": {"a": "A {user}", "b": {"c": "C"}, "e": "E", "n": 2,
+                           "apples": {"one": "{count} jabłko", "few": "{count} jabłka",
+                                      "many": "{count} jabłek", "other": "{count} jabłka"}}},
+        "de.json": {"de": {"a": "A {name} {name.upper}", "b": {"c": "C", "d": "D"}, "n": "1",
+                           "apples": {"one": "ein Apfel", "other": "{count} Äpfel"}}},
+    })
+    output = tmp_path / "report.json"
+    with pytest.raises(SystemExit) as exc:
+        check.check_locales(path, output=str(output), max_workers=max_workers)
+    assert exc.value.code == 1
+
+    report = json.loads(output.read_text())
+    assert report["ok"] is False
+    assert report["keys"] == 5
+    assert report["locales"]["de"] == {"missing": [], "extra": [], "placeholders": {}}
+    assert report["locales"]["pl"] == {
+        "missing": ["b.d"],
+        "extra": ["e"],
+        "placeholders": {"a": {"missing": ["name"], "extra": ["user"]}},
+    }
+
+
+def test_check_reference(tmp_path, capsys):
+    path = _write(tmp_path, {
+        "fr.json": {"fr": {"a": "A {x}"}}, "de.json": {"de": {"a": "A {x}"}}})
+    report = check.check_locales(path)
+    assert report["reference"] == "de"
+    assert report["ok"] is True
+    assert check.check_locales(path, reference="fr")["locales"] == {
+        "de": {"missing": [], "extra": [], "placeholders": {}}}
+
+
+def test_check_namespaced(tmp_path):
+    path = _write(tmp_path, {
+        "en/common.json": {"hello": "Hello {name}"}, "en/errors.json": {"e": "E"},
+        "pl/common.json": {"hello": "Cześć {name}"},
+    })
+    with pytest.raises(SystemExit):
+        check.check_locales(path, output=os.devnull)
+    report = check.build_report(
+        check.group_files(check.locale_files(os.path.abspath(path), True), True), "en", True)
+    assert report["locales"]["pl"]["missing"] == ["errors.e"]
+    assert report["locales"]["pl"]["placeholders"] == {}
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_check_corrupted_file(tmp_path, max_workers):
+    path = _write(tmp_path, {
+        "en.json": {"en": {"a": "A"}}, "pl.json": {"pl": {"a": "A"}},
+        "de.json": {"de": {"b": "B"}}})
+    (tmp_path / "fr.json").write_text("{invalid")
+    output = tmp_path / "report.json"
+    with pytest.raises(SystemExit) as exc:
+        check.check_locales(path, output=str(output), max_workers=max_workers)
+    assert exc.value.code == 1
+
+    report = json.loads(output.read_text())
+    assert report["ok"] is False
+    assert [os.path.abspath(file) for file in report["unparsable"]] == [str(tmp_path / "fr.json")]
+    assert report["locales"]["de"]["missing"] == ["a"]
+    assert report["locales"]["fr"]["missing"] == ["a"]
+
+    for name in ("fr.json", "de.json", "report.json"):
+        (tmp_path / name).unlink()
+    assert check.check_locales(path)["unparsable"] == {}
+
+
+def test_check_unknown_reference():
+    with pytest.raises(SystemExit):
+        check.check_locales(test_path, reference="fr")
+
+
+def test_check_invalid_path():
+    with pytest.raises(SystemExit):
+        check.check_locales('some_invalid_path/')
+    with pytest.raises(SystemExit):
+        check.check_locales(empty_locales)
@@ -0,0 +1,52 @@
+# flake8: noqa
+import shutil
+import pytest
+from pyi18n.tasks import compile as compile_task
+from pyi18n.compiled import read_catalog
+from tests.helpers import test_path, empty_locales, namespaced_path
+
+
+def test_compile_locales(tmp_path):
+    output: str = str(tmp_path / "locales.i18nc")
+    compile_task.compile_locales(test_path, output, source_format="yaml")
+    header, translations = read_catalog(output)
+    assert header["namespaced"] is False
+    assert header["format"] == "yaml"
+    assert set(header["sources"]) == {"en.yml", "pl.yaml"}
+    assert set(translations.keys()) == {"en", "pl"}
+
+
+def test_compile_locales_mixed_formats(tmp_path):
+    with pytest.raises(SystemExit):
+        compile_task.compile_locales(test_path, str(tmp_path / "out"))
+
+
+def test_compile_locales_default_output(tmp_path, monkeypatch):
+    shutil.copytree(namespaced_path, tmp_path / "locales")
+    monkeypatch.chdir(tmp_path)
+    compile_task.compile_locales("locales/", source_format="json")
+    header, translations = read_catalog(str(tmp_path / "locales.i18nc"))
+    assert header["namespaced"] is True
+    assert translations["de_DE"]["common"]["greeting"] == "Hallo"
+
+
+def test_compile_invalid_locales_path():
+    with pytest.raises(SystemExit):
+        compile_task.compile_locales('some_invalid_path/')
+
+
+def test_compile_no_locale_in_locales():
+    with pytest.raises(SystemExit):
+        compile_task.compile_locales(empty_locales)
+
+
+def test_compile_locales_mmap(tmp_path):
+    from pyi18n.mmapped import read_mmap_header
+    output: str = str(tmp_path / "locales.i18nm")
+    compile_task.compile_locales(test_path, output, "mmap", "json")
+    assert set(read_mmap_header(output)["locales"]) == {"en", "pl"}
+
+
+def test_compile_locales_invalid_format(tmp_path):
+    with pytest.raises(SystemExit):
+        compile_task.compile_locales(test_path, str(tmp_path / "out"), "invalid")
@@ -1,13 +1,25 @@
 # flake8: noqa
+import json
+import os
+import shutil
+import tracemalloc
+from hashlib import sha256
 import pytest
+import yaml
 from pyi18n.tasks import normalize
 from tests.helpers import (test_path, empty_locales, not_raises,
-                           namespaced_json)
+                           namespaced_json, namespaced_yml)
 
 
-def test_should_normalize_locales():
+def _copy(source: str, tmp_path) -> str:
+    target = tmp_path / "locales"
+    shutil.copytree(source, target)
+    return f"{os.path.relpath(target)}/"
+
+
+def test_should_normalize_locales(tmp_path):
     with not_raises(Exception):
-        normalize.normalize_locales(test_path)
+        normalize.normalize_locales(_copy(test_path, tmp_path))
 
 
 def test_normalize_invalid_locales_path():
@@ -20,5 +32,119 @@ def test_normalize_no_locale_in_locales():
         normalize.normalize_locales(empty_locales)
 
 
-def test_normalize_namespaced_json():
-    normalize.normalize_locales(namespaced_json)
+def test_normalize_namespaced_json(tmp_path):
+    path = _copy(namespaced_json, tmp_path)
+    normalize.normalize_locales(path, max_workers=1)
+    files = normalize.locale_files(os.path.abspath(path), True)
+    assert {os.path.basename(os.path.dirname(file)) for file in files} == {"de_DE", "en_US"}
+    for file in files:
+        with open(file, encoding="utf-8") as _f:
+            content = _f.read()
+        assert content == json.dumps(json.loads(content), sort_keys=True, indent=4)
+
+
+@pytest.mark.parametrize("source", [test_path, namespaced_json, namespaced_yml])
+def test_normalize_skips_normalized_files(tmp_path, source):
+    path = _copy(source, tmp_path)
+    normalize.normalize_locales(path, max_workers=2)
+    files = normalize.locale_files(os.path.abspath(path), source != test_path)
+    mtimes = {file: os.stat(file).st_mtime_ns for file in files}
+
+    assert normalize.normalize_locales(path, max_workers=2) == ()
+    assert {file: os.stat(file).st_mtime_ns for file in files} == mtimes
+
+
+def test_normalize_keeps_file_names(tmp_path):
+    path = _copy(test_path, tmp_path)
+    normalize.normalize_locales(path)
+    assert sorted(os.listdir(path)) == ["en.json", "en.yml", "pl.json", "pl.yaml"]
+
+
+def test_normalize_check(tmp_path):
+    path = _copy(namespaced_json, tmp_path)
+    files = normalize.locale_files(os.path.abspath(path), True)
+    contents = {file: open(file, encoding="utf-8").read() for file in files}
+
+    with pytest.raises(SystemExit) as exc:
+        normalize.normalize_locales(path, check=True)
+    assert exc.value.code == 1
+    assert {file: open(file, encoding="utf-8").read() for file in files} == contents
+
+    normalize.normalize_locales(path)
+    assert normalize.normalize_locales(path, check=True) == ()
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_normalize_corrupted_file(tmp_path, max_workers):
+    path = _copy(test_path, tmp_path)
+    (tmp_path / "locales" / "de.json").write_text("{invalid")
+    (tmp_path / "locales" / "en.json").write_text('{"en": {"b": "B", "a": "A"}}')
+    changed = normalize.normalize_locales(path, max_workers=max_workers)
+    assert os.path.abspath(f"{path}en.json") in map(os.path.abspath, changed)
+    assert list(json.loads((tmp_path / "locales" / "en.json").read_text())["en"]) == ["a", "b"]
+    assert (tmp_path / "locales" / "de.json").read_text() == "{invalid"
+
+    with pytest.raises(SystemExit):
+        normalize.normalize_locales(path, check=True)
+
+
+def test_normalize_empty_namespace(tmp_path):
+    path = _copy(namespaced_yml, tmp_path)
+    locale = sorted(os.listdir(path))[0]
+    empty = tmp_path / "locales" / locale / "empty.yml"
+    empty.write_text("")
+    comments = tmp_path / "locales" / locale / "comments.yml"
+    comments.write_text("# nothing yet\n")
+
+    changed = normalize.normalize_locales(path, max_workers=1)
+    assert not {os.path.basename(file) for file in changed} & {"empty.yml", "comments.yml"}
+    assert empty.read_text() == ""
+    assert comments.read_text() == "# nothing yet\n"
+    assert normalize.normalize_locales(path, check=True) == ()
+
+
+def test_normalize_file(tmp_path):
+    file = tmp_path / "en.yml"
+    file.write_text("en:\n  b: B\n  a: A\n")
+    assert normalize.normalize_file(str(file), check=True) is True
+    assert file.read_text() == "en:\n  b: B\n  a: A\n"
+    assert normalize.normalize_file(str(file)) is True
+    assert file.read_text() == "en:\n  a: A\n  b: B\n"
+    assert normalize.normalize_file(str(file)) is False
+
+
+@pytest.mark.parametrize("fmt", ["yaml", "json"])
+def test_write_canonical_matches_dump(fmt):
+    content = {"en": {"b": ["x", {"d": 1, "c": None}], "a": "Zażółć", "e": {}}}
+    writer = normalize.CanonicalWriter()
+    normalize.write_canonical(content, fmt, writer)
+    expected = yaml.dump(content) if fmt == "yaml" else json.dumps(content, sort_keys=True, indent=4)
+    assert writer.digest() == sha256(expected.encode()).digest()
+
+
+def test_normalize_file_keeps_mode_and_cleans_up(tmp_path):
+    file = tmp_path / "en.json"
+    file.write_text('{"b": 1, "a": 2}')
+    os.chmod(file, 0o644)
+    assert normalize.normalize_file(str(file)) is True
+    assert os.stat(file).st_mode & 0o777 == 0o644
+    assert os.listdir(tmp_path) == ["en.json"]
+    assert normalize.normalize_file(str(file)) is False
+    assert os.listdir(tmp_path) == ["en.json"]
+
+
+def test_normalize_memory_bounded_by_file(tmp_path):
+    content = {"en": {f"key_{index}": f"translation {index}" for index in range(5000)}}
+    directory = tmp_path / "locales"
+    directory.mkdir()
+    for index in range(6):
+        (directory / f"l{index}.json").write_text(json.dumps(content))
+
+    tracemalloc.start()
+    normalize.normalize_file(str(directory / "l0.json"), check=True)
+    single = tracemalloc.get_traced_memory()[1]
+    tracemalloc.reset_peak()
+    normalize.normalize_locales(f"{os.path.relpath(directory)}/", max_workers=1)
+    whole = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    assert whole < single * 2
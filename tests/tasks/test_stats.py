@@ -0,0 +1,46 @@
+# flake8: noqa
+import json
+import pytest
+from pyi18n.tasks import stats
+from tests.helpers import test_path, empty_locales, namespaced_json
+
+
+def test_locale_stats_table(capsys):
+    report = stats.locale_stats(test_path)
+    assert set(report["locales"]) == {"en.json", "en.yml", "pl.json", "pl.yaml"}
+    assert report["locales"]["en.yml"]["keys"] == 14
+    table = capsys.readouterr().out
+    assert table.splitlines()[0].split()[:6] == ["locale", "files", "size", "keys", "depth", "memory"]
+    assert "pl.yaml" in table
+
+
+def test_locale_stats_namespaced_json(tmp_path):
+    output = tmp_path / "stats.json"
+    report = stats.locale_stats(namespaced_json, str(output), as_json=True)
+    assert json.loads(output.read_text()) == json.loads(json.dumps(report))
+    de_de = report["locales"]["de_DE"]
+    assert set(de_de["namespaces"]) == {"analysis", "common"}
+    assert de_de["keys"] == sum(namespace["keys"] for namespace in de_de["namespaces"].values())
+    assert de_de["depth"] == 2
+    assert report["total"]["files"] == 4
+
+
+def test_locale_stats_corrupted_file(tmp_path):
+    (tmp_path / "en.json").write_text(json.dumps({"en": {"a": "A", "b": {"c": "C"}}}))
+    (tmp_path / "pl.json").write_text("{invalid")
+    report = stats.build_report((str(tmp_path / "en.json"), str(tmp_path / "pl.json")), False)
+    assert set(report["locales"]) == {"en"}
+    assert report["locales"]["en"]["keys"] == 2
+    assert list(report["unparsable"]) == [str(tmp_path / "pl.json")]
+    assert report["total"]["files"] == 1
+    assert "pl" not in stats.format_table(report)
+
+
+def test_locale_stats_invalid_path():
+    with pytest.raises(SystemExit):
+        stats.locale_stats('some_invalid_path/')
+
+
+def test_locale_stats_empty_path():
+    with pytest.raises(SystemExit):
+        stats.locale_stats(empty_locales)
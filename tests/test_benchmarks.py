@@ -0,0 +1,54 @@
+# flake8: noqa
+""" tests for benchmarks package """
+import json
+import os
+import pytest
+
+from benchmarks.generator import generate_catalog, key_paths
+from benchmarks.suite import run_suite
+from pyi18n import PyI18n
+from pyi18n.loaders import PyI18nJsonLoader, PyI18nYamlLoader
+
+
+def test_key_paths():
+    paths = key_paths(9, 3)
+    assert len(paths) == 9
+    assert all(path.count(".") == 2 for path in paths)
+    assert len(set(paths)) == 9
+    assert key_paths(3, 1) == ("key_0", "key_1", "key_2")
+
+
+def test_generate_catalog_flat(tmp_path):
+    names, paths = generate_catalog(str(tmp_path), locales=2, keys=20, depth=2)
+    assert names == ("l000", "l001")
+    assert sorted(os.listdir(tmp_path)) == ["l000.yml", "l001.yml"]
+    i18n = PyI18n(names, loader=PyI18nYamlLoader(f"{tmp_path}/"))
+    assert i18n.gettext("l001", paths[3]) == "l001 translation number 3"
+    assert i18n.gettext("l000", paths[0], name="Ann", total=2) == "l000 hello Ann, you have 2 messages"
+
+
+def test_generate_catalog_namespaced(tmp_path):
+    names, paths = generate_catalog(str(tmp_path), locales=1, keys=20, depth=3,
+                                    fmt="json", namespaced=True)
+    namespace = paths[0].split(".")[0]
+    assert os.path.exists(tmp_path / "l000" / f"{namespace}.json")
+    i18n = PyI18n(names, loader=PyI18nJsonLoader(f"{tmp_path}/", namespaced=True))
+    assert i18n.gettext("l000", paths[1]) == "l000 translation number 1"
+
+
+def test_generate_catalog_invalid(tmp_path):
+    with pytest.raises(ValueError):
+        generate_catalog(str(tmp_path), fmt="toml")
+    with pytest.raises(ValueError):
+        generate_catalog(str(tmp_path), depth=1, namespaced=True)
+
+
+def test_run_suite():
+    results = run_suite(locales=2, keys=20, depth=2, number=10, isolate=False)
+    json.dumps(results)
+    assert set(results) == {"meta", "gettext", "load", "memory", "normalize"}
+    assert set(results["gettext"]) == {"nested", "flat_index", "frozen", "mmap"}
+    assert set(results["gettext"]["nested"]) == {"hit", "miss", "kwargs", "plural"}
+    assert set(results["load"]) == {"default", "threads", "cache", "compiled", "mmap"}
+    assert results["load"]["default"]["cold"] > 0
+    assert results["normalize"]["seconds"] > 0
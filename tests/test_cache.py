@@ -0,0 +1,137 @@
+# flake8: noqa
+""" tests for module pyi18n/cache.py """
+import os
+import shutil
+import pytest
+
+from pyi18n import cache, parsers
+from pyi18n.loaders import PyI18nYamlLoader
+from tests.helpers import test_path, namespaced_path, locale_content
+
+
+@pytest.fixture
+def parse_calls(monkeypatch):
+    calls: list = []
+    parser = parsers.get_parser("yaml")
+    loads = parser.loads
+
+    def counting_loads(content):
+        calls.append(content)
+        return loads(content)
+
+    monkeypatch.setattr(parser, "loads", counting_loads)
+    return calls
+
+
+def _copy(tmp_path, name: str = "en.yml") -> str:
+    path = tmp_path / name
+    shutil.copy(os.path.join(test_path, name), path)
+    return str(path)
+
+
+def test_parse_cached_hit(tmp_path, parse_calls):
+    file_path = _copy(tmp_path)
+    cache_dir = str(tmp_path / "cache")
+    assert cache.parse_cached(file_path, "yaml", cache_dir) == {"en": locale_content["en"]}
+    assert cache.parse_cached(file_path, "yaml", cache_dir) == {"en": locale_content["en"]}
+    assert len(parse_calls) == 1
+    assert os.listdir(cache_dir) == [os.path.basename(cache.cache_path(cache_dir, file_path))]
+
+
+def test_parse_cached_touched_file_uses_hash(tmp_path, parse_calls):
+    file_path = _copy(tmp_path)
+    cache_dir = str(tmp_path / "cache")
+    cache.parse_cached(file_path, "yaml", cache_dir)
+    mtime = os.stat(file_path).st_mtime_ns + 10**9
+    os.utime(file_path, ns=(mtime, mtime))
+
+    assert cache.parse_cached(file_path, "yaml", cache_dir)["en"] == locale_content["en"]
+    assert len(parse_calls) == 1
+    assert cache.read_entry(cache.cache_path(cache_dir, file_path))[0][2] == mtime
+
+
+def test_parse_cached_changed_file(tmp_path, parse_calls):
+    file_path = _copy(tmp_path)
+    cache_dir = str(tmp_path / "cache")
+    cache.parse_cached(file_path, "yaml", cache_dir)
+    with open(file_path, "w") as _f:
+        _f.write("en:\n  hello: changed\n")
+
+    assert cache.parse_cached(file_path, "yaml", cache_dir) == {"en": {"hello": "changed"}}
+    assert len(parse_calls) == 2
+
+
+def test_parse_cached_corrupted_entry(tmp_path):
+    file_path = _copy(tmp_path)
+    cache_dir = str(tmp_path / "cache")
+    cache.parse_cached(file_path, "yaml", cache_dir)
+    entry_path = cache.cache_path(cache_dir, file_path)
+    with open(entry_path, "r+b") as _f:
+        _f.truncate(len(cache.CACHE_MAGIC) + 3)
+
+    assert cache.read_entry(entry_path) is None
+    assert cache.parse_cached(file_path, "yaml", cache_dir)["en"] == locale_content["en"]
+    assert cache.read_entry(entry_path) is not None
+
+
+def test_parse_cached_skips_unmarshalable(tmp_path):
+    file_path = tmp_path / "en.yml"
+    file_path.write_text("en:\n  released: 2023-03-26 10:00:00\n")
+    cache_dir = tmp_path / "cache"
+    for _ in range(2):
+        content = cache.parse_cached(str(file_path), "yaml", str(cache_dir))
+        assert content["en"]["released"].year == 2023
+    assert os.listdir(cache_dir) == []
+
+
+def test_read_entry_ignores_pickle(tmp_path):
+    import marshal, pickle
+    entry_path = tmp_path / "entry.cache"
+    with open(entry_path, "wb") as _f:
+        _f.write(cache.CACHE_MAGIC)
+        marshal.dump(("en.yml", 1, 1, "digest"), _f)
+        _f.write(pickle.dumps({"en": {}}))
+    assert cache.read_entry(str(entry_path)) is None
+
+
+def test_write_atomic_removes_temporary_file(tmp_path):
+    file_path = tmp_path / "catalog"
+    file_path.write_bytes(b"old")
+
+    def write(_f):
+        _f.write(b"partial")
+        raise OSError("disk full")
+
+    with pytest.raises(OSError, match="disk full"):
+        cache.write_atomic(str(file_path), write)
+    assert os.listdir(tmp_path) == ["catalog"]
+    assert file_path.read_bytes() == b"old"
+
+    cache.write_atomic(str(file_path), lambda _f: _f.write(b"new"))
+    assert os.listdir(tmp_path) == ["catalog"]
+    assert file_path.read_bytes() == b"new"
+
+
+def test_parse_cached_unwritable_dir(tmp_path, caplog):
+    file_path = _copy(tmp_path)
+    cache_dir = tmp_path / "cache"
+    cache_dir.write_text("not a directory")
+    assert cache.parse_cached(file_path, "yaml", str(cache_dir))["en"] == locale_content["en"]
+    assert "can't write parse cache entry" in caplog.text
+
+
+def test_loader_cache_dir(tmp_path, parse_calls):
+    cache_dir = str(tmp_path / "cache")
+    loader = PyI18nYamlLoader(test_path, cache_dir=cache_dir)
+    assert loader.load(("en", "pl")) == locale_content
+    assert PyI18nYamlLoader(test_path, cache_dir=cache_dir).load(("en", "pl")) == locale_content
+    assert len(parse_calls) == 2
+
+
+def test_loader_cache_dir_namespaced(tmp_path, parse_calls):
+    cache_dir = str(tmp_path / "cache")
+    loader = PyI18nYamlLoader(namespaced_path, namespaced=True, cache_dir=cache_dir)
+    expected = loader.load(("en_US", "de_DE"))
+    calls = len(parse_calls)
+    assert loader.load(("en_US", "de_DE")) == expected
+    assert len(parse_calls) == calls
@@ -0,0 +1,71 @@
+# flake8: noqa
+""" tests for module pyi18n/compaction.py """
+from pyi18n.compaction import compact_catalog
+from pyi18n.loaders import PyI18nJsonLoader, PyI18nYamlLoader
+from tests.helpers import test_path
+
+
+def _copy(value: str) -> str:
+    return "".join(list(value))
+
+
+def test_compact_catalog_dedup_values():
+    content = {
+        "en": {"ok": _copy("OK"), "nested": {"ok": _copy("OK")}},
+        "pl": {"ok": _copy("OK"), "items": [_copy("OK"), {"ok": _copy("OK")}]},
+    }
+    saved = compact_catalog(content)
+    assert saved > 0
+    assert content["en"]["ok"] is content["pl"]["ok"]
+    assert content["en"]["nested"]["ok"] is content["en"]["ok"]
+    assert content["pl"]["items"][0] is content["en"]["ok"]
+    assert content["pl"]["items"][1]["ok"] is content["en"]["ok"]
+    assert content == {
+        "en": {"ok": "OK", "nested": {"ok": "OK"}},
+        "pl": {"ok": "OK", "items": ["OK", {"ok": "OK"}]},
+    }
+
+
+def test_compact_catalog_interns_keys_and_keeps_order():
+    first, second = {_copy("key_a"): 1, _copy("key_b"): True}, {_copy("key_a"): 2, 3: None}
+    compact_catalog({"a": first, "b": second})
+    assert [id(key) for key in first][0] == [id(key) for key in second][0]
+    assert list(first) == ["key_a", "key_b"]
+    assert list(second) == ["key_a", 3]
+
+
+def test_compact_catalog_idempotent():
+    content = {"en": {"ok": _copy("OK")}, "pl": {"ok": _copy("OK")}}
+    pool: dict = {}
+    assert compact_catalog(content, pool) > 0
+    assert compact_catalog(content, pool) == 0
+
+
+def _namespaced(tmp_path):
+    for locale in ("en", "de"):
+        (tmp_path / locale).mkdir()
+        (tmp_path / locale / "common.yml").write_text("ok: OK\ncancel: Cancel\n")
+        (tmp_path / locale / "forms.yml").write_text("submit: OK\n")
+    return PyI18nYamlLoader(f"{tmp_path}/", namespaced=True, compact=True)
+
+
+def test_loader_compact_shares_values_of_single_load(tmp_path):
+    loader = _namespaced(tmp_path)
+    loaded = loader.load(("en", "de"))
+    assert loader.saved_bytes > 0
+    assert loaded["en"]["common"]["ok"] is loaded["de"]["common"]["ok"] is loaded["de"]["forms"]["submit"]
+    assert not hasattr(loader, "_pool")
+
+
+def test_loader_compact_async(tmp_path):
+    import asyncio
+    loader = _namespaced(tmp_path)
+    loaded = asyncio.run(loader.load_async(("en", "de")))
+    assert loader.saved_bytes > 0
+    assert loaded["en"]["common"]["ok"] is loaded["de"]["forms"]["submit"]
+
+
+def test_loader_compact_disabled():
+    loader = PyI18nJsonLoader(test_path)
+    assert loader.load(("en", "pl")) == PyI18nJsonLoader(test_path, compact=True).load(("en", "pl"))
+    assert loader.saved_bytes == 0
@@ -0,0 +1,93 @@
+# flake8: noqa
+""" tests for module pyi18n/compiled.py """
+import os
+import shutil
+import pytest
+
+from pyi18n import compiled
+from tests.helpers import test_path, namespaced_path, locale_content, corrupted_path
+
+
+def test_scan_sources_flat():
+    fmt, namespaced, files = compiled.scan_sources(test_path, "json")
+    assert fmt == "json"
+    assert not namespaced
+    assert files == ["en.json", "pl.json"]
+    assert compiled.scan_sources(test_path, "yaml") == ("yaml", False, ["en.yml", "pl.yaml"])
+
+
+def test_scan_sources_mixed_formats():
+    with pytest.raises(ValueError):
+        compiled.scan_sources(test_path)
+    with pytest.raises(ValueError):
+        compiled.scan_sources(test_path, "toml")
+
+
+def test_scan_sources_ignores_stray_files(tmp_path):
+    shutil.copytree(namespaced_path, tmp_path / "locales")
+    (tmp_path / "locales" / "README.md").write_text("docs")
+    (tmp_path / "locales" / "en_US" / ".gitkeep").write_text("")
+    fmt, namespaced, files = compiled.scan_sources(str(tmp_path / "locales"), "json")
+    assert (fmt, namespaced) == ("json", True)
+    assert files == compiled.scan_sources(namespaced_path, "json")[2]
+
+
+def test_scan_sources_namespaced():
+    fmt, namespaced, files = compiled.scan_sources(namespaced_path, "json")
+    assert namespaced
+    assert "en_US/common.json" in files
+
+
+def test_build_catalog():
+    header, translations = compiled.build_catalog(test_path, "json")
+    assert header["version"] == compiled.CATALOG_VERSION
+    assert header["format"] == "json"
+    assert translations == locale_content
+
+
+def test_build_catalog_skips_corrupted():
+    header, translations = compiled.build_catalog(corrupted_path, "json")
+    assert translations == {}
+
+
+def test_write_and_read_catalog(tmp_path):
+    catalog_path: str = str(tmp_path / "locales.i18nc")
+    header = compiled.write_catalog(catalog_path, test_path, "json")
+    assert compiled.read_catalog(catalog_path) == (header, locale_content)
+    assert compiled.read_catalog(catalog_path, header_only=True) == (header, None)
+    assert os.listdir(tmp_path) == ["locales.i18nc"]
+
+
+def test_write_catalog_concurrent_writers(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+    catalog_path: str = str(tmp_path / "locales.i18nc")
+    with ThreadPoolExecutor(8) as executor:
+        headers = list(executor.map(
+            lambda _: compiled.write_catalog(catalog_path, test_path, "json"), range(32)))
+    assert compiled.read_catalog(catalog_path) == (headers[-1], locale_content)
+    assert os.listdir(tmp_path) == ["locales.i18nc"]
+
+
+def test_read_catalog_invalid_file():
+    with pytest.raises(ValueError):
+        compiled.read_catalog(f"{test_path}en.json")
+
+
+def test_stale_sources(tmp_path):
+    source_path = tmp_path / "locales"
+    shutil.copytree(test_path, source_path)
+    header, _ = compiled.build_catalog(str(source_path), "json")
+    assert compiled.stale_sources(header) == []
+
+    # touched, content unchanged
+    os.utime(source_path / "en.json", ns=(1, 1))
+    assert compiled.stale_sources(header) == []
+
+    (source_path / "en.json").write_text('{"en": {}}', encoding="utf-8")
+    (source_path / "de.json").write_text('{"de": {}}', encoding="utf-8")
+    assert compiled.stale_sources(header) == ["de.json", "en.json"]
+
+
+def test_stale_sources_missing_source_path(tmp_path):
+    header, _ = compiled.build_catalog(test_path, "json")
+    assert compiled.stale_sources(header, str(tmp_path / "missing")) == []
@@ -0,0 +1,61 @@
+# flake8: noqa
+""" tests for module pyi18n/frozen.py """
+import pytest
+
+from pyi18n.frozen import FrozenCatalog, freeze_catalog
+
+content: dict = {
+    "hello": {"world": "Hello world!", "user": "Hello {user}!"},
+    "labels": {"nested": {"deep": "Deep"}, "empty": {}, "list": ["a", "b"]},
+    "top": "Top",
+    1: "unreachable",
+}
+
+
+def test_freeze_catalog_paths():
+    catalog = freeze_catalog(content)
+    assert isinstance(catalog, FrozenCatalog)
+    assert list(catalog) == ["hello", "labels", "top"]
+    assert len(catalog) == 3
+    assert catalog["hello.world"] == "Hello world!"
+    assert catalog["labels.list"] == ["a", "b"]
+    assert catalog["labels.empty"] == {}
+
+
+def test_frozen_catalog_subtree():
+    catalog = freeze_catalog(content)
+    assert catalog["hello"] == content["hello"]
+    assert catalog["labels"] == content["labels"]
+    assert catalog["labels"]["nested"]["deep"] == "Deep"
+    assert catalog["labels"] is not catalog["labels"]
+    assert catalog.to_dict() == {key: value for key, value in content.items() if key != 1}
+
+
+def test_frozen_catalog_nested_lookup():
+    from functools import reduce
+    from operator import getitem
+    catalog = freeze_catalog(content)
+    assert reduce(getitem, "labels.nested.deep".split("."), catalog) == "Deep"
+
+
+def test_frozen_catalog_missing():
+    catalog = freeze_catalog(content)
+    with pytest.raises(KeyError):
+        catalog["hello.invalid"]
+    with pytest.raises(KeyError):
+        catalog["hell"]
+    with pytest.raises(KeyError):
+        catalog["top.deeper"]
+    assert catalog.get("1") is None
+    assert "hello" in catalog
+    assert "hello.world" in catalog
+    assert "hell" not in catalog
+    assert 1 not in catalog
+
+
+def test_frozen_catalog_immutable():
+    catalog = freeze_catalog(content)
+    with pytest.raises(TypeError):
+        catalog["top"] = "changed"
+    with pytest.raises(AttributeError):
+        catalog.extra = True
@@ -162,3 +162,73 @@ def test_load_empty_file_json():
     file_path: str = f"{namespaced_path}de_DE/empty.json"
     with pytest.raises(json.decoder.JSONDecodeError):
         helpers.load_file(file_path, json, 'json')
+
+
+def test_flatten():
+    content: dict = {'hello': {'world': 'Hello world!', 'user': 'Hi {user}'}, 'ok': 'OK'}
+    result: dict = helpers.flatten(content)
+    assert result['hello.world'] == 'Hello world!'
+    assert result['hello.user'] == 'Hi {user}'
+    assert result['ok'] == 'OK'
+    assert result['hello'] is content['hello']
+
+
+def test_flatten_with_prefix():
+    result: dict = helpers.flatten({'world': 'Hello world!'}, 'hello')
+    assert result == {'hello.world': 'Hello world!'}
+
+
+def test_flatten_empty():
+    assert helpers.flatten({}) == {}
+
+
+def test_flatten_skips_non_str_keys():
+    result: dict = helpers.flatten({1: 'one', 'two': {2: 'two'}})
+    assert result == {'two': {2: 'two'}}
+
+
+def test_load_locale_lazy():
+    result = helpers.load_locale(f"{namespaced_path}de_DE", json, 'json', lazy=True)
+    assert isinstance(result, helpers.LazyLocale)
+    assert set(result.keys()) == {'common', 'analysis'}
+    assert result.loaded_namespaces == ()
+    assert result['common']['greeting'] == 'Hallo'
+    assert result.loaded_namespaces == ('common',)
+    assert result['common'] is result['common']
+
+
+def test_load_locale_lazy_unknown_namespace():
+    result = helpers.load_locale(f"{namespaced_path}de_DE", yaml, 'yaml', lazy=True)
+    with pytest.raises(KeyError):
+        result['invalid']
+    assert result.loaded_namespaces == ()
+
+
+def test_load_locale_lazy_same_as_eager():
+    path: str = f"{namespaced_path}en_US"
+    assert dict(helpers.load_locale(path, yaml, 'yaml', lazy=True)) == \
+        helpers.load_locale(path, yaml, 'yaml')
+
+
+def test_load_locale_with_executor():
+    from concurrent.futures import ThreadPoolExecutor
+    path: str = f"{namespaced_path}en_US"
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        result = helpers.load_locale(path, yaml, 'yaml', executor=executor)
+    assert result == helpers.load_locale(path, yaml, 'yaml')
+
+
+def test_load_file_by_name():
+    file_path: str = f"{namespaced_path}de_DE/common.json"
+    assert helpers.load_file_by_name(file_path, 'json', 'json') == \
+        helpers.load_file(file_path, json, 'json')
+
+
+def test_merge_translations():
+    base = {"a": {"b": "base", "c": "base"}, "d": "base", "shared": {"x": "y"}}
+    overlay = {"a": {"b": "overlay"}, "d": {"e": "overlay"}}
+    merged = helpers.merge_translations(base, overlay)
+    assert merged == {"a": {"b": "overlay", "c": "base"}, "d": {"e": "overlay"}, "shared": {"x": "y"}}
+    assert merged["shared"] is base["shared"]
+    assert base == {"a": {"b": "base", "c": "base"}, "d": "base", "shared": {"x": "y"}}
+    assert helpers.merge_translations() == {}
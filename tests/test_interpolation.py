@@ -0,0 +1,69 @@
+# flake8: noqa
+""" tests for module pyi18n/interpolation.py """
+from collections import defaultdict
+import pytest
+
+from pyi18n.interpolation import compile_template, placeholders
+
+
+def test_compile_template_names():
+    template = compile_template("Hello {name} {surname}! You are {age}, {name}.")
+    assert template.simple
+    assert template.names == ('name', 'surname', 'age')
+
+
+def test_compile_template_without_placeholders():
+    template = compile_template("Hello world!")
+    assert template.simple
+    assert template.names == ()
+    assert template.render({'name': 'John'}) == "Hello world!"
+
+
+def test_render_template():
+    template = compile_template("Hello {name} {surname}!")
+    assert template.render({'name': 'John', 'surname': 'Conor'}) == "Hello John Conor!"
+
+
+def test_render_template_missing_placeholder():
+    template = compile_template("Hello {name} {surname}!")
+    assert template.render({'name': 'John'}) == "Hello John !"
+
+
+def test_render_template_escaped_braces():
+    template = compile_template("{{literal}} {name}")
+    assert template.render({'name': 'John'}) == "{literal} John"
+
+
+def test_render_template_conversion_and_spec():
+    template = compile_template("{name!r} {age:>4}")
+    assert template.simple
+    assert template.render({'name': 'John', 'age': 5}) == "'John'    5"
+
+
+@pytest.mark.parametrize("source", ["{0}", "{}", "{user.name}", "{a[0]}", "{x:{w}}", "{", "}"])
+def test_render_template_not_simple(source):
+    template = compile_template(source)
+    assert not template.simple
+
+
+@pytest.mark.parametrize("source", [
+    "Hello {name}!", "{name!r} {age:>4}", "{{x}} {name}", "{x:{w}}",
+    "{user-name}", "{ name }", "", "{name}{name}"
+])
+def test_render_template_same_as_format_map(source):
+    kwargs: dict = {'name': 'John', 'age': 5, 'w': 3, 'x': 1}
+    expected: str = source.format_map(defaultdict(str, **kwargs))
+    assert compile_template(source).render(kwargs) == expected
+
+
+def test_render_template_positional_field_raises():
+    with pytest.raises(ValueError):
+        compile_template("{0}").render({'name': 'John'})
+
+
+def test_placeholders():
+    assert placeholders("Hello {name}, {count!r:>3} {user.name} {items[0]}") == \
+        frozenset({"name", "count", "user", "items"})
+    assert placeholders("no fields {{escaped}}") == frozenset()
+    assert placeholders("{} {0}") == frozenset({"", "0"})
+    assert placeholders("broken {name") == frozenset()
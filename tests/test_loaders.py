@@ -3,6 +3,7 @@ from tests.helpers import (test_path, bigger_files_path,
                            corrupted_path, namespaced_path,
                            namespaced_empty_path, namespaced_bigger_path)
 from pyi18n import loaders
+import pytest
 
 
 def test_loaders_yaml_loader():
@@ -233,3 +234,214 @@ def test_loader_json_namespaced_but_without_parameter():
     loaded_locales = loader.load(locales)
     assert loader.type == "json"
     assert not loaded_locales
+
+
+def test_loader_has_locale():
+    loader = loaders.PyI18nYamlLoader(test_path)
+    assert loader.has_locale("en")
+    assert loader.has_locale("pl")
+    assert not loader.has_locale("ru")
+
+
+def test_loader_has_locale_json():
+    loader = loaders.PyI18nJsonLoader(test_path)
+    assert loader.has_locale("en")
+    assert not loader.has_locale("ru")
+
+
+def test_loader_has_locale_namespaced():
+    loader = loaders.PyI18nJsonLoader(namespaced_path, namespaced=True)
+    assert loader.has_locale("en_US")
+    assert not loader.has_locale("pl_PL")
+
+
+def test_loader_has_locale_unknown_extensions():
+    loader = loaders.PyI18nBaseLoader(test_path)
+    assert loader.has_locale("ru")
+
+
+def test_loader_yml_namespaced_lazy():
+    loader = loaders.PyI18nYamlLoader(namespaced_path, namespaced=True, lazy=True)
+    locales: tuple = ('en_US', 'de_DE')
+    loaded_locales = loader.load(locales)
+    assert list(loaded_locales.keys()) == list(locales)
+    assert loaded_locales['en_US'].loaded_namespaces == ()
+    assert loaded_locales['en_US']['common']
+    assert loaded_locales['en_US'].loaded_namespaces == ('common',)
+
+
+def test_loader_json_namespaced_lazy_empty():
+    loader = loaders.PyI18nJsonLoader(namespaced_empty_path, namespaced=True, lazy=True)
+    assert not loader.load(('en_US', 'de_DE'))
+
+
+def test_loader_invalid_executor_mode():
+    with pytest.raises(ValueError):
+        loaders.PyI18nYamlLoader(test_path, mode="invalid")
+
+
+@pytest.mark.parametrize("mode", ["thread", "process"])
+def test_loaders_yaml_loader_concurrent(mode):
+    locales: tuple = ("en", "pl", "ru")
+    expected = loaders.PyI18nYamlLoader(test_path).load(locales)
+    loader = loaders.PyI18nYamlLoader(test_path, max_workers=2, mode=mode)
+    loaded_locales = loader.load(locales)
+    assert loaded_locales == expected
+    assert tuple(loaded_locales.keys()) == ("en", "pl")
+
+
+@pytest.mark.parametrize("mode", ["thread", "process"])
+def test_loaders_json_loader_concurrent_corrupted(mode):
+    loader = loaders.PyI18nJsonLoader(corrupted_path, max_workers=2, mode=mode)
+    assert not loader.load(("pl",))
+
+
+@pytest.mark.parametrize("mode", ["thread", "process"])
+def test_loader_yml_namespaced_concurrent(mode):
+    locales: tuple = ('en_US', 'de_DE', 'pl_PL')
+    expected = loaders.PyI18nYamlLoader(namespaced_path, namespaced=True).load(locales)
+    loader = loaders.PyI18nYamlLoader(namespaced_path, namespaced=True,
+                                      max_workers=2, mode=mode)
+    loaded_locales = loader.load(locales)
+    assert loaded_locales == expected
+    assert list(loaded_locales.keys()) == ['en_US', 'de_DE']
+
+
+def test_loader_json_namespaced_concurrent_empty():
+    loader = loaders.PyI18nJsonLoader(namespaced_empty_path, namespaced=True, max_workers=2)
+    assert not loader.load(('en_US', 'de_DE'))
+
+
+@pytest.mark.parametrize("parser", ["pyyaml", "libyaml"])
+def test_loaders_yaml_loader_pinned_parser(parser):
+    if parser not in loaders.available_parsers("yaml"):
+        pytest.skip(f"{parser} not installed")
+    loader = loaders.PyI18nYamlLoader(test_path, parser=parser)
+    assert loader.load(("en", "pl")) == loaders.PyI18nYamlLoader(test_path).load(("en", "pl"))
+
+
+def test_loaders_json_loader_pinned_parser_corrupted():
+    loader = loaders.PyI18nJsonLoader(corrupted_path, parser="json")
+    assert not loader.load(("pl",))
+
+
+def test_loaders_pinned_parser_not_available():
+    with pytest.raises(ValueError):
+        loaders.PyI18nJsonLoader(test_path, parser="pyyaml")
+
+
+def test_loader_json_namespaced_pinned_parser():
+    loader = loaders.PyI18nJsonLoader(namespaced_path, namespaced=True, parser="json")
+    loaded_locales = loader.load(('de_DE',))
+    assert loaded_locales['de_DE']['common']['greeting'] == 'Hallo'
+
+
+def test_compiled_loader(tmp_path):
+    from pyi18n.compiled import write_catalog
+    catalog_path: str = str(tmp_path / "locales.i18nc")
+    write_catalog(catalog_path, test_path, "json")
+    loader = loaders.PyI18nCompiledLoader(catalog_path)
+    loaded_locales = loader.load(("en", "pl", "ru"))
+    assert loaded_locales == loaders.PyI18nJsonLoader(test_path).load(("en", "pl"))
+    assert loader.type == "compiled"
+
+
+def test_compiled_loader_missing_catalog(tmp_path):
+    loader = loaders.PyI18nCompiledLoader(str(tmp_path / "missing.i18nc"))
+    assert loader.load(("en",)) == {}
+
+
+def test_compiled_loader_invalid_policy():
+    with pytest.raises(ValueError):
+        loaders.PyI18nCompiledLoader("locales.i18nc", on_stale="invalid")
+
+
+def _stale_catalog(tmp_path) -> tuple:
+    import shutil
+    from pyi18n.compiled import write_catalog
+    source_path = tmp_path / "locales"
+    shutil.copytree(test_path, source_path)
+    catalog_path: str = str(tmp_path / "locales.i18nc")
+    write_catalog(catalog_path, str(source_path), "json")
+    (source_path / "en.json").write_text('{"en": {"hello": "Hi"}}', encoding="utf-8")
+    return catalog_path, str(source_path)
+
+
+def test_compiled_loader_stale_raise(tmp_path):
+    catalog_path, _ = _stale_catalog(tmp_path)
+    with pytest.raises(ValueError):
+        loaders.PyI18nCompiledLoader(catalog_path).load(("en",))
+
+
+def test_compiled_loader_stale_recompile(tmp_path):
+    catalog_path, _ = _stale_catalog(tmp_path)
+    loader = loaders.PyI18nCompiledLoader(catalog_path, on_stale="recompile")
+    assert loader.load(("en",)) == {"en": {"hello": "Hi"}}
+    assert loaders.PyI18nCompiledLoader(catalog_path).load(("en",)) == {"en": {"hello": "Hi"}}
+
+
+def test_compiled_loader_stale_ignore(tmp_path):
+    catalog_path, _ = _stale_catalog(tmp_path)
+    loader = loaders.PyI18nCompiledLoader(catalog_path, on_stale="ignore")
+    assert loader.load(("en",))["en"]["hello"]["world"] == "Hello world!"
+
+
+def test_mmap_loader(tmp_path):
+    from pyi18n.mmapped import write_mmap_catalog
+    catalog_path: str = str(tmp_path / "locales.i18nm")
+    write_mmap_catalog(catalog_path, test_path, "json")
+    loader = loaders.PyI18nMmapLoader(catalog_path)
+    loaded_locales = loader.load(("en", "pl", "ru"))
+    assert tuple(loaded_locales.keys()) == ("en", "pl")
+    assert loaded_locales["en"]["hello.world"] == "Hello world!"
+    assert loader.type == "mmap"
+    assert loader.flat
+
+
+def test_mmap_loader_stale_recompile(tmp_path):
+    import shutil
+    from pyi18n.mmapped import write_mmap_catalog
+    source_path = tmp_path / "locales"
+    shutil.copytree(test_path, source_path)
+    catalog_path: str = str(tmp_path / "locales.i18nm")
+    write_mmap_catalog(catalog_path, str(source_path), "json")
+    (source_path / "en.json").write_text('{"en": {"hello": "Hi"}}', encoding="utf-8")
+    with pytest.raises(ValueError):
+        loaders.PyI18nMmapLoader(catalog_path).load(("en",))
+    loader = loaders.PyI18nMmapLoader(catalog_path, on_stale="recompile")
+    assert loader.load(("en",))["en"]["hello"] == "Hi"
+
+
+@pytest.mark.parametrize("loader", [
+    loaders.PyI18nYamlLoader(test_path),
+    loaders.PyI18nJsonLoader(test_path, max_workers=2),
+    loaders.PyI18nJsonLoader(test_path, max_workers=2, mode="process"),
+    loaders.PyI18nYamlLoader(namespaced_path, namespaced=True),
+])
+def test_loader_load_async_matches_load(loader):
+    import asyncio
+    locales = ("en", "pl", "de_DE", "en_US", "ru")
+    loaded = asyncio.run(loader.load_async(locales))
+    assert loaded == loader.load(locales)
+    assert list(loaded) == list(loader.load(locales))
+
+
+def test_custom_loader_load_async():
+    import asyncio
+
+    class CustomLoader(loaders.PyI18nBaseLoader):
+        def load(self, locales: tuple) -> dict:
+            return {locale: {"locale": locale} for locale in locales}
+
+    assert asyncio.run(CustomLoader(test_path).load_async(("en", "pl"))) == \
+        {"en": {"locale": "en"}, "pl": {"locale": "pl"}}
+
+
+def test_compiled_loader_load_async(tmp_path):
+    import asyncio
+    from pyi18n.compiled import write_catalog
+    catalog_path = str(tmp_path / "locales.i18nc")
+    write_catalog(catalog_path, test_path, "json")
+    loader = loaders.PyI18nCompiledLoader(catalog_path)
+    assert asyncio.run(loader.load_async(("en", "pl"))) == \
+        loader.load(("en", "pl"))
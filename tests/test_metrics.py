@@ -0,0 +1,92 @@
+# flake8: noqa
+""" tests for module pyi18n/metrics.py """
+import os
+
+from pyi18n import PyI18n
+from pyi18n.loaders import PyI18nJsonLoader, PyI18nYamlLoader
+from pyi18n.metrics import PyI18nMetrics, timed_call
+from tests.helpers import test_path, namespaced_path
+
+
+def test_timed_call():
+    seconds, result = timed_call(sum, (1, 2))
+    assert result == 3
+    assert seconds >= 0
+
+
+def test_metrics_snapshot():
+    events: list = []
+    metrics = PyI18nMetrics(sample_every=1, callback=lambda event, data: events.append(event))
+    metrics.record_lookup("en", 3)
+    metrics.record_miss("en")
+    metrics.record_interpolation("en")
+    metrics.record_latency("en", "a.b", 3e-6)
+    metrics.record_latency("en", "a.b", 2.0)
+    metrics.record_load("en.yml", 0.5)
+    metrics.record_load("en.yml", 0.25)
+
+    snapshot = metrics.snapshot()
+    locale = snapshot["locales"]["en"]
+    assert (locale["lookups"], locale["hits"], locale["misses"], locale["interpolations"]) == (3, 2, 1, 1)
+    assert locale["latency"]["samples"] == 2
+    assert locale["latency"]["buckets"]["5e-06"] == 1
+    assert locale["latency"]["buckets"]["+Inf"] == 1
+    assert snapshot["files"]["en.yml"] == {"loads": 2, "seconds": 0.75, "last": 0.25}
+    assert events == ["gettext", "gettext", "load", "load"]
+
+    metrics.reset()
+    assert metrics.snapshot() == {"locales": {}, "files": {}}
+
+
+def test_metrics_sample_every():
+    metrics = PyI18nMetrics(sample_every=3)
+    assert [metrics.sample() for _ in range(6)] == [False, False, True, False, False, True]
+
+
+def test_pyi18n_metrics_disabled_by_default():
+    i18n = PyI18n(("en", "pl"), loader=PyI18nYamlLoader(test_path))
+    assert "_translate" not in i18n.__dict__
+    assert "gettext_many" not in i18n.__dict__
+    assert i18n.stats() == {}
+
+
+def test_pyi18n_metrics():
+    samples: list = []
+    metrics = PyI18nMetrics(sample_every=1, callback=lambda event, data: samples.append((event, data)))
+    i18n = PyI18n(("en", "pl"), loader=PyI18nYamlLoader(test_path), metrics=metrics)
+    i18n.gettext("en", "hello.world")
+    i18n.gettext("en", "hello.invalid")
+    i18n.for_locale("pl").t("hello.hello_user", user="John")
+    i18n.gettext_many("pl", ["hello.world", "hello.invalid"], user="John")
+
+    stats = i18n.stats()
+    assert stats["locales"]["en"]["lookups"] == 2
+    assert stats["locales"]["en"]["hits"] == 1
+    assert stats["locales"]["en"]["misses"] == 1
+    assert stats["locales"]["pl"]["lookups"] == 3
+    assert stats["locales"]["pl"]["interpolations"] == 3
+    assert stats["locales"]["en"]["latency"]["samples"] == 2
+    assert sorted(os.path.basename(path) for path in stats["files"]) == ["en.yml", "pl.yaml"]
+    assert ("gettext", {"locale": "en", "path": "hello.world",
+                        "seconds": samples[2][1]["seconds"]}) == samples[2]
+
+    i18n.disable_metrics()
+    assert "_translate" not in i18n.__dict__
+    assert i18n.loader.metrics is None
+    assert i18n.gettext("en", "hello.world") == "Hello world!"
+    assert i18n.stats() == {}
+
+
+def test_loader_metrics_namespaced():
+    metrics = PyI18nMetrics()
+    PyI18nJsonLoader(namespaced_path, namespaced=True, max_workers=2, metrics=metrics).load(("en_US",))
+    files = metrics.snapshot()["files"]
+    assert sorted(os.path.basename(path) for path in files) == ["analysis.json", "common.json"]
+
+
+def test_loader_metrics_lazy_namespaced():
+    metrics = PyI18nMetrics()
+    loaded = PyI18nYamlLoader(namespaced_path, namespaced=True, lazy=True, metrics=metrics).load(("de_DE",))
+    assert metrics.snapshot()["files"] == {}
+    loaded["de_DE"]["common"]
+    assert [os.path.basename(path) for path in metrics.snapshot()["files"]] == ["common.yaml"]
@@ -0,0 +1,97 @@
+# flake8: noqa
+""" tests for module pyi18n/mmapped.py """
+import pytest
+
+from pyi18n import mmapped
+from pyi18n.compiled import build_catalog
+from pyi18n.helpers import flatten
+from tests.helpers import test_path, namespaced_bigger_path, locale_content
+
+
+@pytest.fixture
+def catalogs(tmp_path) -> dict:
+    catalog_path: str = str(tmp_path / "locales.i18nm")
+    mmapped.write_mmap_catalog(catalog_path, test_path, "json")
+    return mmapped.open_mmap_catalog(catalog_path)[1]
+
+
+def test_write_mmap_catalog_header(tmp_path):
+    catalog_path: str = str(tmp_path / "locales.i18nm")
+    header = mmapped.write_mmap_catalog(catalog_path, test_path, "json")
+    assert mmapped.read_mmap_header(catalog_path) == header
+    assert set(header["locales"]) == {"en", "pl"}
+
+
+def test_read_mmap_header_invalid_file():
+    with pytest.raises(ValueError):
+        mmapped.read_mmap_header(f"{test_path}en.json")
+
+
+def test_write_mmap_catalog_section_too_large(tmp_path, monkeypatch):
+    monkeypatch.setattr(mmapped, "MAX_SECTION_SIZE", 64)
+    with pytest.raises(ValueError, match="locale (en|pl): section of"):
+        mmapped.write_mmap_catalog(str(tmp_path / "locales.i18nm"), test_path, "json")
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_mmap_catalog_leaf(catalogs):
+    assert catalogs["pl"]["hello.world"] == "Witaj świecie!"
+    assert catalogs["en"]["common.age"] == "Age"
+
+
+def test_mmap_catalog_subtree(catalogs):
+    assert catalogs["en"]["hello"] == locale_content["en"]["hello"]
+
+
+def test_mmap_catalog_missing(catalogs):
+    with pytest.raises(KeyError):
+        catalogs["en"]["hello.invalid"]
+    with pytest.raises(KeyError):
+        catalogs["en"]["hell"]
+    assert catalogs["en"].get("") is None
+
+
+def test_mmap_catalog_contains(catalogs):
+    assert "hello.world" in catalogs["en"]
+    assert "hello" in catalogs["en"]
+    assert "hell" not in catalogs["en"]
+    assert 1 not in catalogs["en"]
+
+
+def test_mmap_catalog_iter(catalogs):
+    flat: dict = flatten(locale_content["en"])
+    leaves: set = {key for key, value in flat.items() if not isinstance(value, dict)}
+    assert set(catalogs["en"]) == leaves
+    assert len(catalogs["en"]) == len(leaves)
+
+
+def test_mmap_catalog_matches_flat_index(tmp_path):
+    catalog_path: str = str(tmp_path / "locales.i18nm")
+    mmapped.write_mmap_catalog(catalog_path, namespaced_bigger_path, "json")
+    catalogs = mmapped.open_mmap_catalog(catalog_path, cache_size=0)[1]
+    for locale, content in build_catalog(namespaced_bigger_path, "json")[1].items():
+        for path, value in flatten(content).items():
+            assert catalogs[locale][path] == value
+
+
+def test_mmap_catalog_non_str_and_empty_values(tmp_path):
+    source = tmp_path / "locales"
+    source.mkdir()
+    (source / "en.json").write_text('{"en": {"count": 3, "empty": {}, "list": ["a"]}}')
+    catalog_path: str = str(tmp_path / "locales.i18nm")
+    mmapped.write_mmap_catalog(catalog_path, str(source), "json")
+    catalog = mmapped.open_mmap_catalog(catalog_path)[1]["en"]
+    assert catalog["count"] == 3
+    assert catalog["empty"] == {}
+    assert catalog["list"] == ["a"]
+
+
+def test_write_mmap_catalog_concurrent_writers(tmp_path):
+    import os
+    from concurrent.futures import ThreadPoolExecutor
+    catalog_path: str = str(tmp_path / "locales.i18nm")
+    with ThreadPoolExecutor(8) as executor:
+        list(executor.map(
+            lambda _: mmapped.write_mmap_catalog(catalog_path, test_path, "json"), range(32)))
+    assert set(mmapped.read_mmap_header(catalog_path)["locales"]) == {"en", "pl"}
+    assert os.listdir(tmp_path) == ["locales.i18nm"]
@@ -0,0 +1,73 @@
+# flake8: noqa
+""" tests for module pyi18n/parsers.py """
+import pytest
+import yaml
+
+from pyi18n import parsers
+from tests.helpers import namespaced_path, test_path, locale_content
+
+
+def test_available_parsers_yaml():
+    names = parsers.available_parsers("yaml")
+    assert "pyyaml" in names
+    assert names[-1] == "pyyaml"
+
+
+def test_available_parsers_json():
+    names = parsers.available_parsers("json")
+    assert names[-1] == "json"
+
+
+def test_available_parsers_unknown_format():
+    assert parsers.available_parsers("xml") == ()
+
+
+def test_get_parser_auto_detect():
+    parser = parsers.get_parser("yaml")
+    assert parser.name == parsers.available_parsers("yaml")[0]
+    assert parsers.get_parser("yaml") is parser
+
+
+def test_get_parser_pinned():
+    assert parsers.get_parser("yaml", "pyyaml").loader is yaml.FullLoader
+    assert isinstance(parsers.get_parser("json", "json"), parsers.JsonParser)
+
+
+def test_get_parser_unknown_name():
+    with pytest.raises(ValueError):
+        parsers.get_parser("json", "pyyaml")
+
+
+def test_get_parser_unknown_format():
+    with pytest.raises(ValueError):
+        parsers.get_parser("xml")
+
+
+def test_get_parser_not_installed(monkeypatch):
+    monkeypatch.setattr(parsers, "_instances", {})
+    monkeypatch.setattr(parsers.OrjsonParser, "available", classmethod(lambda cls: False))
+    with pytest.raises(ValueError):
+        parsers.get_parser("json", "orjson")
+    assert parsers.get_parser("json").name == "json"
+
+
+@pytest.mark.parametrize("fmt,ext", [("yaml", "yml"), ("json", "json")])
+def test_parse_file_backends_match(fmt, ext):
+    file_path: str = f"{test_path}en.{ext}"
+    results = [parsers.parse_file(file_path, fmt, name)
+               for name in parsers.available_parsers(fmt)]
+    assert all(result == {"en": locale_content["en"]} for result in results)
+
+
+def test_parse_file_corrupted_json():
+    with pytest.raises(parsers.JsonParser.errors):
+        parsers.parse_file(f"{namespaced_path}de_DE/empty.json", "json")
+
+
+@pytest.mark.parametrize("fmt,ext", [("yaml", "yml"), ("json", "json")])
+def test_parser_load_matches_loads(fmt, ext):
+    file_path: str = f"{test_path}en.{ext}"
+    for name in parsers.available_parsers(fmt):
+        parser = parsers.get_parser(fmt, name)
+        with open(file_path, "rb") as _f:
+            assert parser.load(_f) == parsers.parse_file(file_path, fmt, name)
@@ -0,0 +1,80 @@
+# flake8: noqa
+""" tests for module pyi18n/plurals.py """
+from decimal import Decimal
+import pytest
+
+from pyi18n.plurals import (
+    PLURAL_RULES, compile_rules, plural_operands, plural_rule, resolve_rule)
+
+
+@pytest.mark.parametrize("locale, expected", [
+    ("en", {1: "one", 0: "other", 2: "other", 1.5: "other", "1": "one", "1.0": "other"}),
+    ("pl", {1: "one", 2: "few", 5: "many", 12: "many", 22: "few", 101: "many", 1.5: "other"}),
+    ("ru", {1: "one", 21: "one", 11: "many", 3: "few", 111: "many", 0.5: "other"}),
+    ("fr", {0: "one", 1.5: "one", 2: "other", 1000000: "many"}),
+    ("ar", {0: "zero", 1: "one", 2: "two", 3: "few", 11: "many", 100: "other"}),
+    ("cs", {1: "one", 3: "few", 5: "other", 1.5: "many"}),
+    ("lv", {0: "zero", 1: "one", 2: "other", 0.1: "one", 11: "zero"}),
+    ("ja", {1: "other", 2: "other"}),
+])
+def test_plural_rule_categories(locale, expected):
+    rule = plural_rule(locale)
+    assert {count: rule(count) for count in expected} == expected
+
+
+def test_plural_rule_resolution():
+    assert plural_rule("pl_PL") is plural_rule("pl")
+    assert plural_rule("pl-PL") is plural_rule("pl")
+    assert plural_rule("pt_PT")(0) == "other"
+    assert plural_rule("pt_BR")(0) == "one"
+    assert plural_rule("unknown") is plural_rule("en")
+
+
+def test_plural_rule_negative_and_invalid_counts():
+    rule = plural_rule("pl")
+    assert rule(-1) == "one"
+    assert rule(-3) == "few"
+    assert rule(None) == "other"
+    assert rule("many") == "other"
+    assert rule(float("nan")) == "other"
+    assert rule(True) == "one"
+
+
+def test_plural_operands():
+    assert plural_operands(5) == (5, 5, 0, 0, 0, 0, 0, 0)
+    assert plural_operands("1.50") == (Decimal("1.50"), 1, 2, 50, 5, 1, 0, 0)
+    assert plural_operands(1e-05) == (Decimal("0.00001"), 0, 5, 1, 1, 5, 0, 0)
+    assert plural_operands("-12.030")[1:] == (12, 3, 30, 3, 2, 0, 0)
+    with pytest.raises(ValueError):
+        plural_operands("abc")
+    with pytest.raises(ValueError):
+        plural_operands(float("inf"))
+
+
+def test_compile_rules():
+    rule = compile_rules({"one": "n % 10 = 1 and n % 100 != 11",
+                          "few": "n = 2..4, 7"})
+    assert [rule(count) for count in (1, 11, 21, 3, 7, 3.5, 8)] == \
+        ["one", "other", "one", "few", "few", "other", "other"]
+
+
+@pytest.mark.parametrize("rules", [
+    {"one": "x = 1"}, {"one": "n = 1 and"}, {"one": "n = 1 or"}, {"one": "n > 1"},
+    {"one": ""}, {"one": "n %"}, {"single": "n = 1"},
+])
+def test_compile_rules_invalid(rules):
+    with pytest.raises(ValueError):
+        compile_rules(rules)
+
+
+def test_compile_every_known_language():
+    for language in PLURAL_RULES:
+        assert plural_rule(language)(0) in ("zero", "one", "two", "few", "many", "other")
+
+
+def test_resolve_rule():
+    assert resolve_rule("jp") is plural_rule("en")
+    assert resolve_rule("jp", "ja") is plural_rule("ja")
+    assert resolve_rule("pl", {"one": "n = 1"})(1) == "one"
+    custom = lambda count: "other"
+    assert resolve_rule("pl", custom) is custom
@@ -1,10 +1,11 @@
 # flake8: noqa
 import pytest
+from collections.abc import Mapping
 
 from tests.helpers import test_path, locale_content
 
 from pyi18n import PyI18n
-from pyi18n.loaders import PyI18nJsonLoader
+from pyi18n.loaders import PyI18nJsonLoader, PyI18nYamlLoader
 from pytest import raises
 
 
@@ -145,8 +146,11 @@ def test_gettext_should_return_dict() -> None:
     available_locales: tuple = ("en", "pl")
     i18n = PyI18n(available_locales, load_path=test_path)
     translated = i18n.gettext("en", "hello")
-    assert isinstance(translated, dict)
+    assert isinstance(translated, Mapping)
     assert translated == locale_content["en"]["hello"]
+    with raises(TypeError):
+        translated["world"] = "changed"
+    assert i18n.gettext("en", "hello.world") == locale_content["en"]["hello"]["world"]
     assert i18n.get_loader().type == "yaml"
 
 
@@ -300,7 +304,7 @@ def test_gettext_should_return_dict_json_loader() -> None:
     loader = PyI18nJsonLoader(test_path)
     i18n = PyI18n(available_locales, loader=loader)
     translated = i18n.gettext("en", "hello")
-    assert isinstance(translated, dict)
+    assert isinstance(translated, Mapping)
     assert translated == locale_content["en"]["hello"]
     assert i18n.get_loader().type == "json"
 
@@ -333,3 +337,672 @@ def test_gettext_with_invalid_kwargs():
     result = i18n.gettext('en', 'announcement.hello_full_name_age')
     assert isinstance(result, str)
     assert result == "Hello {name} {surname}! You are {age} years old."  # Placeholder should not be replaced
+
+
+def test_flat_index_gettext_with_valid_path():
+    available_locales: tuple = ("en", "pl")
+    i18n = PyI18n(available_locales, load_path=test_path, flat_index=True)
+    translated = [i18n.gettext(locale, "hello.world")
+                  for locale in available_locales]
+    assert translated == ['Hello world!', 'Witaj świecie!']
+    assert i18n._flat_translations["en"]["hello.world"] == 'Hello world!'
+
+
+def test_flat_index_gettext_with_invalid_path():
+    available_locales: tuple = ("en", "pl")
+    i18n = PyI18n(available_locales, load_path=test_path, flat_index=True)
+    assert i18n.gettext("en", "hello.world.invalid") == \
+        "missing translation for: en.hello.world.invalid"
+    assert i18n.gettext("en", "") == "missing translation for: en."
+
+
+def test_flat_index_gettext_should_return_dict():
+    available_locales: tuple = ("en", "pl")
+    i18n = PyI18n(available_locales, load_path=test_path, flat_index=True)
+    translated = i18n.gettext("en", "hello")
+    assert translated == locale_content["en"]["hello"]
+    assert i18n._loaded_translations["en"]["hello"] == translated
+
+
+def test_flat_index_gettext_with_interpolation():
+    available_locales: tuple = ("en", "pl")
+    i18n = PyI18n(available_locales, load_path=test_path, flat_index=True)
+    translated = [i18n.gettext(locale, "hello.hello_user", user="John")
+                  for locale in available_locales]
+    assert translated == ['Hello John!', 'Witaj John!']
+
+
+def test_flat_index_with_non_existing_locale():
+    available_locales: tuple = ("en", "pl", "ru")
+    i18n = PyI18n(available_locales, load_path=test_path, flat_index=True)
+    assert tuple(i18n._flat_translations.keys()) == ("en", "pl")
+    assert i18n.gettext("ru", "hello.world") == \
+        "missing translation for: ru.hello.world"
+
+
+def test_gettext_compiles_template_once():
+    available_locales: tuple = ("en", "pl")
+    i18n = PyI18n(available_locales, load_path=test_path)
+    i18n.gettext("en", "hello.hello_user", user="John")
+    template = i18n._templates["Hello {user}!"]
+    assert i18n.gettext("en", "hello.hello_user", user="Anna") == "Hello Anna!"
+    assert i18n._templates["Hello {user}!"] is template
+    assert template.names == ("user",)
+
+
+def test_for_locale_translate():
+    available_locales: tuple = ("en", "pl")
+    i18n = PyI18n(available_locales, load_path=test_path)
+    translator = i18n.for_locale("pl")
+    assert translator.locale == "pl"
+    assert translator.t("hello.world") == 'Witaj świecie!'
+    assert translator.t("hello.hello_user", user="John") == 'Witaj John!'
+    assert translator.t("hello") == locale_content["pl"]["hello"]
+
+
+def test_for_locale_missing_translation():
+    available_locales: tuple = ("en", "pl")
+    i18n = PyI18n(available_locales, load_path=test_path)
+    assert i18n.for_locale("en").t("hello.invalid") == \
+        "missing translation for: en.hello.invalid"
+
+
+def test_for_locale_with_invalid_locale():
+    available_locales: tuple = ("en", "pl")
+    i18n = PyI18n(available_locales, load_path=test_path)
+    with raises(ValueError):
+        i18n.for_locale("ru")
+
+
+def test_for_locale_non_existing_locale():
+    available_locales: tuple = ("en", "pl", "ru")
+    i18n = PyI18n(available_locales, load_path=test_path)
+    assert i18n.for_locale("ru").t("hello.world") == \
+        "missing translation for: ru.hello.world"
+
+
+def test_for_locale_flat_index():
+    available_locales: tuple = ("en", "pl")
+    i18n = PyI18n(available_locales, load_path=test_path, flat_index=True)
+    translator = i18n.for_locale("en")
+    assert translator.t("hello.world") == 'Hello world!'
+    assert translator.t("hello") == locale_content["en"]["hello"]
+
+
+def test_for_locale_has_slots():
+    available_locales: tuple = ("en", "pl")
+    i18n = PyI18n(available_locales, load_path=test_path)
+    with raises(AttributeError):
+        i18n.for_locale("en").some_attribute = 1
+
+
+def test_available_locales_frozenset():
+    available_locales: list = ["en", "pl"]
+    i18n = PyI18n(available_locales, load_path=test_path)
+    assert i18n._available_locales == frozenset(available_locales)
+    assert i18n.available_locales == available_locales
+
+
+def test_gettext_many():
+    available_locales: tuple = ("en", "pl")
+    i18n = PyI18n(available_locales, load_path=test_path)
+    translated = i18n.gettext_many("pl", ["hello.world", "hello.hello_user", "hello.invalid"], user="John")
+    assert translated == {
+        "hello.world": "Witaj świecie!",
+        "hello.hello_user": "Witaj John!",
+        "hello.invalid": "missing translation for: pl.hello.invalid",
+    }
+
+
+def test_gettext_many_with_key_set():
+    from pyi18n import PyI18nKeySet
+    available_locales: tuple = ("en", "pl")
+    i18n = PyI18n(available_locales, load_path=test_path)
+    keys = PyI18nKeySet(("hello.world", "common.age", "hello", "hello.world"))
+    assert len(keys) == 3
+    for locale in available_locales:
+        translated = i18n.gettext_many(locale, keys)
+        assert translated == {path: i18n.gettext(locale, path) for path in keys.paths}
+
+
+def test_gettext_many_flat_index():
+    available_locales: tuple = ("en", "pl")
+    i18n = PyI18n(available_locales, load_path=test_path, flat_index=True)
+    translated = i18n.gettext_many("en", ("hello.hello_user", "hello.world.invalid", "hello"), user="John")
+    assert translated == {
+        "hello.hello_user": "Hello John!",
+        "hello.world.invalid": "missing translation for: en.hello.world.invalid",
+        "hello": locale_content["en"]["hello"],
+    }
+
+
+def test_gettext_many_with_invalid_locale():
+    available_locales: tuple = ("en", "pl")
+    i18n = PyI18n(available_locales, load_path=test_path)
+    with raises(ValueError):
+        i18n.gettext_many("ru", ["hello.world"])
+
+
+def test_lazy_initialize_does_not_load():
+    available_locales: tuple = ("en", "pl", "ru")
+    i18n = PyI18n(available_locales, load_path=test_path, lazy=True)
+    assert i18n._loaded_translations == {}
+    assert set(i18n._pending.keys()) == {"en", "pl"}
+
+
+def test_lazy_gettext_loads_locale_on_first_use():
+    available_locales: tuple = ("en", "pl")
+    i18n = PyI18n(available_locales, load_path=test_path, lazy=True)
+    assert i18n.gettext("pl", "hello.hello_user", user="John") == 'Witaj John!'
+    assert tuple(i18n._loaded_translations.keys()) == ("pl",)
+    assert "pl" not in i18n._pending
+    assert i18n.gettext("en", "hello.world") == 'Hello world!'
+
+
+def test_lazy_gettext_non_existing_locale():
+    available_locales: tuple = ("en", "ru")
+    i18n = PyI18n(available_locales, load_path=test_path, lazy=True)
+    assert i18n.gettext("ru", "hello.world") == \
+        "missing translation for: ru.hello.world"
+    with raises(ValueError):
+        i18n.gettext("pl", "hello.world")
+
+
+def test_lazy_flat_index():
+    available_locales: tuple = ("en", "pl")
+    loader = PyI18nJsonLoader(test_path)
+    i18n = PyI18n(available_locales, loader=loader, flat_index=True, lazy=True)
+    assert i18n.for_locale("en").t("hello.world") == 'Hello world!'
+    assert tuple(i18n._flat_translations.keys()) == ("en",)
+
+
+def test_lazy_concurrent_first_use_loads_once():
+    from threading import Barrier, Thread
+
+    calls: list = []
+
+    class CountingLoader(PyI18nJsonLoader):
+        def load(self, locales: tuple) -> dict:
+            calls.append(locales)
+            return super().load(locales)
+
+    i18n = PyI18n(("en", "pl"), loader=CountingLoader(test_path), lazy=True)
+    barrier = Barrier(8)
+    results: list = []
+
+    def worker() -> None:
+        barrier.wait()
+        results.append(i18n.gettext("en", "hello.world"))
+
+    threads = [Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == [("en",)]
+    assert results == ['Hello world!'] * 8
+
+
+def test_gettext_lazy_namespaces():
+    from tests.helpers import namespaced_path
+    from pyi18n.loaders import PyI18nYamlLoader
+    loader = PyI18nYamlLoader(namespaced_path, namespaced=True, lazy=True)
+    i18n = PyI18n(("en_US", "de_DE"), loader=loader)
+    assert i18n.gettext("de_DE", "common.greeting") == "Hallo"
+    assert i18n.gettext("de_DE", "invalid.greeting") == \
+        "missing translation for: de_DE.invalid.greeting"
+    assert i18n._loaded_translations["de_DE"].loaded_namespaces == ("common",)
+
+
+def test_gettext_compiled_loader(tmp_path):
+    from pyi18n.compiled import write_catalog
+    from pyi18n.loaders import PyI18nCompiledLoader
+    catalog_path: str = str(tmp_path / "locales.i18nc")
+    write_catalog(catalog_path, test_path, "json")
+    i18n = PyI18n(("en", "pl"), loader=PyI18nCompiledLoader(catalog_path))
+    assert i18n.gettext("pl", "hello.hello_user", user="John") == 'Witaj John!'
+    assert i18n.get_loader().type == "compiled"
+
+
+def test_gettext_mmap_loader(tmp_path):
+    from pyi18n.mmapped import write_mmap_catalog
+    from pyi18n.loaders import PyI18nMmapLoader
+    catalog_path: str = str(tmp_path / "locales.i18nm")
+    write_mmap_catalog(catalog_path, test_path, "json")
+    i18n = PyI18n(("en", "pl", "ru"), loader=PyI18nMmapLoader(catalog_path))
+    assert i18n.flat_index
+    assert i18n.gettext("pl", "hello.hello_user", user="John") == 'Witaj John!'
+    assert i18n.gettext("en", "hello") == locale_content["en"]["hello"]
+    assert i18n.gettext("en", "hello.invalid") == "missing translation for: en.hello.invalid"
+    assert i18n.gettext("ru", "hello.world") == "missing translation for: ru.hello.world"
+    assert i18n.gettext_many("en", ["hello.world", "x"])["x"] == "missing translation for: en.x"
+
+
+def test_gettext_mmap_loader_lazy(tmp_path):
+    from pyi18n.mmapped import write_mmap_catalog
+    from pyi18n.loaders import PyI18nMmapLoader
+    catalog_path: str = str(tmp_path / "locales.i18nm")
+    write_mmap_catalog(catalog_path, test_path, "json")
+    i18n = PyI18n(("en", "pl"), loader=PyI18nMmapLoader(catalog_path), lazy=True)
+    assert i18n.for_locale("en").t("hello.world") == 'Hello world!'
+
+
+def _write_bumped(path, content: str) -> None:
+    from os import stat, utime
+    previous = stat(path).st_mtime_ns if path.exists() else 0
+    path.write_text(content)
+    utime(path, ns=(previous + 10**9, previous + 10**9))
+
+
+def test_reload_changed_locale(tmp_path):
+    from shutil import copytree
+    load_path = tmp_path / "locales"
+    copytree(test_path, load_path)
+    i18n = PyI18n(("en", "pl"), loader=PyI18nYamlLoader(f"{load_path}/"), flat_index=True)
+    translator = i18n.for_locale("en")
+    pl_catalog = i18n._flat_translations["pl"]
+
+    assert i18n.reload() == ()
+    _write_bumped(load_path / "en.yml", "en:\n  hello:\n    world: Hi!\n")
+
+    assert i18n.reload() == ("en",)
+    assert i18n.gettext("en", "hello.world") == "Hi!"
+    assert translator.t("hello.world") == "Hi!"
+    assert i18n._flat_translations["pl"] is pl_catalog
+    assert i18n.reload() == ()
+
+
+def test_reload_keeps_corrupted_locale(tmp_path):
+    from shutil import copytree
+    load_path = tmp_path / "locales"
+    copytree(test_path, load_path)
+    i18n = PyI18n(("en", "pl"), loader=PyI18nYamlLoader(f"{load_path}/"))
+
+    _write_bumped(load_path / "en.yml", "en: [")
+    assert i18n.reload() == ("en",)
+    assert i18n.gettext("en", "hello.world") == "Hello world!"
+
+
+def test_reload_namespaced_changed_only(tmp_path):
+    from shutil import copytree
+    from tests.helpers import namespaced_path
+    load_path = tmp_path / "namespaced"
+    copytree(namespaced_path, load_path)
+    loader = PyI18nYamlLoader(str(load_path), namespaced=True)
+    i18n = PyI18n(("en_US", "de_DE"), loader=loader)
+    analysis = i18n._loaded_translations["de_DE"]["analysis"]
+
+    _write_bumped(load_path / "de_DE" / "common.yaml", 'greeting: "Servus"\n')
+    assert i18n.reload() == ("de_DE",)
+    assert i18n.gettext("de_DE", "common.greeting") == "Servus"
+    assert i18n._loaded_translations["de_DE"]["analysis"] is analysis
+
+    (load_path / "de_DE" / "common.yaml").unlink()
+    assert i18n.reload() == ("de_DE",)
+    assert i18n.gettext("de_DE", "common.greeting") == \
+        "missing translation for: de_DE.common.greeting"
+
+
+def test_reload_skips_pending_lazy_locales(tmp_path):
+    from shutil import copytree
+    load_path = tmp_path / "locales"
+    copytree(test_path, load_path)
+    i18n = PyI18n(("en", "pl"), loader=PyI18nYamlLoader(f"{load_path}/"), lazy=True)
+    assert i18n.gettext("en", "hello.world") == "Hello world!"
+
+    _write_bumped(load_path / "pl.yaml", "pl:\n  hello:\n    world: Czesc!\n")
+    assert i18n.reload() == ()
+    assert i18n.reload(changed_only=False) == ("en",)
+    assert i18n.gettext("pl", "hello.world") == "Czesc!"
+
+
+def test_watch_reloads_in_background(tmp_path):
+    from shutil import copytree
+    from time import sleep
+    load_path = tmp_path / "locales"
+    copytree(test_path, load_path)
+    i18n = PyI18n(("en", "pl"), loader=PyI18nYamlLoader(f"{load_path}/"))
+    watcher = i18n.watch(interval=0.01)
+    try:
+        _write_bumped(load_path / "en.yml", "en:\n  hello:\n    world: Hi!\n")
+        for _ in range(200):
+            if i18n.gettext("en", "hello.world") == "Hi!":
+                break
+            sleep(0.01)
+        assert i18n.gettext("en", "hello.world") == "Hi!"
+    finally:
+        watcher.stop(timeout=1)
+    assert not watcher.is_alive()
+
+
+def test_create_async_matches_sync():
+    import asyncio
+    sync = PyI18n(("en", "pl"), loader=PyI18nYamlLoader(test_path), flat_index=True)
+    i18n = asyncio.run(PyI18n.create_async(
+        ("en", "pl"), loader=PyI18nYamlLoader(test_path), flat_index=True))
+    assert not i18n.lazy
+    assert i18n._pending == {}
+    assert i18n._loaded_translations == sync._loaded_translations
+    assert i18n._flat_translations == sync._flat_translations
+    assert i18n.gettext("pl", "hello.hello_user", user="John") == 'Witaj John!'
+    assert i18n.reload() == ()
+
+
+def test_create_async_lazy():
+    import asyncio
+    i18n = asyncio.run(PyI18n.create_async(
+        ("en", "pl"), loader=PyI18nYamlLoader(test_path), lazy=True))
+    assert i18n._loaded_translations == {}
+    assert i18n.gettext("en", "hello.world") == 'Hello world!'
+
+
+def test_create_async_options(tmp_path):
+    import asyncio
+    i18n = asyncio.run(PyI18n.create_async(
+        ("pl", "jp"), loader=_plural_locales(tmp_path), on_missing="key",
+        miss_cache_size=2, metrics=True, plural_rules={"jp": "ja"}))
+    assert i18n.gettext("pl", "nope") == "nope"
+    assert i18n.miss_cache_size == 2
+    assert i18n.gettext("pl", "apples", count=5) == "5 jabłek"
+    assert i18n.gettext("jp", "apples", count=1) == "1 りんご"
+    assert i18n.stats()["locales"]["pl"]["lookups"] == 2
+
+    with raises(ValueError):
+        asyncio.run(PyI18n.create_async(("pl",), loader=_plural_locales(tmp_path), on_missing="ignore"))
+
+
+def test_frozen_option():
+    from pyi18n.frozen import FrozenCatalog
+    i18n = PyI18n(("en", "pl"), loader=PyI18nYamlLoader(test_path), frozen=True)
+    assert i18n.flat_index
+    assert isinstance(i18n._flat_translations["en"], FrozenCatalog)
+    assert i18n._loaded_translations["en"] is i18n._flat_translations["en"]
+    assert i18n.gettext("pl", "hello.hello_user", user="John") == 'Witaj John!'
+    assert i18n.gettext("en", "hello") == locale_content["en"]["hello"]
+    assert i18n.gettext("en", "hello.invalid") == "missing translation for: en.hello.invalid"
+
+
+def test_freeze_after_load():
+    from pyi18n.frozen import FrozenCatalog
+    i18n = PyI18n(("en", "pl"), loader=PyI18nYamlLoader(test_path), lazy=True)
+    assert i18n.gettext("en", "hello.world") == 'Hello world!'
+    translator = i18n.for_locale("en")
+    i18n.freeze()
+    assert isinstance(i18n._loaded_translations["en"], FrozenCatalog)
+    assert translator.t("hello.world") == 'Hello world!'
+    assert isinstance(translator._catalog, FrozenCatalog)
+    assert i18n.gettext("pl", "hello.world") == locale_content["pl"]["hello"]["world"]
+    assert isinstance(i18n._flat_translations["pl"], FrozenCatalog)
+    assert i18n.gettext_many("pl", ["hello.world"]) == {"hello.world": locale_content["pl"]["hello"]["world"]}
+
+
+def test_frozen_reload(tmp_path):
+    from shutil import copytree
+    from pyi18n.frozen import FrozenCatalog
+    from tests.helpers import namespaced_path
+    load_path = tmp_path / "namespaced"
+    copytree(namespaced_path, load_path)
+    loader = PyI18nYamlLoader(str(load_path), namespaced=True)
+    i18n = PyI18n(("en_US", "de_DE"), loader=loader, frozen=True)
+
+    _write_bumped(load_path / "de_DE" / "common.yaml", 'greeting: "Servus"\n')
+    assert i18n.reload() == ("de_DE",)
+    assert i18n.gettext("de_DE", "common.greeting") == "Servus"
+    assert i18n.gettext("de_DE", "analysis.title") == "Analyse"
+    assert isinstance(i18n._loaded_translations["de_DE"], FrozenCatalog)
+
+
+def _fallback_locales(tmp_path):
+    (tmp_path / "en.yml").write_text(
+        "en:\n  hello: {world: Hello world!, user: 'Hello {user}!'}\n  bye: Bye\n  only_en: English\n")
+    (tmp_path / "pt.yml").write_text("pt:\n  hello: {world: Olá mundo!}\n  bye: Tchau\n")
+    (tmp_path / "pt_BR.yml").write_text("pt_BR:\n  bye: Falou\n")
+    return PyI18nYamlLoader(f"{tmp_path}/")
+
+
+@pytest.mark.parametrize("options", [{}, {"lazy": True}, {"frozen": True}, {"lazy": True, "frozen": True}])
+def test_fallbacks(tmp_path, options):
+    i18n = PyI18n(("en", "pt", "pt_BR", "de"), loader=_fallback_locales(tmp_path),
+                  fallbacks={"pt_BR": "pt", "pt": ("en",), "de": "en"}, **options)
+    assert i18n.flat_index
+    assert i18n.gettext("pt_BR", "bye") == "Falou"
+    assert i18n.gettext("pt_BR", "hello.world") == "Olá mundo!"
+    assert i18n.gettext("pt_BR", "hello.user", user="Ana") == "Hello Ana!"
+    assert i18n.gettext("pt_BR", "hello") == {"world": "Olá mundo!", "user": "Hello {user}!"}
+    assert i18n.gettext("pt_BR", "only_en") == "English"
+    assert i18n.gettext("de", "bye") == "Bye"
+    assert i18n.gettext("en", "hello.world") == "Hello world!"
+    assert i18n.gettext("pt_BR", "invalid") == "missing translation for: pt_BR.invalid"
+
+
+def test_fallback_chain_order(tmp_path):
+    i18n = PyI18n(("en", "pt", "pt_BR", "es"), loader=_fallback_locales(tmp_path),
+                  fallbacks={"pt_BR": ("pt", "en"), "pt": "es", "es": "pt_BR"})
+    assert i18n._chains["pt_BR"] == ("pt_BR", "pt", "es", "en")
+    assert i18n._chains["en"] == ("en",)
+
+
+def test_fallbacks_not_available(tmp_path):
+    with raises(ValueError):
+        PyI18n(("en", "pt_BR"), loader=_fallback_locales(tmp_path), fallbacks={"pt_BR": "pt"})
+
+
+def test_fallbacks_reload(tmp_path):
+    loader = _fallback_locales(tmp_path)
+    i18n = PyI18n(("en", "pt", "pt_BR"), loader=loader, fallbacks={"pt_BR": "pt", "pt": "en"})
+    en_catalog = i18n._flat_translations["en"]
+
+    _write_bumped(tmp_path / "pt.yml", "pt:\n  hello: {world: Oi mundo!}\n")
+    assert i18n.reload() == ("pt",)
+    assert i18n.gettext("pt_BR", "hello.world") == "Oi mundo!"
+    assert i18n.gettext("pt_BR", "bye") == "Falou"
+    assert i18n.gettext("pt", "bye") == "Bye"
+    assert i18n._flat_translations["en"] is en_catalog
+
+
+def test_fallbacks_mmap_loader(tmp_path):
+    from pyi18n.mmapped import write_mmap_catalog
+    from pyi18n.loaders import PyI18nMmapLoader
+    _fallback_locales(tmp_path / "")
+    catalog_path: str = str(tmp_path / "locales.i18nm")
+    write_mmap_catalog(catalog_path, str(tmp_path), "yaml")
+    i18n = PyI18n(("en", "pt", "pt_BR"), loader=PyI18nMmapLoader(catalog_path),
+                  fallbacks={"pt_BR": "pt", "pt": "en"})
+    assert i18n.gettext("pt_BR", "bye") == "Falou"
+    assert i18n.gettext("pt_BR", "only_en") == "English"
+
+
+@pytest.mark.parametrize("flat_index", [False, True])
+def test_missing_cached_and_counted(flat_index):
+    i18n = PyI18n(("en", "pl"), loader=PyI18nYamlLoader(test_path), flat_index=flat_index)
+    first = i18n.gettext("en", "hello.invalid")
+    assert first == "missing translation for: en.hello.invalid"
+    assert i18n.gettext("en", "hello.invalid") is first
+    assert i18n.for_locale("en").t("hello.invalid") is first
+    assert i18n.gettext_many("en", ["hello.invalid", "hello.world"])["hello.invalid"] is first
+    assert i18n.gettext("pl", "hello.world.deeper") == "missing translation for: pl.hello.world.deeper"
+    assert i18n.missing_translations() == {("en", "hello.invalid"): 4, ("pl", "hello.world.deeper"): 1}
+
+
+def test_missing_policy_key():
+    i18n = PyI18n(("en", "pl"), loader=PyI18nYamlLoader(test_path), on_missing="key")
+    assert i18n.gettext("en", "hello.invalid") == "hello.invalid"
+    assert i18n.gettext("en", "hello.world") == "Hello world!"
+
+
+def test_missing_policy_raise():
+    i18n = PyI18n(("en", "pl"), loader=PyI18nYamlLoader(test_path), on_missing="raise")
+    for _ in range(2):
+        with raises(KeyError, match="missing translation for: en.hello.invalid"):
+            i18n.gettext("en", "hello.invalid")
+    assert i18n.missing_translations() == {("en", "hello.invalid"): 2}
+
+
+def test_missing_policy_callable():
+    calls: list = []
+
+    def on_missing(locale: str, path: str) -> str:
+        calls.append((locale, path))
+        return f"[{path}]"
+
+    i18n = PyI18n(("en", "pl"), loader=PyI18nYamlLoader(test_path), on_missing=on_missing)
+    assert i18n.gettext("pl", "hello.invalid") == "[hello.invalid]"
+    assert i18n.gettext("pl", "hello.invalid") == "[hello.invalid]"
+    assert calls == [("pl", "hello.invalid")]
+
+
+def test_missing_policy_unknown():
+    with raises(ValueError):
+        PyI18n(("en", "pl"), loader=PyI18nYamlLoader(test_path), on_missing="ignore")
+
+
+def test_missing_cache_size():
+    i18n = PyI18n(("en", "pl"), loader=PyI18nYamlLoader(test_path), miss_cache_size=2)
+    for path in ("a", "a", "b", "c"):
+        i18n.gettext("en", path)
+    assert list(i18n._misses) == [("en", "a"), ("en", "c")]
+    assert i18n.gettext("en", "a") == "missing translation for: en.a"
+    assert i18n.missing_translations() == {("en", "a"): 3, ("en", "c"): 1}
+
+
+@pytest.mark.parametrize("on_missing", ["message", "key", lambda locale, path: f"[{path}] {{user}}"])
+def test_missing_results_not_cached_as_templates(on_missing):
+    i18n = PyI18n(("en", "pl"), loader=PyI18nYamlLoader(test_path), on_missing=on_missing)
+    assert i18n.gettext("en", "hello.hello_user", user="John") == "Hello John!"
+    for index in range(100):
+        i18n.gettext("en", f"missing.{index}", user="John")
+        i18n.gettext_many("en", [f"other.{index}"], user="John")
+    assert list(i18n._templates) == ["Hello {user}!"]
+    if callable(on_missing):
+        assert i18n.gettext("en", "nope", user="John") == "[nope] John"
+
+
+def test_missing_counts_bounded():
+    i18n = PyI18n(("en", "pl"), loader=PyI18nYamlLoader(test_path), miss_cache_size=10)
+    for _ in range(3):
+        i18n.gettext("en", "frequent")
+    for index in range(1000):
+        i18n.gettext("en", f"rare.{index}")
+    counts = i18n.missing_translations()
+    assert len(counts) <= 10
+    assert counts[("en", "frequent")] == 3
+    assert next(iter(counts)) == ("en", "frequent")
+
+
+def test_missing_cache_cleared_on_reload(tmp_path):
+    from shutil import copytree
+    load_path = tmp_path / "locales"
+    copytree(test_path, load_path)
+    i18n = PyI18n(("en", "pl"), loader=PyI18nYamlLoader(f"{load_path}/"))
+    assert i18n.gettext("en", "hello.new") == "missing translation for: en.hello.new"
+
+    _write_bumped(load_path / "en.yml", "en:\n  hello:\n    new: New!\n")
+    i18n.reload()
+    assert i18n.gettext("en", "hello.new") == "New!"
+    assert i18n.missing_translations() == {("en", "hello.new"): 1}
+
+
+def _plural_locales(tmp_path):
+    (tmp_path / "pl.yml").write_text(
+        "pl:\n  apples:\n    one: '{count} jabłko'\n    few: '{count} jabłka'\n"
+        "    many: '{count} jabłek'\n    other: '{count} jabłka'\n"
+        "  cats: {other: '{count} kotów'}\n  hello: 'Cześć {count}'\n")
+    (tmp_path / "jp.yml").write_text("jp:\n  apples: {one: 'one', other: '{count} りんご'}\n")
+    return PyI18nYamlLoader(f"{tmp_path}/")
+
+
+@pytest.mark.parametrize("options", [{}, {"flat_index": True}, {"frozen": True}])
+def test_plurals(tmp_path, options):
+    i18n = PyI18n(("pl", "jp"), loader=_plural_locales(tmp_path),
+                  plural_rules={"jp": "ja"}, **options)
+    forms = [i18n.gettext("pl", "apples", count=count) for count in (1, 3, 5, 22, 1.5)]
+    assert forms == ["1 jabłko", "3 jabłka", "5 jabłek", "22 jabłka", "1.5 jabłka"]
+    assert i18n.gettext("pl", "cats", count=1) == "1 kotów"
+    assert i18n.gettext("pl", "hello", count=2) == "Cześć 2"
+    assert i18n.gettext("pl", "apples.one", count=2) == "2 jabłko"
+    assert i18n.gettext("pl", "apples")["few"] == "{count} jabłka"
+    assert i18n.gettext("pl", "missing", count=2) == "missing translation for: pl.missing"
+    assert i18n.gettext("jp", "apples", count=1) == "1 りんご"
+    assert i18n.for_locale("pl").t("apples", count=2) == "2 jabłka"
+    assert i18n.gettext_many("pl", ["apples", "hello"], count=12) == {
+        "apples": "12 jabłek", "hello": "Cześć 12"}
+
+
+def test_plural_rules_option(tmp_path):
+    i18n = PyI18n(("pl", "jp"), loader=_plural_locales(tmp_path), plural_rules={
+        "pl": lambda count: "few", "jp": {"one": "n = 1"}})
+    assert i18n.gettext("pl", "apples", count=1) == "1 jabłka"
+    assert i18n.gettext("jp", "apples", count=1) == "one"
+
+    with raises(ValueError):
+        PyI18n(("pl", "jp"), loader=_plural_locales(tmp_path),
+               plural_rules={"pl": {"one": "n == 1"}})
+
+
+def test_memory_report():
+    i18n = PyI18n(("en", "pl"), loader=PyI18nYamlLoader(test_path))
+    report = i18n.memory_report(measure_parse=True)
+    assert set(report["locales"]) == {"en", "pl"}
+    assert report["locales"]["en"]["keys"] == 14
+    assert report["locales"]["en"]["depth"] == 2
+    assert report["locales"]["en"]["index_memory"] == 0
+    assert report["locales"]["en"]["parse_seconds"]
+    assert report["total"]["memory"] == sum(locale["memory"] for locale in report["locales"].values())
+
+
+@pytest.mark.parametrize("options", [{}, {"frozen": True}, {"flat_index": True}])
+def test_memory_report_namespaced(options):
+    from tests.helpers import namespaced_json
+    i18n = PyI18n(("de_DE", "en_US"), loader=PyI18nJsonLoader(namespaced_json, namespaced=True), **options)
+    report = i18n.memory_report()
+    de_de = report["locales"]["de_DE"]
+    assert set(de_de["namespaces"]) == {"analysis", "common"}
+    assert de_de["keys"] == 6
+    assert de_de["parse_seconds"] == {}
+    assert de_de["files"] == 2
+    # frozen catalogs are lookup index themselves
+    assert (de_de["index_memory"] > 0) == ("flat_index" in options)
+
+
+def test_memory_report_lazy():
+    i18n = PyI18n(("en", "pl"), loader=PyI18nYamlLoader(test_path), lazy=True)
+    assert i18n.memory_report()["locales"] == {}
+    i18n.gettext("pl", "hello.world")
+    assert set(i18n.memory_report()["locales"]) == {"pl"}
+
+
+@pytest.mark.parametrize("options", [{}, {"flat_index": True}, {"frozen": True}, {"lazy": True}])
+def test_subtree(options):
+    i18n = PyI18n(("en", "pl"), loader=PyI18nYamlLoader(test_path), **options)
+    subtree = i18n.subtree("en", "hello")
+    assert subtree == locale_content["en"]["hello"]
+    assert list(subtree) == sorted(locale_content["en"]["hello"])
+    assert subtree.to_dict() == locale_content["en"]["hello"]
+    assert i18n.subtree("en")["hello"]["world"] == "Hello world!"
+    assert i18n.subtree("en", "hello.world") == "Hello world!"
+    assert i18n.subtree("en", "hello.nope") == "missing translation for: en.hello.nope"
+    assert i18n.gettext_many("en", ("hello",))["hello"] == locale_content["en"]["hello"]
+    with raises(ValueError):
+        i18n.subtree("de", "hello")
+
+
+@pytest.mark.parametrize("options", [{}, {"flat_index": True}, {"frozen": True}])
+def test_keys_with_prefix(options):
+    i18n = PyI18n(("en", "pl"), loader=PyI18nYamlLoader(test_path), **options)
+    assert i18n.keys_with_prefix("pl", "hello.") == tuple(
+        f"hello.{key}" for key in sorted(locale_content["pl"]["hello"]))
+    assert i18n.keys_with_prefix("pl", "hello.hello_") == (
+        "hello.hello_full_name_age", "hello.hello_user")
+    assert i18n.keys_with_prefix("pl", "nope") == ()
+    assert len(i18n.keys_with_prefix("pl", "")) == 14
+
+
+def test_subtree_after_reload(tmp_path):
+    (tmp_path / "en.yml").write_text("en:\n  errors:\n    empty: Empty\n")
+    i18n = PyI18n(("en",), loader=PyI18nYamlLoader(f"{tmp_path}/"))
+    assert i18n.subtree("en", "errors") == {"empty": "Empty"}
+
+    (tmp_path / "en.yml").write_text("en:\n  errors:\n    empty: Empty\n    long: Too long\n")
+    i18n.reload(changed_only=False)
+    assert i18n.keys_with_prefix("en", "errors.") == ("errors.empty", "errors.long")
@@ -4,6 +4,7 @@ from pytest import raises
 from .helpers import test_path, capture, empty_locales
 from pyi18n.pyi18n_tasks import cli
 from pyi18n.tasks import normalize
+from pyi18n.tasks import compile as compile_task
 from argparse import Namespace
 from unittest.mock import patch, MagicMock
 import logging
@@ -52,22 +53,22 @@ def test_cli_no_params() -> None:
 
 
 def test_cli_no_args(capsys):
-    with raises(SystemExit):
+    with patch('sys.argv', ['pyi18n-tasks']), raises(SystemExit):
         cli()
     captured = capsys.readouterr()
-    assert 'error: the following arguments are required: normalize\n' in captured.err
+    assert 'error: the following arguments are required: task\n' in captured.err
 
 
 def test_cli_with_args():
-    args = Namespace(normalize=True, path="test_path")
+    args = Namespace(task="normalize", path="test_path", output=None, check=False, jobs=None)
     with patch('argparse.ArgumentParser.parse_args', return_value=args), \
          patch.object(normalize, 'normalize_locales', MagicMock()) as mock_method:
         cli()
-    mock_method.assert_called_once_with("test_path")
+    mock_method.assert_called_once_with("test_path", False, None)
 
 
 def test_cli_without_normalize_flag():
-    args = Namespace(normalize=False, path="test_path")
+    args = Namespace(task=None, path="test_path", output=None)
     with patch('argparse.ArgumentParser.parse_args', return_value=args), \
          patch.object(normalize, 'normalize_locales', MagicMock()) as mock_method:
         cli()
@@ -75,8 +76,42 @@ def test_cli_without_normalize_flag():
 
 
 def test_cli_with_default_path():
-    args = Namespace(normalize=True, path="locales")
+    args = Namespace(task="normalize", path="locales", output=None, check=True, jobs=2)
     with patch('argparse.ArgumentParser.parse_args', return_value=args), \
          patch.object(normalize, 'normalize_locales', MagicMock()) as mock_method:
         cli()
-    mock_method.assert_called_once_with("locales")
+    mock_method.assert_called_once_with("locales", True, 2)
+
+
+def test_cli_invalid_task(capsys):
+    with patch('sys.argv', ['pyi18n-tasks', 'invalid']), raises(SystemExit):
+        cli()
+    assert "invalid choice: 'invalid'" in capsys.readouterr().err
+
+
+def test_cli_compile():
+    args = Namespace(task="compile", path="test_path", output="out.i18nm", format="mmap", source_format="yaml")
+    with patch('argparse.ArgumentParser.parse_args', return_value=args), \
+         patch.object(normalize, 'normalize_locales', MagicMock()) as normalize_mock, \
+         patch.object(compile_task, 'compile_locales', MagicMock()) as mock_method:
+        cli()
+    mock_method.assert_called_once_with("test_path", "out.i18nm", "mmap", "yaml")
+    normalize_mock.assert_not_called()
+
+
+def test_cli_stats():
+    from pyi18n.tasks import stats
+    args = Namespace(task="stats", path="test_path", output=None, json=True)
+    with patch('argparse.ArgumentParser.parse_args', return_value=args), \
+         patch.object(stats, 'locale_stats', MagicMock()) as mock_method:
+        cli()
+    mock_method.assert_called_once_with("test_path", None, True)
+
+
+def test_cli_check():
+    from pyi18n.tasks import check
+    args = Namespace(task="check", path="test_path", output="report.json", reference="pl", jobs=2)
+    with patch('argparse.ArgumentParser.parse_args', return_value=args), \
+         patch.object(check, 'check_locales', MagicMock()) as mock_method:
+        cli()
+    mock_method.assert_called_once_with("test_path", "pl", "report.json", 2)
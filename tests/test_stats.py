@@ -0,0 +1,62 @@
+# flake8: noqa
+""" tests for module pyi18n/stats.py """
+from sys import getsizeof
+
+from pyi18n import stats
+from pyi18n.frozen import freeze_catalog
+from pyi18n.parsers import available_parsers
+from tests.helpers import test_path, locale_content
+
+content: dict = {"a": {"b": {"c": "C"}, "d": "D"}, "e": ["x", "y"], "f": 1}
+
+
+def test_deep_sizeof_counts_shared_objects_once():
+    value = "shared " * 10
+    shared = {"a": value, "b": value}
+    assert stats.deep_sizeof(shared) == getsizeof(shared) + getsizeof("a") \
+        + getsizeof("b") + getsizeof(value)
+
+    seen: set = set()
+    first = stats.deep_sizeof(content, seen)
+    assert first > getsizeof(content)
+    assert stats.deep_sizeof(content, seen) == 0
+
+
+def test_deep_sizeof_frozen_catalog():
+    catalog = freeze_catalog(content)
+    assert stats.deep_sizeof(catalog) > getsizeof(catalog) + getsizeof("C")
+
+
+def test_count_keys():
+    assert stats.count_keys(content) == (4, 3)
+    assert stats.count_keys(freeze_catalog(content)) == (4, 3)
+    assert stats.count_keys({}) == (0, 0)
+    assert stats.count_keys({"a.b.c": "C", "d": "D"}, flat=True) == (2, 3)
+
+
+def test_parse_times():
+    times = stats.parse_times(f"{test_path}en.yml", "yaml")
+    assert set(times) == set(available_parsers("yaml"))
+    assert all(seconds > 0 for seconds in times.values())
+    assert stats.parse_times(f"{test_path}en.yml", "xml") == {}
+
+
+def test_section_and_sum_stats():
+    section = stats.section_stats(locale_content["en"], (f"{test_path}en.json",), "json")
+    assert section["files"] == 1
+    assert section["keys"] == 14
+    assert section["depth"] == 2
+    assert set(section["parse_seconds"]) == set(available_parsers("json"))
+    total = stats.sum_stats((section, section))
+    assert total["keys"] == 28
+    assert total["depth"] == 3
+    assert total["size"] == 2 * section["size"]
+
+
+def test_format_table():
+    report = {"locales": {"en": {
+        **stats.section_stats(content), "namespaces": {"common": stats.section_stats(content)}}}}
+    lines = stats.format_table(report).splitlines()
+    assert lines[0].split() == ["locale", "files", "size", "keys", "depth", "memory"]
+    assert lines[1].split()[:5] == ["en", "0", "0", "4", "3"]
+    assert lines[2].split()[0] == "en/common"
@@ -0,0 +1,65 @@
+# flake8: noqa
+""" tests for module pyi18n/views.py """
+import pytest
+
+from pyi18n.frozen import freeze_catalog
+from pyi18n.helpers import flatten
+from pyi18n.views import PrefixIndex, SubtreeView, TranslationView
+
+content: dict = {
+    "errors": {
+        "validation": {"email": "Bad email", "empty": "Empty"},
+        "validation-old": {"email": "Old email"},
+        "server": "Server error",
+    },
+    "labels": {"list": ["a", "b"]},
+    "top": "Top",
+}
+
+
+def test_translation_view_read_only():
+    view = TranslationView(content["errors"])
+    assert view == content["errors"]
+    assert isinstance(view["validation"], TranslationView)
+    assert view["validation"]["email"] == "Bad email"
+    assert list(view) == list(content["errors"])
+    assert len(view) == 3 and "server" in view
+    with pytest.raises(TypeError):
+        view["server"] = "changed"
+    assert view.to_dict() == content["errors"]
+    assert view.to_dict()["validation"] is not content["errors"]["validation"]
+
+
+@pytest.mark.parametrize("catalog, flat", [
+    (content, False), (freeze_catalog(content), False),
+    (flatten(content), True), (freeze_catalog(content), True),
+])
+def test_prefix_index(catalog, flat):
+    index = PrefixIndex(catalog, flat)
+    assert len(index) == 6
+    assert index.keys_with_prefix("errors.validation.") == (
+        "errors.validation.email", "errors.validation.empty")
+    assert index.keys_with_prefix("errors.validation") == (
+        "errors.validation-old.email", "errors.validation.email",
+        "errors.validation.empty")
+    assert index.keys_with_prefix("missing") == ()
+    assert index.find("top") == "Top"
+    assert index.find("labels.list") == ["a", "b"]
+    with pytest.raises(KeyError):
+        index.find("errors.nope")
+
+
+def test_subtree_view():
+    index = PrefixIndex(content)
+    errors = index.find("errors")
+    assert isinstance(errors, SubtreeView)
+    assert list(errors) == list(content["errors"])
+    assert len(errors) == 3
+    assert "validation" in errors and "validation.email" in errors
+    assert "nope" not in errors and 1 not in errors
+    assert errors["validation"] == content["errors"]["validation"]
+    assert errors.to_dict() == content["errors"]
+    assert index.find("").to_dict() == content
+    assert list(index.find("")) == list(content)
+    with pytest.raises(TypeError):
+        errors["server"] = "changed"